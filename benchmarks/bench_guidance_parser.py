@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Guidance Parser Microbenchmark
+===============================
+
+Measures throughput on distinct Director guidance strings (every string
+parsed once, as for a stream of new decks) against the baseline regex
+parser, and on repeated strings (memoized path).
+
+Targets: the uncached tokenizer at least as fast as the regex parser;
+>1M strings/second on the memoized path (cache hits only).
+
+Run with: python benchmarks/bench_guidance_parser.py
+"""
+
+import sys
+import os
+import re
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.guidance_parser import parse_guidance, tokenize_guidance
+
+GUIDANCE_SAMPLES = [
+    "Goal: Show revenue trend over time, Content: Q1-Q4 2024 revenue data, Style: Line chart",
+    "Goal: Compare regions, Content: EMEA, APAC and NA sales, Style: Grouped bar chart",
+    "Goal: Executive team photo\nContent: Leadership, board\nStyle: Professional",
+    "Goal: Show process flow; Content: Sales workflow; Style: Flowchart; Audience: Sales ops",
+    "Goal: Market share split, Content: Us 23.5%, Competitor A 19.2%, Style: Pie chart",
+]
+
+# Baseline parser (before the tokenizer), for reference
+_BASELINE_PATTERN = re.compile(
+    r'(Goal|Content|Style):\s*([^,]+?)(?=(?:,\s*(?:Goal|Content|Style):|$))',
+    re.IGNORECASE
+)
+
+
+def baseline_parse(guidance_text):
+    result = {"goal": "", "content": "", "style": ""}
+    for key, value in _BASELINE_PATTERN.findall(guidance_text):
+        result[key.lower()] = value.strip()
+    return result
+
+
+def distinct_strings(count):
+    """Unique variations of the samples (no two strings alike)."""
+    return [
+        GUIDANCE_SAMPLES[i % len(GUIDANCE_SAMPLES)].replace("Content: ", f"Content: batch {i} ", 1)
+        for i in range(count)
+    ]
+
+
+def bench(label: str, fn, strings, iterations: int) -> float:
+    """Run fn over strings and print throughput."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for text in strings:
+            fn(text)
+    elapsed = time.perf_counter() - start
+    rate = iterations * len(strings) / elapsed
+    print(f"{label:<40} {rate:>14,.0f} strings/s")
+    return rate
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("GUIDANCE PARSER MICROBENCHMARK")
+    print("=" * 70)
+
+    unique = distinct_strings(200_000)
+
+    baseline_rate = bench("baseline regex (distinct strings)", baseline_parse, unique, 1)
+    # Cold path: bypass the memo cache to measure the tokenizer itself
+    cold_rate = bench("tokenize_guidance (distinct, uncached)", tokenize_guidance.__wrapped__, unique, 1)
+
+    tokenize_guidance.cache_clear()
+    bench("parse_guidance (distinct, through cache)", parse_guidance, unique, 1)
+    print(f"Memo cache: {tokenize_guidance.cache_info()}")
+
+    tokenize_guidance.cache_clear()
+    hot_rate = bench("parse_guidance (repeated, memoized)", parse_guidance, GUIDANCE_SAMPLES, 200_000)
+    print(f"Memo cache: {tokenize_guidance.cache_info()}")
+
+    print(f"\nCold tokenizer vs baseline regex: {cold_rate / baseline_rate:.2f}x")
+    print(f"Target cold >= baseline: {'✅ met' if cold_rate >= baseline_rate else '❌ missed'}")
+    print(f"Target memoized >1,000,000 strings/s: {'✅ met' if hot_rate > 1_000_000 else '❌ missed'}")
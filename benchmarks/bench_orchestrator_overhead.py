@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+Orchestrator Overhead Benchmark
+================================
+
+Measures orchestrator overhead (everything except the API calls) for
+decks of up to 5,000 slides, with zero-latency mock clients.
+
+- legacy: next() slide/layout lookups per result, mapping for
+  validation, mapping again in stitch_batch, report in three passes
+- fused: _validate_and_stitch (one map per slide, incremental report)
+- enrich: full enrich_presentation with zero-delay mocks
+
+Per-slide times should stay flat as the deck grows for fused/enrich;
+legacy grows with the deck size (O(n²) lookups).
+
+Run with: python benchmarks/bench_orchestrator_overhead.py
+"""
+
+import asyncio
+import gc
+import logging
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.orchestrator import ContentOrchestratorV2
+from clients.mock_text_client import MockTextClient
+from clients.mock_chart_client import MockChartClient
+from clients.mock_image_client import MockImageClient
+from clients.mock_diagram_client import MockDiagramClient
+from models.layout_models import ValidationReport
+from test_v2 import create_test_presentation
+
+DECK_SIZES = (100, 500, 1000, 2000, 5000)
+
+
+def legacy_validate_and_stitch(orchestrator, strawman, layout_assignments, api_results):
+    """The previous three-step pipeline, for comparison."""
+    all_content = {}
+    for slide_id, results in api_results.items():
+        slide = next((s for s in strawman.slides if s.slide_id == slide_id), None)
+        layout = next((la for la in layout_assignments if la.slide_id == slide_id), None)
+        if slide and layout:
+            all_content[slide_id] = orchestrator.result_stitcher._map_to_layout(
+                slide=slide, api_results=results, layout_id=layout.layout_id
+            )
+
+    validation_results = orchestrator.sla_validator.validate_batch(
+        all_content=all_content, layout_assignments=layout_assignments
+    )
+    enriched_slides = orchestrator.result_stitcher.stitch_batch(
+        slides=strawman.slides,
+        layout_assignments=layout_assignments,
+        all_api_results=api_results,
+        all_validation_statuses=validation_results
+    )
+
+    critical = sum(
+        len([v for v in s.validation_status.violations if v.severity == "critical"])
+        for s in enriched_slides
+    )
+    report = ValidationReport(
+        overall_compliant=(critical == 0),
+        total_slides=len(enriched_slides),
+        compliant_slides=sum(1 for s in enriched_slides if s.validation_status.compliant),
+        total_violations=sum(len(s.validation_status.violations) for s in enriched_slides),
+        critical_violations=critical
+    )
+    return enriched_slides, report
+
+
+def timed(fn, *args):
+    gc.collect()
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+async def run_deck(num_slides):
+    orchestrator = ContentOrchestratorV2(
+        MockTextClient(0), MockChartClient(0), MockImageClient(0), MockDiagramClient(0)
+    )
+    strawman = create_test_presentation(num_slides)
+    layout_assignments = orchestrator._create_default_layout_assignments(strawman)
+
+    all_requests = orchestrator._build_all_requests(strawman, layout_assignments)
+    api_results = await orchestrator.api_dispatcher.dispatch_all(all_requests)
+
+    (legacy_slides, legacy_report), legacy_time = timed(
+        legacy_validate_and_stitch, orchestrator, strawman, layout_assignments, api_results
+    )
+    (fused_slides, fused_report), fused_time = timed(
+        orchestrator._validate_and_stitch, strawman, layout_assignments, api_results
+    )
+    assert fused_report == legacy_report
+    assert [s.generated_content for s in fused_slides] == [s.generated_content for s in legacy_slides]
+
+    gc.collect()
+    start = time.perf_counter()
+    await orchestrator.enrich_presentation(strawman, layout_assignments)
+    enrich_time = time.perf_counter() - start
+
+    per_slide = lambda seconds: seconds / num_slides * 1e6
+    print(
+        f"{num_slides:>6} slides   legacy {per_slide(legacy_time):>8.1f} µs/slide   "
+        f"fused {per_slide(fused_time):>7.1f} µs/slide   "
+        f"enrich {per_slide(enrich_time):>7.1f} µs/slide"
+    )
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+
+    print("=" * 78)
+    print("ORCHESTRATOR OVERHEAD (zero-latency mocks)")
+    print("=" * 78)
+    for size in DECK_SIZES:
+        asyncio.run(run_deck(size))
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Request Compiler Benchmark
+===========================
+
+Compares per-request context/constraints dicts (the previous builder
+behaviour) against deck-level compilation with shared context objects
+for a 500-slide deck: build time and memory retained by the requests.
+
+Run with: python benchmarks/bench_request_compiler.py
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.orchestrator import ContentOrchestratorV2
+from services.request_builder import RequestBuilder
+from services.request_compiler import RequestCompiler
+from test_v2 import create_test_presentation
+
+NUM_SLIDES = 500
+
+
+def build_unshared(strawman, layout_assignments):
+    """Baseline: every request owns its context and constraints dicts."""
+    builder = RequestBuilder()
+    presentation_context = {
+        "overall_theme": strawman.overall_theme,
+        "target_audience": strawman.target_audience,
+        "main_title": strawman.main_title
+    }
+    all_requests = {"text": [], "chart": [], "image": [], "diagram": []}
+    for slide, layout_assignment in zip(strawman.slides, layout_assignments):
+        for api_type, requests in builder.build_all_requests(
+            slide, layout_assignment, presentation_context
+        ).items():
+            for request in requests:
+                request["context"] = dict(request["context"])
+                if "constraints" in request:
+                    request["constraints"] = dict(request["constraints"])
+                all_requests[api_type].append(request)
+    return all_requests
+
+
+def build_deck(strawman, layout_assignments):
+    """Deck-level compilation with shared contexts and fingerprints."""
+    compiler = RequestCompiler(RequestBuilder())
+    return list(compiler.compile(strawman, layout_assignments))
+
+
+def measure(label, fn, strawman, layout_assignments):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(strawman, layout_assignments)
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<34} {elapsed * 1000:>8.1f} ms   {retained / 1024:>8.0f} KiB retained")
+    return result
+
+
+if __name__ == "__main__":
+    strawman = create_test_presentation(NUM_SLIDES)
+    orchestrator = ContentOrchestratorV2(None, None, None, None)
+    layout_assignments = orchestrator._create_default_layout_assignments(strawman)
+
+    print("=" * 70)
+    print(f"REQUEST COMPILATION - {NUM_SLIDES} SLIDES")
+    print("=" * 70)
+    measure("unshared per-request dicts", build_unshared, strawman, layout_assignments)
+    measure("deck compile (+ fingerprints)", build_deck, strawman, layout_assignments)
@@ -0,0 +1,317 @@
+"""
+HTTP Transport - v2.0
+======================
+
+Pooled HTTP sessions for the service clients.
+
+Each real client used module-level requests.post/get, which opens a new
+TCP + TLS connection per call. A ServiceTransport owns one
+requests.Session per service with a bounded connection pool, so every
+call to that service - from any deck, any request - reuses keep-alive
+connections. With pool_block the pool size is also the service's
+concurrent-connection limit, shared by all decks in the process.
+
+Configured per service with <SERVICE>_SERVICE_POOL_SIZE (default 32).
+
+Each transport also owns a bounded thread pool (bulkhead) for its
+blocking calls, sized by <SERVICE>_SERVICE_THREADS. A slow or hanging
+service can only exhaust its own threads; calls to the other services
+never wait behind it in the event loop's shared default executor.
+
+Calls made through ServiceTransport.run() are cancellable: cancelling
+the awaiting task shuts down the socket the executor thread is blocked
+on, so the thread fails fast instead of waiting for the response (the
+broken connection is discarded, the rest of the pool is untouched).
+
+Performance: saves one connect + TLS handshake (~50-150ms) per call
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import socket
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+logger = logging.getLogger(__name__)
+
+# Call run by the current executor thread (set by ServiceTransport.run)
+_current = threading.local()
+
+# Threads per service (keep in line with the fair scheduler's slots)
+DEFAULT_SERVICE_THREADS = {
+    "text": 16,
+    "image": 8,
+    "chart": 8,
+    "diagram": 8
+}
+
+
+def call_cancelled() -> bool:
+    """True if the run() call executing on this thread has been aborted."""
+    call = getattr(_current, "call", None)
+    return bool(call is not None and call.cancelled)
+
+
+class ServiceExecutor:
+    """
+    Bounded thread pool for one service, with saturation metrics.
+
+    Reports active threads, queued calls, how long calls waited for a
+    thread, and how many submissions found every thread busy.
+    """
+
+    def __init__(self, service: str, max_workers: int):
+        self.service = service
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=f"{service}-service"
+        )
+        self._lock = threading.Lock()
+        self.active = 0
+        self.queued = 0
+        self.stats = {
+            "submitted": 0,
+            "completed": 0,
+            "saturated_submissions": 0,
+            "cancelled_queued": 0,
+            "queue_wait_seconds_total": 0.0,
+            "max_queue_wait_seconds": 0.0
+        }
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Submit fn(*args), tracking queue wait and active threads."""
+        submitted = time.monotonic()
+
+        def tracked() -> Any:
+            wait = time.monotonic() - submitted
+            with self._lock:
+                self.queued -= 1
+                self.active += 1
+                self.stats["queue_wait_seconds_total"] += wait
+                self.stats["max_queue_wait_seconds"] = max(self.stats["max_queue_wait_seconds"], wait)
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self.active -= 1
+                    self.stats["completed"] += 1
+
+        with self._lock:
+            if self.active + self.queued >= self.max_workers:
+                self.stats["saturated_submissions"] += 1
+            self.queued += 1
+            self.stats["submitted"] += 1
+
+        future = self._executor.submit(tracked)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: Future) -> None:
+        if future.cancelled():
+            # Cancelled while queued - tracked() never ran
+            with self._lock:
+                self.queued -= 1
+                self.stats["cancelled_queued"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return pool size, current use and queue-wait statistics."""
+        with self._lock:
+            started = self.stats["completed"] + self.active
+            return {
+                "max_workers": self.max_workers,
+                "active_threads": self.active,
+                "queued": self.queued,
+                "saturation": round(self.active / self.max_workers, 3),
+                "avg_queue_wait_ms": round(
+                    1000 * self.stats["queue_wait_seconds_total"] / started, 2
+                ) if started else 0.0,
+                "max_queue_wait_ms": round(1000 * self.stats["max_queue_wait_seconds"], 2),
+                "submitted": self.stats["submitted"],
+                "completed": self.stats["completed"],
+                "saturated_submissions": self.stats["saturated_submissions"],
+                "cancelled_queued": self.stats["cancelled_queued"]
+            }
+
+
+class TransportCall:
+    """Connections used by one run() call, so it can be aborted."""
+
+    def __init__(self):
+        self.cancelled = False
+        self._connections: List[HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def attach(self, connection: HTTPConnection) -> None:
+        with self._lock:
+            if self.cancelled:
+                raise requests.ConnectionError("Call cancelled")
+            self._connections.append(connection)
+
+    def abort(self) -> None:
+        """Shut down the call's sockets; blocked reads/writes fail at once."""
+        with self._lock:
+            self.cancelled = True
+            connections = list(self._connections)
+
+        for connection in connections:
+            sock = getattr(connection, "sock", None)
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+
+class _CancellableConnectionMixin:
+    def request(self, *args: Any, **kwargs: Any) -> None:
+        call = getattr(_current, "call", None)
+        if call is not None:
+            call.attach(self)
+        return super().request(*args, **kwargs)
+
+    def getresponse(self, *args: Any, **kwargs: Any):
+        call = getattr(_current, "call", None)
+        if call is not None and call.cancelled:
+            # Aborted before the socket existed - don't wait for a response
+            self.close()
+            raise requests.ConnectionError("Call cancelled")
+        return super().getresponse(*args, **kwargs)
+
+
+class _CancellableHTTPConnection(_CancellableConnectionMixin, HTTPConnection):
+    pass
+
+
+class _CancellableHTTPSConnection(_CancellableConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _CancellableHTTPPool(HTTPConnectionPool):
+    ConnectionCls = _CancellableHTTPConnection
+
+
+class _CancellableHTTPSPool(HTTPSConnectionPool):
+    ConnectionCls = _CancellableHTTPSConnection
+
+
+class _CancellableAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CancellableHTTPPool,
+            "https": _CancellableHTTPSPool
+        }
+
+
+class ServiceTransport:
+    """
+    Connection-pooled HTTP transport for one service.
+
+    Thread-safe: the clients call it from executor threads.
+    """
+
+    def __init__(self, service: str, pool_size: int = None, threads: int = None):
+        """
+        Initialize transport.
+
+        Args:
+            service: Service name ("text", "chart", "image", "diagram")
+            pool_size: Max pooled connections (default: <SERVICE>_SERVICE_POOL_SIZE
+                env var or 32)
+            threads: Executor threads for blocking calls (default:
+                <SERVICE>_SERVICE_THREADS env var or DEFAULT_SERVICE_THREADS)
+        """
+        self.service = service
+        self.pool_size = pool_size or int(os.getenv(f"{service.upper()}_SERVICE_POOL_SIZE", "32"))
+        self._lock = threading.Lock()
+        self._session = self._new_session()
+        self.stats = {"calls": 0, "aborted_calls": 0}
+
+        threads = threads or int(os.getenv(
+            f"{service.upper()}_SERVICE_THREADS",
+            str(DEFAULT_SERVICE_THREADS.get(service, 8))
+        ))
+        self.executor = ServiceExecutor(service, threads)
+
+        logger.info(
+            f"ServiceTransport[{service}] initialized "
+            f"(pool: {self.pool_size}, threads: {self.executor.max_workers})"
+        )
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = _CancellableAdapter(
+            pool_connections=1,
+            pool_maxsize=self.pool_size,
+            pool_block=True
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """Current session (replaced after close())."""
+        with self._lock:
+            return self._session
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """POST through the pooled session (same arguments as requests.post)."""
+        return self.session.post(url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """GET through the pooled session (same arguments as requests.get)."""
+        return self.session.get(url, **kwargs)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a blocking call that uses this transport in its executor.
+
+        fn runs in a copy of the caller's context (context variables).
+        If the awaiting task is cancelled, the HTTP request the call is
+        blocked on is aborted (see TransportCall).
+
+        Args:
+            fn: Sync function making requests through post()/get()
+            *args: Arguments for fn
+
+        Returns:
+            fn's return value
+        """
+        call = TransportCall()
+        context = contextvars.copy_context()
+
+        def target() -> Any:
+            _current.call = call
+            try:
+                return fn(*args)
+            finally:
+                _current.call = None
+
+        self.stats["calls"] += 1
+        try:
+            return await asyncio.wrap_future(self.executor.submit(context.run, target))
+        except asyncio.CancelledError:
+            call.abort()
+            self.stats["aborted_calls"] += 1
+            raise
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return call counts and executor (bulkhead) statistics."""
+        return {**self.stats, "executor": self.executor.get_stats()}
+
+    def close(self) -> None:
+        """Close all pooled connections; later calls use a fresh session."""
+        with self._lock:
+            old, self._session = self._session, self._new_session()
+        old.close()
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+Image Variant Store - v2.0
+===========================
+
+Keeps every URL the Image Builder returns for a generation.
+
+The Image Builder answers each request with `original`, `cropped` and
+`transparent` URLs. This store remembers all of them keyed by
+prompt + archetype, so a later request for the same image at the same aspect ratio is
+served without a new Imagen generation, and one at another aspect ratio
+can be derived from the stored original when the client has a crop
+endpoint configured (IMAGE_SERVICE_CROP_PATH; off by default).
+
+Performance: O(1) lookups, bounded LRU with TTL
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ImageVariantStore:
+    """
+    LRU store of generated images and their aspect-ratio variants.
+
+    Entry layout:
+    {
+        "image_id": str,
+        "original_url": str,
+        "variants": {
+            "16:9": {"cropped": str, "transparent": str or None},
+            ...
+        },
+        "metadata": {...},
+        "stored_at": float
+    }
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: int = 3600):
+        """
+        Initialize variant store.
+
+        Args:
+            max_entries: Maximum number of prompt+archetype entries kept
+            ttl_seconds: Entry lifetime (image service URLs are long-lived)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._pending: Dict[Tuple[str, str], asyncio.Future] = {}
+        # Variant each in-flight generation produces: (aspect_ratio, transparent)
+        self._pending_variants: Dict[Tuple[str, str], Tuple[Optional[str], bool]] = {}
+        self.stats = {"hits": 0, "derived": 0, "misses": 0}
+
+    @staticmethod
+    def make_key(prompt: str, archetype: str) -> Tuple[str, str]:
+        """Normalize prompt + archetype into a store key."""
+        return (" ".join((prompt or "").lower().split()), (archetype or "").strip().lower())
+
+    def get(self, prompt: str, archetype: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a stored image.
+
+        Returns:
+            Entry dict or None if missing/expired
+        """
+        key = self.make_key(prompt, archetype)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if time.time() - entry["stored_at"] > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(
+        self,
+        prompt: str,
+        archetype: str,
+        image_id: Optional[str],
+        urls: Dict[str, Any],
+        aspect_ratio: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Store a freshly generated image with all its URLs.
+
+        Args:
+            prompt: Generation prompt
+            archetype: Image archetype/style
+            image_id: Service image identifier
+            urls: Service `urls` dict (original, cropped, transparent)
+            aspect_ratio: Aspect ratio the cropped URL was produced for
+            metadata: Service metadata for the generation
+
+        Returns:
+            The stored entry
+        """
+        key = self.make_key(prompt, archetype)
+        entry = self._entries.get(key)
+
+        if entry is None:
+            entry = {
+                "image_id": image_id,
+                "original_url": urls.get("original", ""),
+                "variants": {},
+                "metadata": metadata or {},
+                "stored_at": time.time()
+            }
+            self._entries[key] = entry
+
+        entry["variants"][aspect_ratio] = {
+            "cropped": urls.get("cropped") or urls.get("original", ""),
+            "transparent": urls.get("transparent")
+        }
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        return entry
+
+    def add_variant(
+        self,
+        prompt: str,
+        archetype: str,
+        aspect_ratio: str,
+        urls: Dict[str, Any]
+    ) -> None:
+        """Record a variant derived from a stored original."""
+        entry = self.get(prompt, archetype)
+        if entry is None:
+            return
+
+        entry["variants"][aspect_ratio] = {
+            "cropped": urls.get("cropped") or urls.get("original", ""),
+            "transparent": urls.get("transparent")
+        }
+
+    def begin_generation(
+        self,
+        prompt: str,
+        archetype: str,
+        aspect_ratio: Optional[str] = None,
+        transparent: bool = False
+    ) -> Optional[asyncio.Future]:
+        """
+        Mark a generation for prompt + archetype as in flight.
+
+        Args:
+            prompt: Generation prompt
+            archetype: Image archetype/style
+            aspect_ratio: Aspect ratio the generation produces
+            transparent: Whether it produces a transparent variant
+
+        Returns:
+            None if the caller owns the generation, otherwise the future
+            of the generation already running (await it, then derive).
+        """
+        key = self.make_key(prompt, archetype)
+        pending = self._pending.get(key)
+        if pending is not None and not pending.done():
+            return pending
+
+        self._pending[key] = asyncio.get_running_loop().create_future()
+        self._pending_variants[key] = (aspect_ratio, transparent)
+        return None
+
+    def pending_serves(self, prompt: str, archetype: str, aspect_ratio: str, transparent: bool) -> bool:
+        """True if the in-flight generation produces this exact variant."""
+        variant = self._pending_variants.get(self.make_key(prompt, archetype))
+        if variant is None:
+            return False
+        pending_ratio, pending_transparent = variant
+        return pending_ratio == aspect_ratio and (pending_transparent or not transparent)
+
+    def end_generation(self, prompt: str, archetype: str) -> None:
+        """Release waiters of an in-flight generation (success or failure)."""
+        key = self.make_key(prompt, archetype)
+        self._pending_variants.pop(key, None)
+        pending = self._pending.pop(key, None)
+        if pending is not None and not pending.done():
+            pending.set_result(None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return store counters for monitoring."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            **self.stats
+        }
@@ -21,8 +21,11 @@ class MockTextClient:
     Mock text generation API client.
 
     Simulates fast text generation without actual API calls.
+    generate_batch() emulates a batch endpoint: one delay per batch.
     """
 
+    supports_batch = True
+
     def __init__(self, delay_ms: int = 100):
         """
         Initialize mock client.
@@ -45,7 +48,10 @@ class MockTextClient:
         """
         # Simulate API delay
         await asyncio.sleep(self.delay_ms / 1000.0)
+        return self._build_text(request)
 
+    def _build_text(self, request: Dict[str, Any]) -> GeneratedText:
+        """Build the mock text for one request (no delay)."""
         topics = request.get("topics", [])
         narrative = request.get("narrative", "")
         context = request.get("context", {})
@@ -106,7 +112,7 @@ class MockTextClient:
         requests: list[Dict[str, Any]]
     ) -> list[GeneratedText]:
         """
-        Generate batch of texts.
+        Generate batch of texts in one simulated call.
 
         Args:
             requests: List of request dicts
@@ -114,6 +120,8 @@ class MockTextClient:
         Returns:
             List of GeneratedText
         """
-        tasks = [self.generate(req) for req in requests]
-        results = await asyncio.gather(*tasks)
+        await asyncio.sleep(self.delay_ms / 1000.0)
+        results = [self._build_text(req) for req in requests]
+        for result in results:
+            result.metadata["batch_size"] = len(requests)
         return results
@@ -10,16 +10,19 @@ Service Details:
 - Async job-based API with polling
 - 20+ chart types (bar, line, pie, scatter, heatmap, etc.)
 - LLM-enhanced data synthesis with OpenAI GPT-4o-mini
+- Replicas (CHART_SERVICE_URLS) balanced by ReplicaPool
 """
 
 import os
 import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import requests
 from dotenv import load_dotenv
 
 from models.director_models import GeneratedChart
+from clients.http_transport import ServiceTransport
+from clients.replica_pool import ReplicaPool
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -32,19 +35,27 @@ class RealChartClient:
     Integrates with production Railway deployment using async job polling pattern.
     """
 
-    def __init__(self, base_url: str = None):
+    def __init__(self, base_url: str = None, transport: ServiceTransport = None):
         """
         Initialize chart/analytics service client.
 
         Args:
-            base_url: Override URL (default: from CHART_SERVICE_URL env var)
+            base_url: Override URL(s), comma-separated (default: from
+                CHART_SERVICE_URLS or CHART_SERVICE_URL env var)
+            transport: Pooled HTTP transport (default: one per client)
         """
-        self.base_url = base_url or os.getenv(
-            "CHART_SERVICE_URL",
-            "https://analytics-v30-production.up.railway.app"
+        self.transport = transport or ServiceTransport("chart")
+        self.replicas = ReplicaPool.from_env(
+            "chart",
+            base_url,
+            "https://analytics-v30-production.up.railway.app",
+            self.transport
         )
+        self.base_url = self.replicas.urls[0]
         self.timeout = int(os.getenv("CHART_SERVICE_TIMEOUT", "60"))
         self.poll_interval = int(os.getenv("CHART_POLL_INTERVAL", "2"))
+        # Job cancel endpoint, e.g. "/cancel/{job_id}" (empty = service has none)
+        self.cancel_path = os.getenv("CHART_SERVICE_CANCEL_PATH", "")
 
         logger.info(f"RealChartClient initialized (url: {self.base_url}, timeout: {self.timeout}s, poll: {self.poll_interval}s)")
 
@@ -68,12 +79,7 @@ class RealChartClient:
         service_request = self._transform_request(request)
 
         # Submit job (non-blocking)
-        loop = asyncio.get_event_loop()
-        job_response = await loop.run_in_executor(
-            None,
-            self._sync_submit_job,
-            service_request
-        )
+        job_response, base_url = await self.transport.run(self._sync_submit_job, service_request)
 
         job_id = job_response.get("job_id")
         if not job_id:
@@ -82,12 +88,20 @@ class RealChartClient:
         logger.info(f"Chart job submitted: {job_id}")
 
         # Poll for completion (non-blocking)
-        result = await self._poll_job(job_id)
+        try:
+            result = await self._poll_job(
+                job_id,
+                self.poll_interval * request.get("poll_interval_multiplier", 1),
+                base_url
+            )
+        except asyncio.CancelledError:
+            self._cancel_job(job_id, base_url)
+            raise
 
         # Transform response to orchestrator format
         return self._transform_response(result, request)
 
-    def _sync_submit_job(self, request: Dict) -> Dict:
+    def _sync_submit_job(self, request: Dict) -> Tuple[Dict, str]:
         """
         Submit chart generation job (synchronous).
 
@@ -95,22 +109,21 @@ class RealChartClient:
             request: Service-formatted request
 
         Returns:
-            Job submission response with job_id
+            (job submission response with job_id, replica base URL)
 
         Raises:
             requests.HTTPError: On API errors
             requests.Timeout: On timeout
         """
-        endpoint = f"{self.base_url}/generate"
-
         try:
-            response = requests.post(
-                endpoint,
-                json=request,
-                timeout=10  # Short timeout for job submission
-            )
-            response.raise_for_status()
-            return response.json()
+            with self.replicas.call() as base_url:
+                response = self.transport.post(
+                    f"{base_url}/generate",
+                    json=request,
+                    timeout=10  # Short timeout for job submission
+                )
+                response.raise_for_status()
+                return response.json(), base_url
 
         except requests.Timeout as e:
             logger.error(f"Chart service job submission timeout")
@@ -122,12 +135,42 @@ class RealChartClient:
             logger.error(f"Chart service job submission failed: {str(e)}")
             raise
 
-    async def _poll_job(self, job_id: str) -> Dict:
+    def _cancel_job(self, job_id: str, base_url: str = None) -> None:
+        """
+        Ask the service to drop an abandoned job (fire-and-forget).
+
+        Runs in the service's executor without being awaited - the
+        caller is being cancelled. No-op unless CHART_SERVICE_CANCEL_PATH
+        is set.
+        """
+        if not self.cancel_path:
+            return
+
+        endpoint = f"{base_url or self.base_url}{self.cancel_path.format(job_id=job_id)}"
+
+        def cancel() -> None:
+            try:
+                self.transport.post(endpoint, timeout=5).raise_for_status()
+                logger.info(f"Chart job {job_id} cancelled")
+            except Exception as e:
+                logger.warning(f"Chart job {job_id} cancel request failed: {e}")
+
+        self.transport.executor.submit(cancel)
+
+    def _sync_poll_status(self, job_id: str, base_url: str) -> Dict:
+        """Fetch a job's status from the replica that accepted it (synchronous)."""
+        with self.replicas.call(base_url) as url:
+            return self.transport.get(f"{url}/status/{job_id}", timeout=10).json()
+
+    async def _poll_job(self, job_id: str, poll_interval: float = None, base_url: str = None) -> Dict:
         """
         Poll job status until completion (async, non-blocking).
 
         Args:
             job_id: Job identifier from submission
+            poll_interval: Seconds between polls (default: poll_interval;
+                raised under brownout)
+            base_url: Replica that accepted the job (default: base_url)
 
         Returns:
             Completed job result
@@ -136,21 +179,15 @@ class RealChartClient:
             RuntimeError: If job fails
             TimeoutError: If polling times out
         """
-        max_attempts = int(self.timeout / self.poll_interval)
-        loop = asyncio.get_event_loop()
+        poll_interval = poll_interval or self.poll_interval
+        max_attempts = int(self.timeout / poll_interval)
 
         for attempt in range(max_attempts):
             # Non-blocking sleep
-            await asyncio.sleep(self.poll_interval)
+            await asyncio.sleep(poll_interval)
 
             # Check status (run in executor to avoid blocking)
-            status = await loop.run_in_executor(
-                None,
-                lambda: requests.get(
-                    f"{self.base_url}/status/{job_id}",
-                    timeout=10
-                ).json()
-            )
+            status = await self.transport.run(self._sync_poll_status, job_id, base_url or self.base_url)
 
             job_status = status.get("status")
 
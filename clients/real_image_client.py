@@ -10,16 +10,26 @@ Service Details:
 - Synchronous API (7-12s response time)
 - Custom aspect ratios (2:7, 21:9, 16:9, etc.)
 - Vertex AI Imagen 3 powered
+- Variant reuse: same prompt + archetype at the same aspect ratio is
+  served from the stored image; another aspect ratio is derived from the
+  stored original via a crop endpoint, only if IMAGE_SERVICE_CROP_PATH
+  is set (the endpoint is not part of the documented Image Builder API).
+  By default there is no cross-ratio sharing: a new aspect ratio is a
+  new generation, started at once (not after the other ratio's).
+- Replicas (IMAGE_SERVICE_URLS) balanced by ReplicaPool
 """
 
 import os
 import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import requests
 from dotenv import load_dotenv
 
 from models.director_models import GeneratedImage
+from clients.http_transport import ServiceTransport
+from clients.image_variant_store import ImageVariantStore
+from clients.replica_pool import ReplicaPool
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -32,21 +42,43 @@ class RealImageClient:
     Integrates with production Railway deployment, replacing MockImageClient.
     """
 
-    def __init__(self, base_url: str = None):
+    def __init__(
+        self,
+        base_url: str = None,
+        variant_store: Optional[ImageVariantStore] = None,
+        transport: Optional[ServiceTransport] = None
+    ):
         """
         Initialize image service client.
 
         Args:
-            base_url: Override URL (default: from IMAGE_SERVICE_URL env var)
+            base_url: Override URL(s), comma-separated (default: from
+                IMAGE_SERVICE_URLS or IMAGE_SERVICE_URL env var)
+            variant_store: Shared variant store (default: private store unless
+                IMAGE_VARIANT_REUSE=false)
+            transport: Pooled HTTP transport (default: one per client)
         """
-        self.base_url = base_url or os.getenv(
-            "IMAGE_SERVICE_URL",
-            "https://web-production-1b5df.up.railway.app"
+        self.transport = transport or ServiceTransport("image")
+        self.replicas = ReplicaPool.from_env(
+            "image",
+            base_url,
+            "https://web-production-1b5df.up.railway.app",
+            self.transport
         )
-        self.api_base = f"{self.base_url}/api/v2"
+        self.base_url = self.replicas.urls[0]
         self.timeout = int(os.getenv("IMAGE_SERVICE_TIMEOUT", "20"))
+        self.crop_path = os.getenv("IMAGE_SERVICE_CROP_PATH", "")
+
+        if variant_store is None and os.getenv("IMAGE_VARIANT_REUSE", "true").lower() == "true":
+            variant_store = ImageVariantStore(
+                max_entries=int(os.getenv("IMAGE_VARIANT_STORE_SIZE", "512"))
+            )
+        self.variant_store = variant_store
 
-        logger.info(f"RealImageClient initialized (url: {self.base_url}, timeout: {self.timeout}s)")
+        logger.info(
+            f"RealImageClient initialized (url: {self.base_url}, timeout: {self.timeout}s, "
+            f"variant reuse: {self.variant_store is not None})"
+        )
 
     async def generate(self, request: Dict[str, Any]) -> GeneratedImage:
         """
@@ -67,16 +99,176 @@ class RealImageClient:
         # Transform request to service format
         service_request = self._transform_request(request)
 
-        # Run synchronous HTTP request in executor (non-blocking)
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            self._sync_generate_image,
-            service_request
+        if self.variant_store is None:
+            response = await self._run_generation(service_request)
+            return self._transform_response(response, request)
+
+        prompt = service_request["prompt"]
+        archetype = service_request["archetype"]
+
+        aspect_ratio = service_request["aspect_ratio"]
+        needs_transparent = service_request["options"]["remove_background"]
+
+        entry = self.variant_store.get(prompt, archetype)
+        if entry is None:
+            pending = self.variant_store.begin_generation(prompt, archetype, aspect_ratio, needs_transparent)
+            if pending is None:
+                # We own the generation for this prompt + archetype
+                try:
+                    response = await self._run_generation(service_request)
+                    self._store_generation(service_request, response)
+                finally:
+                    self.variant_store.end_generation(prompt, archetype)
+                self.variant_store.stats["misses"] += 1
+                return self._transform_response(response, request)
+
+            # Same prompt already generating (e.g. another layout). Wait only
+            # if its result can serve us; otherwise generate in parallel
+            # instead of one 7-12s generation after the other.
+            if self.crop_path or self.variant_store.pending_serves(
+                prompt, archetype, aspect_ratio, needs_transparent
+            ):
+                await asyncio.shield(pending)
+                entry = self.variant_store.get(prompt, archetype)
+
+        if entry is not None:
+            reused = await self._reuse_variant(entry, service_request, request)
+            if reused is not None:
+                return reused
+
+        self.variant_store.stats["misses"] += 1
+        response = await self._run_generation(service_request)
+        self._store_generation(service_request, response)
+        return self._transform_response(response, request)
+
+    async def _run_generation(self, service_request: Dict) -> Dict:
+        """Run a full image generation in the executor (non-blocking)."""
+        return await self.transport.run(self._sync_generate_image, service_request)
+
+    def _store_generation(self, service_request: Dict, response: Dict) -> None:
+        """Keep every URL of a fresh generation in the variant store."""
+        self.variant_store.put(
+            prompt=service_request["prompt"],
+            archetype=service_request["archetype"],
+            image_id=response.get("image_id"),
+            urls=response.get("urls", {}),
+            aspect_ratio=service_request["aspect_ratio"],
+            metadata=response.get("metadata", {})
         )
 
-        # Transform response to orchestrator format
-        return self._transform_response(response, request)
+    async def _reuse_variant(
+        self,
+        entry: Dict[str, Any],
+        service_request: Dict,
+        original_request: Dict
+    ) -> Optional[GeneratedImage]:
+        """
+        Serve a request from a stored image without a new generation.
+
+        Uses the stored variant when the aspect ratio matches, otherwise
+        derives one from the stored original through the crop endpoint
+        (if IMAGE_SERVICE_CROP_PATH is configured).
+
+        Returns:
+            GeneratedImage, or None if the variant cannot be derived
+        """
+        aspect_ratio = service_request["aspect_ratio"]
+        needs_transparent = service_request["options"]["remove_background"]
+
+        variant = entry["variants"].get(aspect_ratio)
+        if variant and (not needs_transparent or variant.get("transparent")):
+            self.variant_store.stats["hits"] += 1
+            return self._variant_to_image(entry, aspect_ratio, variant, original_request, "stored")
+
+        if not self.crop_path or not entry.get("original_url"):
+            return None
+
+        try:
+            derived = await self.transport.run(self._sync_derive_variant, entry, service_request)
+        except Exception as e:
+            logger.warning(f"Image variant derivation failed, generating new image: {e}")
+            return None
+
+        urls = derived.get("urls", {})
+        if not (urls.get("cropped") or urls.get("original")):
+            return None
+
+        self.variant_store.add_variant(
+            service_request["prompt"],
+            service_request["archetype"],
+            aspect_ratio,
+            urls
+        )
+        self.variant_store.stats["derived"] += 1
+        variant = entry["variants"][aspect_ratio]
+
+        return self._variant_to_image(entry, aspect_ratio, variant, original_request, "derived")
+
+    def _sync_derive_variant(self, entry: Dict[str, Any], request: Dict) -> Dict:
+        """
+        Synchronous crop of a stored original to a new aspect ratio.
+
+        Crop endpoint (POST /api/v2<IMAGE_SERVICE_CROP_PATH>) expects:
+        {
+            "image_id": str,
+            "source_url": str,
+            "aspect_ratio": str,
+            "crop_anchor": str,
+            "options": {"remove_background": bool, "store_in_cloud": bool}
+        }
+        and returns {"urls": {"cropped": str, "original": str,
+        "transparent": str | None}} (cropped or original required).
+
+        Raises:
+            requests.HTTPError: On API errors
+            requests.Timeout: On timeout
+        """
+        with self.replicas.call() as base_url:
+            response = self.transport.post(
+                f"{base_url}/api/v2{self.crop_path}",
+                json={
+                    "image_id": entry.get("image_id"),
+                    "source_url": entry["original_url"],
+                    "aspect_ratio": request["aspect_ratio"],
+                    "crop_anchor": request["options"]["crop_anchor"],
+                    "options": {
+                        "remove_background": request["options"]["remove_background"],
+                        "store_in_cloud": True
+                    }
+                },
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            return response.json()
+
+    def _variant_to_image(
+        self,
+        entry: Dict[str, Any],
+        aspect_ratio: str,
+        variant: Dict[str, Any],
+        original_request: Dict,
+        variant_source: str
+    ) -> GeneratedImage:
+        """Build a GeneratedImage from a stored or derived variant."""
+        caption = original_request.get("goal") or original_request.get("content", "")
+
+        return GeneratedImage(
+            url=variant.get("cropped") or entry["original_url"],
+            caption=caption,
+            metadata={
+                "image_id": entry.get("image_id"),
+                "aspect_ratio": aspect_ratio,
+                "generation_time_ms": 0,
+                "model": entry["metadata"].get("model"),
+                "all_urls": {
+                    "original": entry["original_url"],
+                    "cropped": variant.get("cropped"),
+                    "transparent": variant.get("transparent")
+                },
+                "variant_source": variant_source,
+                "source": "image_service_v2.0"
+            }
+        )
 
     def _sync_generate_image(self, request: Dict) -> Dict:
         """
@@ -92,16 +284,15 @@ class RealImageClient:
             requests.HTTPError: On API errors
             requests.Timeout: On timeout
         """
-        endpoint = f"{self.api_base}/generate"
-
         try:
-            response = requests.post(
-                endpoint,
-                json=request,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            return response.json()
+            with self.replicas.call() as base_url:
+                response = self.transport.post(
+                    f"{base_url}/api/v2/generate",
+                    json=request,
+                    timeout=self.timeout
+                )
+                response.raise_for_status()
+                return response.json()
 
         except requests.Timeout as e:
             logger.error(f"Image service timeout after {self.timeout}s")
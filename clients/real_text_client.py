@@ -9,6 +9,8 @@ Service Details:
 - Synchronous API (5-15s response time)
 - Session-based context retention (1-hour TTL, last 5 slides)
 - LLM-powered with Gemini 2.5-flash default
+- Optional batch endpoint (TEXT_SERVICE_BATCH_PATH) for micro-batching
+- Replicas (TEXT_SERVICE_URLS) balanced by ReplicaPool
 """
 
 import os
@@ -19,6 +21,8 @@ import requests
 from dotenv import load_dotenv
 
 from models.director_models import GeneratedText
+from clients.http_transport import ServiceTransport
+from clients.replica_pool import ReplicaPool
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -31,20 +35,29 @@ class RealTextClient:
     Integrates with production Railway deployment, replacing MockTextClient.
     """
 
-    def __init__(self, base_url: str = None):
+    def __init__(self, base_url: str = None, transport: ServiceTransport = None):
         """
         Initialize text service client.
 
         Args:
-            base_url: Override URL (default: from TEXT_SERVICE_URL env var)
+            base_url: Override URL(s), comma-separated (default: from
+                TEXT_SERVICE_URLS or TEXT_SERVICE_URL env var)
+            transport: Pooled HTTP transport (default: one per client)
         """
-        self.base_url = base_url or os.getenv(
-            "TEXT_SERVICE_URL",
-            "https://web-production-e3796.up.railway.app"
+        self.transport = transport or ServiceTransport("text")
+        self.replicas = ReplicaPool.from_env(
+            "text",
+            base_url,
+            "https://web-production-e3796.up.railway.app",
+            self.transport
         )
-        self.api_base = f"{self.base_url}/api/v1"
+        self.base_url = self.replicas.urls[0]
         self.timeout = int(os.getenv("TEXT_SERVICE_TIMEOUT", "30"))
 
+        # Batch endpoint path, e.g. "/api/v1/generate/text/batch" (empty = none)
+        self.batch_path = os.getenv("TEXT_SERVICE_BATCH_PATH", "")
+        self.supports_batch = bool(self.batch_path)
+
         logger.info(f"RealTextClient initialized (url: {self.base_url}, timeout: {self.timeout}s)")
 
     async def generate(self, request: Dict[str, Any]) -> GeneratedText:
@@ -69,12 +82,7 @@ class RealTextClient:
         service_request = self._transform_request(request)
 
         # Run synchronous HTTP request in executor (non-blocking)
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            self._sync_generate_text,
-            service_request
-        )
+        response = await self.transport.run(self._sync_generate_text, service_request)
 
         # Transform response to orchestrator format
         return self._transform_response(response)
@@ -93,16 +101,15 @@ class RealTextClient:
             requests.HTTPError: On API errors
             requests.Timeout: On timeout
         """
-        endpoint = f"{self.api_base}/generate/text"
-
         try:
-            response = requests.post(
-                endpoint,
-                json=request,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            return response.json()
+            with self.replicas.call() as base_url:
+                response = self.transport.post(
+                    f"{base_url}/api/v1/generate/text",
+                    json=request,
+                    timeout=self.timeout
+                )
+                response.raise_for_status()
+                return response.json()
 
         except requests.Timeout as e:
             logger.error(f"Text service timeout after {self.timeout}s")
@@ -128,7 +135,9 @@ class RealTextClient:
             "context": {
                 "presentation_context": str,
                 "slide_context": str,
-                "previous_slides": List[Dict]
+                "previous_slides": List[Dict],
+                "chart_data": {"type": str, "data": Dict}  // only if the
+                    slide's text was scheduled after its chart
             },
             "constraints": {
                 "word_count": int,
@@ -137,17 +146,23 @@ class RealTextClient:
             }
         }
         """
+        context = orchestrator_request.get("context", {})
+        service_context = {
+            "presentation_context": context.get("presentation_context", ""),
+            "slide_context": context.get("slide_context", ""),
+            "previous_slides": context.get("previous_slides", [])
+        }
+        # Set by the DAG scheduler's text_after_chart rule
+        if context.get("chart_data"):
+            service_context["chart_data"] = dict(context["chart_data"])
+
         return {
             "presentation_id": orchestrator_request.get("presentation_id", "default_pres"),
             "slide_id": orchestrator_request.get("slide_id", "unknown"),
             "slide_number": orchestrator_request.get("slide_number", 1),
             "topics": orchestrator_request.get("topics", []),
             "narrative": orchestrator_request.get("narrative", ""),
-            "context": {
-                "presentation_context": orchestrator_request.get("context", {}).get("presentation_context", ""),
-                "slide_context": orchestrator_request.get("context", {}).get("slide_context", ""),
-                "previous_slides": orchestrator_request.get("context", {}).get("previous_slides", [])
-            },
+            "context": service_context,
             "constraints": {
                 "word_count": orchestrator_request.get("constraints", {}).get("word_count", 150),
                 "tone": orchestrator_request.get("constraints", {}).get("tone", "professional"),
@@ -191,12 +206,58 @@ class RealTextClient:
         """
         Generate batch of texts.
 
+        With TEXT_SERVICE_BATCH_PATH set, the batch is sent as one request
+        to the service's batch endpoint; otherwise each text is generated
+        with its own call.
+
         Args:
             requests: List of request dicts
 
         Returns:
-            List of GeneratedText
+            List of GeneratedText (a RuntimeError entry for each item the
+            batch endpoint reported as failed)
         """
-        tasks = [self.generate(req) for req in requests]
-        results = await asyncio.gather(*tasks)
+        if not self.batch_path:
+            tasks = [self.generate(req) for req in requests]
+            results = await asyncio.gather(*tasks)
+            return results
+
+        service_requests = [self._transform_request(req) for req in requests]
+
+        response = await self.transport.run(self._sync_generate_batch, service_requests)
+
+        results = []
+        for item in response["results"]:
+            if "error" in item:
+                results.append(RuntimeError(f"Text service batch item failed: {item['error']}"))
+            else:
+                results.append(self._transform_response(item))
         return results
+
+    def _sync_generate_batch(self, service_requests: list[Dict]) -> Dict:
+        """
+        Synchronous HTTP request to the Text service batch endpoint.
+
+        Request: {"requests": [<service request>, ...]}
+        Response: {"results": [<service response> | {"error": str}, ...]}
+        (same order as the requests)
+        """
+        try:
+            with self.replicas.call() as base_url:
+                response = self.transport.post(
+                    f"{base_url}{self.batch_path}",
+                    json={"requests": service_requests},
+                    timeout=self.timeout
+                )
+                response.raise_for_status()
+                return response.json()
+
+        except requests.Timeout as e:
+            logger.error(f"Text service batch timeout after {self.timeout}s ({len(service_requests)} items)")
+            raise
+        except requests.HTTPError as e:
+            logger.error(f"Text service batch HTTP error: {e.response.status_code} - {e.response.text}")
+            raise
+        except Exception as e:
+            logger.error(f"Text service batch request failed: {str(e)}")
+            raise
@@ -0,0 +1,359 @@
+"""
+Replica Pool - v2.0
+====================
+
+Latency-aware load balancing across a service's replica URLs.
+
+<SERVICE>_SERVICE_URLS lists replicas (comma-separated); without it the
+single <SERVICE>_SERVICE_URL is used and the pool is a pass-through.
+
+- Selection: power of two choices - two random available replicas, the
+  one with the lower (in-flight calls + 1) × EWMA latency wins. A replica
+  without latency samples scores with the pool average, so new replicas
+  get traffic at once.
+- Passive outlier ejection: REPLICA_EJECT_FAILURES consecutive failures
+  (connection errors, timeouts, 5xx) eject a replica for
+  REPLICA_EJECT_SECONDS × its ejection count (max REPLICA_MAX_EJECT_SECONDS).
+  At most REPLICA_MAX_EJECTED_RATIO of the replicas are ejected at once.
+- Active health probing: every REPLICA_HEALTH_INTERVAL seconds a
+  background thread GETs REPLICA_HEALTH_PATH on each replica. Failing
+  replicas are not chosen; an ejected replica that passes is reinstated
+  early.
+
+If no replica is available the least-recently-ejected one is used
+anyway - a degraded replica beats failing every call.
+
+Calls pinned to one replica (job status polls go to the replica that
+accepted the job) count towards health but not latency.
+
+Within tracking_replicas() the chosen replicas are recorded and not
+chosen again while others are available - the fallback chain's
+secondary tier retries a failed call on another replica that way.
+
+Performance: O(1) selection, one lock per call start/end
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator, List, Optional
+
+import requests
+
+from clients.http_transport import ServiceTransport, call_cancelled
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest call in a replica's latency average
+LATENCY_ALPHA = 0.3
+
+# Timeout of one health probe
+PROBE_TIMEOUT_SECONDS = 2.0
+
+# Replicas chosen so far in the current tracking_replicas() context
+_tried_replicas: ContextVar[Optional[List[str]]] = ContextVar("tried_replicas", default=None)
+
+
+def replica_urls(service: str, base_url: Optional[str], default_url: str) -> List[str]:
+    """
+    Resolve a service's replica URLs.
+
+    Args:
+        service: Service name ("text", "chart", "image", "diagram")
+        base_url: Explicit URL(s), comma-separated (overrides env vars)
+        default_url: Used when nothing is configured
+
+    Returns:
+        Replica base URLs (at least one, no trailing slashes)
+    """
+    spec = base_url or os.getenv(f"{service.upper()}_SERVICE_URLS") or os.getenv(
+        f"{service.upper()}_SERVICE_URL", default_url
+    )
+    urls = [url.strip().rstrip("/") for url in spec.split(",") if url.strip()]
+    return urls or [default_url]
+
+
+@contextmanager
+def tracking_replicas() -> Iterator[List[str]]:
+    """
+    Record the replicas chosen for calls made in this context.
+
+    Also applies to calls run on the transport's executor threads
+    (ServiceTransport.run copies the context).
+
+    Yields:
+        The base URLs chosen so far (in order)
+    """
+    tried: List[str] = []
+    token = _tried_replicas.set(tried)
+    try:
+        yield tried
+    finally:
+        _tried_replicas.reset(token)
+
+
+def _is_replica_failure(error: BaseException) -> bool:
+    """Errors that say something about the replica, not the request."""
+    if call_cancelled():
+        return False  # we aborted the call
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code >= 500
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+class Replica:
+    """One replica's load, latency and health."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.in_flight = 0
+        self.latency: Optional[float] = None
+        self.consecutive_failures = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+        self.healthy = True
+        self.calls = 0
+        self.failures = 0
+
+    def available(self, now: float) -> bool:
+        return self.healthy and self.ejected_until <= now
+
+
+class ReplicaPool:
+    """
+    Replica selection, outlier ejection and health probing for a service.
+
+    Usage (from the client's executor threads):
+        with pool.call() as base_url:
+            response = transport.post(f"{base_url}/generate", ...)
+            response.raise_for_status()
+    """
+
+    def __init__(
+        self,
+        service: str,
+        urls: List[str],
+        transport: Optional[ServiceTransport] = None,
+        eject_failures: int = 5,
+        eject_seconds: float = 30.0,
+        max_eject_seconds: float = 300.0,
+        max_ejected_ratio: float = 0.5,
+        health_path: str = "/health",
+        health_interval: float = 10.0,
+        rng: Optional[random.Random] = None
+    ):
+        """
+        Initialize pool.
+
+        Args:
+            service: Service name (logs/metrics)
+            urls: Replica base URLs
+            transport: Transport for health probes (none: no probing)
+            eject_failures: Consecutive failures that eject a replica
+            eject_seconds: First ejection length (grows per ejection)
+            max_eject_seconds: Longest ejection
+            max_ejected_ratio: Fraction of replicas that may be ejected
+            health_path: Probe path ("" disables probing)
+            health_interval: Seconds between probe rounds (0 disables)
+            rng: Random source for selection
+        """
+        if not urls:
+            raise ValueError(f"{service} replica pool needs at least one URL")
+
+        self.service = service
+        self.replicas = [Replica(url) for url in urls]
+        self._by_url = {replica.url: replica for replica in self.replicas}
+        self.transport = transport
+        self.eject_failures = max(1, eject_failures)
+        self.eject_seconds = eject_seconds
+        self.max_eject_seconds = max_eject_seconds
+        self.max_ejected = int(len(self.replicas) * max_ejected_ratio)
+        self.health_path = health_path
+        self.health_interval = health_interval
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._prober: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_env(
+        cls,
+        service: str,
+        base_url: Optional[str],
+        default_url: str,
+        transport: Optional[ServiceTransport] = None
+    ) -> "ReplicaPool":
+        """Build a pool from <SERVICE>_SERVICE_URL(S) and REPLICA_* env vars."""
+        pool = cls(
+            service=service,
+            urls=replica_urls(service, base_url, default_url),
+            transport=transport,
+            eject_failures=int(os.getenv("REPLICA_EJECT_FAILURES", "5")),
+            eject_seconds=float(os.getenv("REPLICA_EJECT_SECONDS", "30")),
+            max_eject_seconds=float(os.getenv("REPLICA_MAX_EJECT_SECONDS", "300")),
+            max_ejected_ratio=float(os.getenv("REPLICA_MAX_EJECTED_RATIO", "0.5")),
+            health_path=os.getenv("REPLICA_HEALTH_PATH", "/health"),
+            health_interval=float(os.getenv("REPLICA_HEALTH_INTERVAL", "10"))
+        )
+        if len(pool.replicas) > 1:
+            logger.info(f"{service} service: {len(pool.replicas)} replicas {pool.urls}")
+        return pool
+
+    @property
+    def urls(self) -> List[str]:
+        return [replica.url for replica in self.replicas]
+
+    def choose(self, now: Optional[float] = None) -> Replica:
+        """Pick a replica by power of two choices (untried ones first)."""
+        if len(self.replicas) == 1:
+            return self.replicas[0]
+
+        self._start_probing()
+        now = time.monotonic() if now is None else now
+        tried = _tried_replicas.get() or ()
+        with self._lock:
+            candidates = [r for r in self.replicas if r.available(now)]
+            if not candidates:
+                candidates = [r for r in self.replicas if r.ejected_until <= now] or [
+                    min(self.replicas, key=lambda r: r.ejected_until)
+                ]
+            candidates = [r for r in candidates if r.url not in tried] or candidates
+            if len(candidates) == 1:
+                return candidates[0]
+
+            known = [r.latency for r in self.replicas if r.latency is not None]
+            default_latency = sum(known) / len(known) if known else 1.0
+
+            def score(replica: Replica) -> float:
+                latency = replica.latency if replica.latency is not None else default_latency
+                return (replica.in_flight + 1) * latency
+
+            return min(self._rng.sample(candidates, 2), key=score)
+
+    @contextmanager
+    def call(self, url: Optional[str] = None) -> Iterator[str]:
+        """
+        Run one call against a replica, recording its outcome.
+
+        Args:
+            url: Pin the call to this replica (e.g. a job's status poll);
+                default: choose one
+
+        Yields:
+            The replica's base URL
+        """
+        replica = self._by_url.get(url) if url else None
+        pinned = replica is not None
+        if replica is None:
+            replica = self.choose()
+            tried = _tried_replicas.get()
+            if tried is not None:
+                tried.append(replica.url)
+
+        with self._lock:
+            replica.in_flight += 1
+        started = time.monotonic()
+        try:
+            yield replica.url
+        except BaseException as e:
+            self._record(replica, None, failed=isinstance(e, Exception) and _is_replica_failure(e))
+            raise
+        else:
+            self._record(replica, None if pinned else time.monotonic() - started, failed=False)
+        finally:
+            with self._lock:
+                replica.in_flight -= 1
+
+    def _record(self, replica: Replica, latency: Optional[float], failed: bool) -> None:
+        with self._lock:
+            replica.calls += 1
+            if latency is not None:
+                replica.latency = latency if replica.latency is None else (
+                    replica.latency + LATENCY_ALPHA * (latency - replica.latency)
+                )
+            if not failed:
+                replica.consecutive_failures = 0
+                return
+
+            replica.failures += 1
+            replica.consecutive_failures += 1
+            if replica.consecutive_failures >= self.eject_failures:
+                self._eject(replica, time.monotonic())
+
+    def _eject(self, replica: Replica, now: float) -> None:
+        """Eject a failing replica if the ejection budget allows (lock held)."""
+        if replica.ejected_until > now:
+            return
+        ejected = sum(1 for r in self.replicas if r.ejected_until > now)
+        if ejected >= self.max_ejected:
+            return
+
+        replica.ejections += 1
+        seconds = min(self.max_eject_seconds, self.eject_seconds * replica.ejections)
+        replica.ejected_until = now + seconds
+        replica.consecutive_failures = 0
+        logger.warning(
+            f"{self.service} replica {replica.url} ejected for {seconds:.0f}s "
+            f"after {self.eject_failures} consecutive failures"
+        )
+
+    def probe_once(self) -> None:
+        """Health-check every replica once (runs on the prober thread)."""
+        for replica in self.replicas:
+            try:
+                response = self.transport.get(f"{replica.url}{self.health_path}", timeout=PROBE_TIMEOUT_SECONDS)
+                healthy = response.status_code < 400
+            except Exception:
+                healthy = False
+
+            with self._lock:
+                if healthy and replica.ejected_until > time.monotonic():
+                    replica.ejected_until = 0.0
+                    logger.info(f"{self.service} replica {replica.url} reinstated by health probe")
+                if healthy != replica.healthy:
+                    log = logger.info if healthy else logger.warning
+                    log(f"{self.service} replica {replica.url} {'healthy' if healthy else 'failed health probe'}")
+                replica.healthy = healthy
+
+    def _start_probing(self) -> None:
+        """Start the prober thread on first use (multi-replica pools only)."""
+        if self._prober is not None or self.transport is None or not self.health_path or self.health_interval <= 0:
+            return
+        with self._lock:
+            if self._prober is not None:
+                return
+
+            def run() -> None:
+                while not self._stop.wait(self.health_interval):
+                    self.probe_once()
+
+            self._prober = threading.Thread(target=run, name=f"{self.service}-health", daemon=True)
+            self._prober.start()
+
+    def close(self) -> None:
+        """Stop health probing."""
+        self._stop.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return per-replica load, latency and health."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "replicas": [
+                    {
+                        "url": r.url,
+                        "in_flight": r.in_flight,
+                        "latency_ms": round(1000 * r.latency, 1) if r.latency is not None else None,
+                        "calls": r.calls,
+                        "failures": r.failures,
+                        "ejections": r.ejections,
+                        "ejected": r.ejected_until > now,
+                        "healthy": r.healthy
+                    }
+                    for r in self.replicas
+                ]
+            }
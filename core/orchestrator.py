@@ -19,26 +19,66 @@ Performance: 12x faster than v1.0
 Architecture:
 1. Parse guidance strings → API requests (RequestBuilder)
 2. Call all APIs in parallel (APIDispatcher)
-3. Stitch results → EnrichedSlides (ResultStitcher)
-4. Minimal validation (SLAValidator)
-5. Return EnrichedPresentationStrawman
+3. Map, validate and stitch each slide as soon as its last API call
+   returns, while other slides are still in flight
+   (ResultStitcher + SLAValidator)
+4. Validation report built incrementally in slide order
+5. Optional: localize asset URLs (AssetLocalizer)
+6. Return EnrichedPresentationStrawman
+
+Draft mode: steps 1-6 run on the local tier only (sub-second), the full
+enrichment runs in the background and is published as version 2 in the
+EnrichmentVersionStore. With an AdmissionController set (self.admission)
+the background run holds its own ticket; while shed it is deferred by
+Retry-After, for up to UPGRADE_MAX_DEFER seconds.
+
+Speculation: speculate() starts chart/image/diagram generation from the
+strawman alone, before layout_assignments are known; enrichment attaches
+to those in-flight or finished generations (SpeculativeCache).
+
+Brownout: under sustained queueing delay, enrichments are degraded
+step by step (BrownoutController) and report what was degraded.
+
+Priority: "makespan" (default) finishes the whole deck soonest;
+"visible_first" completes slides in slide_number order, or the
+caller's on-screen slides first. Every enrichment reports time to the
+first slide and to the Nth slide (generation_metadata["slide_timing"]).
 """
 
+import asyncio
+import inspect
 import logging
+import os
 import time
-from typing import Optional, Callable, List, Dict, Any
+import uuid
+from typing import Optional, Callable, List, Dict, Any, Tuple
 from datetime import datetime
 
 # Import v2 models - use absolute imports for production
 from models.agents import PresentationStrawman, Slide
-from models.layout_models import LayoutAssignment, LayoutConstraints, ValidationReport
+from models.layout_models import LayoutAssignment, LayoutConstraints, ValidationReport, ValidationStatus
 from models.director_models import EnrichedPresentationStrawman
 
 # Import v2 services - use absolute imports for production
 from services.request_builder import RequestBuilder
+from services.request_compiler import RequestCompiler, API_TYPES
 from services.api_dispatcher import APIDispatcher
-from services.result_stitcher import ResultStitcher
-from services.sla_validator import SLAValidator
+from services.dag_scheduler import DAGScheduler, PRIORITY_MODES, rules_from_env, visible_first_priorities
+from services.deck_eta import DeckETA
+from services.latency_model import LatencyModel
+from services.result_stitcher import ResultStitcher, empty_api_results
+from services.sla_validator import SLAValidator, ValidationReportBuilder
+from services.local_generators import (
+    LocalTextClient,
+    LocalChartClient,
+    PlaceholderImageClient,
+    PlaceholderDiagramClient,
+    GenerationPolicy
+)
+from services.enrichment_store import EnrichmentVersionStore
+from services.brownout import BrownoutController, build_brownout_controller
+from services.fair_scheduler import parse_weights
+from services.speculative_cache import SpeculativeCache, SPECULATIVE_API_TYPES
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +96,18 @@ class ContentOrchestratorV2:
     4. Minimal validation (trust but verify)
     """
 
-    def __init__(self, text_client, chart_client, image_client, diagram_client):
+    def __init__(
+        self,
+        text_client,
+        chart_client,
+        image_client,
+        diagram_client,
+        asset_localizer=None,
+        generation_policy: Optional[GenerationPolicy] = None,
+        speculative_cache: Optional[SpeculativeCache] = None,
+        scheduler: Optional[DAGScheduler] = None,
+        brownout: Optional[BrownoutController] = None
+    ):
         """
         Initialize v2.0 orchestrator with API clients.
 
@@ -65,16 +116,57 @@ class ContentOrchestratorV2:
             chart_client: Chart generation API client
             image_client: Image generation API client
             diagram_client: Diagram generation API client
+            asset_localizer: Optional AssetLocalizer that downloads generated
+                assets once and rewrites their URLs to the local endpoint
+            generation_policy: Chooses local vs remote generation per layout
+                (default: from LOCAL_TEXT_LAYOUTS env var)
+            speculative_cache: Cache for speculate() (default: TTL from
+                SPECULATIVE_CACHE_TTL env var)
+            scheduler: DAGScheduler for request dependencies (default:
+                rules from DAG_DEPENDENCIES env var, learned latencies)
+            brownout: Degrades enrichments under overload (default: driven
+                by the dispatcher's queueing delay, BROWNOUT_* env vars)
         """
         self.request_builder = RequestBuilder()
+        self.request_compiler = RequestCompiler(self.request_builder)
+        self.speculative_cache = speculative_cache or SpeculativeCache(
+            ttl_seconds=float(os.getenv("SPECULATIVE_CACHE_TTL", "120"))
+        )
+        # Learned call latencies: recorded by the dispatcher, used by the
+        # scheduler to start the longest expected calls first
+        self.latency_model = LatencyModel.from_env()
         self.api_dispatcher = APIDispatcher(
             text_client=text_client,
             chart_client=chart_client,
             image_client=image_client,
-            diagram_client=diagram_client
+            diagram_client=diagram_client,
+            local_clients={
+                "text": LocalTextClient(),
+                "chart": LocalChartClient(),
+                "image": PlaceholderImageClient(),
+                "diagram": PlaceholderDiagramClient()
+            },
+            speculative_cache=self.speculative_cache,
+            scheduler=scheduler or DAGScheduler(rules=rules_from_env(), latency_model=self.latency_model),
+            latency_model=self.latency_model
+        )
+        self.generation_policy = generation_policy or GenerationPolicy.from_env()
+        self.brownout = brownout or build_brownout_controller(
+            lambda: self.api_dispatcher.get_load()["queue_delay_seconds"]
         )
         self.result_stitcher = ResultStitcher()
         self.sla_validator = SLAValidator()
+        self.asset_localizer = asset_localizer
+        self.enrichment_store = EnrichmentVersionStore()
+        self.tenant_weights = parse_weights(os.getenv("FAIR_TENANT_WEIGHTS", ""))
+        self.batch_weight = float(os.getenv("FAIR_BATCH_WEIGHT", "0.5"))
+        self.priority_mode = os.getenv("PRIORITY_MODE", "makespan")
+        if self.priority_mode not in PRIORITY_MODES:
+            raise ValueError(f"Unknown PRIORITY_MODE: {self.priority_mode}")
+        self._background_tasks = set()
+        # Set by the API: background upgrades are admitted like requests
+        self.admission = None
+        self.upgrade_max_defer = float(os.getenv("UPGRADE_MAX_DEFER", "300"))
 
         logger.info("ContentOrchestratorV2 initialized (lightweight mode)")
 
@@ -83,114 +175,270 @@ class ContentOrchestratorV2:
         strawman: PresentationStrawman,
         layout_assignments: Optional[List[LayoutAssignment]] = None,
         layout_specifications: Optional[Dict[str, Any]] = None,
-        progress_callback: Optional[Callable[[str, int, int], None]] = None
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        mode: str = "full",
+        upgrade_callback: Optional[Callable[[str, int, EnrichedPresentationStrawman], Any]] = None,
+        tenant_id: Optional[str] = None,
+        priority: Optional[str] = None,
+        visible_slide_ids: Optional[List[str]] = None
     ) -> EnrichedPresentationStrawman:
         """
         Main orchestration method - Director-compliant interface.
 
         CRITICAL: This signature MUST match v1.0 and Director expectations.
+        (mode, upgrade_callback, tenant_id, priority and visible_slide_ids
+        are optional extensions.)
 
         Args:
             strawman: PresentationStrawman with slides and guidance
             layout_assignments: List of LayoutAssignment (one per slide)
             layout_specifications: Dict of layout specs (for reference)
             progress_callback: Optional callback(message, current, total)
+            mode: "full" (default) or "draft" - return a locally generated
+                deck immediately and upgrade it in the background
+            upgrade_callback: Draft mode only - optional callback
+                (enrichment_id, version, result), sync or async, pushed
+                when an upgraded version is published
+            tenant_id: Fair-queueing flow to share service slots with
+                (default: this presentation gets its own flow)
+            priority: "makespan" or "visible_first" (default: PRIORITY_MODE
+                env var, or visible_first when visible_slide_ids is given)
+            visible_slide_ids: visible_first - slides on screen, completed
+                before the rest (default: slide_number order)
 
         Returns:
             EnrichedPresentationStrawman with generated content
         """
-        start_time = time.time()
-        logger.info(f"Starting v2.0 presentation enrichment: '{strawman.main_title}'")
+        if mode not in ("full", "draft"):
+            raise ValueError(f"Unknown enrichment mode: {mode}")
+        schedule = self._make_schedule(strawman, priority, visible_slide_ids)
 
-        # Create default layout assignments if not provided
-        if not layout_assignments:
-            layout_assignments = self._create_default_layout_assignments(strawman)
-            logger.info("Using default layout assignments (test mode)")
+        logger.info(f"Starting v2.0 presentation enrichment: '{strawman.main_title}' (mode: {mode})")
 
-        # Validate layout assignments match slides
-        if len(layout_assignments) != len(strawman.slides):
-            raise ValueError(
-                f"Layout assignments count ({len(layout_assignments)}) doesn't match "
-                f"slides count ({len(strawman.slides)})"
+        layout_assignments = self._resolve_layout_assignments(strawman, layout_assignments)
+        flow = self._make_flow(tenant_id)
+
+        if mode == "draft":
+            return await self._enrich_draft(
+                strawman=strawman,
+                layout_assignments=layout_assignments,
+                progress_callback=progress_callback,
+                upgrade_callback=upgrade_callback,
+                flow=flow,
+                schedule=schedule
             )
 
+        return await self._enrich(
+            strawman=strawman,
+            layout_assignments=layout_assignments,
+            progress_callback=progress_callback,
+            flow=flow,
+            schedule=schedule
+        )
+
+    async def speculate(
+        self,
+        strawman: PresentationStrawman,
+        tenant_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Start layout-independent generations before layout assignment.
+
+        Compiles chart, image and diagram requests against the default
+        layouts without pruning (the final layout is unknown) and starts
+        them in the background. Text is skipped - its constraints come
+        from the layout. A later enrich_presentation() attaches to these
+        generations when guidance and dimensions match.
+
+        Args:
+            strawman: PresentationStrawman with slides and guidance
+            tenant_id: Fair-queueing flow (speculation runs at batch weight)
+
+        Returns:
+            Summary: {"started": int, "already_cached": int, "by_type": {...}}
+        """
+        layout_assignments = self._create_default_layout_assignments(strawman)
+        flow = self._make_flow(tenant_id, background=True)
+
+        started = 0
+        already_cached = 0
+        by_type = {api_type: 0 for api_type in SPECULATIVE_API_TYPES}
+
+        for api_type, request in self.request_compiler.compile(strawman, layout_assignments, prune=False):
+            if api_type not in SPECULATIVE_API_TYPES:
+                continue
+
+            request.update(flow)
+            if self.speculative_cache.start(
+                api_type,
+                request,
+                lambda api_type=api_type, request=request: self.api_dispatcher.call_client(api_type, request)
+            ):
+                started += 1
+                by_type[api_type] += 1
+            else:
+                already_cached += 1
+
+        logger.info(
+            f"Speculating on '{strawman.main_title}': {started} generations started, "
+            f"{already_cached} already cached"
+        )
+
+        return {
+            "started": started,
+            "already_cached": already_cached,
+            "by_type": by_type
+        }
+
+    async def _enrich(
+        self,
+        strawman: PresentationStrawman,
+        layout_assignments: List[LayoutAssignment],
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        draft: bool = False,
+        shared_results: Optional[Dict[str, asyncio.Future]] = None,
+        flow: Optional[Dict[str, Any]] = None,
+        schedule: Optional[Dict[str, Any]] = None,
+        eta: Optional[DeckETA] = None
+    ) -> EnrichedPresentationStrawman:
+        """
+        Run one enrichment pass.
+
+        Args:
+            strawman: Presentation strawman
+            layout_assignments: Validated layout assignments
+            progress_callback: Optional callback(message, current, total)
+            draft: Serve every request from the local tier
+            shared_results: Fingerprint → result table shared across the
+                decks of a batch (cross-deck deduplication)
+            flow: {"flow_id", "flow_weight"} stamped on every request for
+                fair queueing (default: a new flow for this deck)
+            schedule: Priority mode from _make_schedule (default: makespan)
+            eta: DeckETA the dispatch keeps updated (default: a new one)
+
+        Returns:
+            EnrichedPresentationStrawman
+        """
+        start_time = time.time()
+        schedule = schedule or {"priority": "makespan", "visible_slide_ids": [], "slide_priorities": None}
         total_slides = len(strawman.slides)
 
         # Step 1: Build all API requests (deterministic parsing, no GenAI)
         if progress_callback:
             progress_callback("Building API requests", 1, 5)
 
+        pruned_requests = []
         all_requests = self._build_all_requests(
             strawman=strawman,
-            layout_assignments=layout_assignments
+            layout_assignments=layout_assignments,
+            pruned=pruned_requests
         )
 
+        flow = flow or self._make_flow()
+        slide_priorities = schedule["slide_priorities"]
+        for requests in all_requests.values():
+            for request in requests:
+                request.update(flow)
+                if slide_priorities is not None:
+                    request["priority"] = slide_priorities.get(request.get("slide_id"), 0.0)
+
+        degradations = []
+        if draft:
+            local_requests = self._route_all_local(all_requests)
+        else:
+            local_requests = self.generation_policy.apply(all_requests)
+            degradations = self.brownout.apply(all_requests, local_types=self.api_dispatcher.local_clients)
+            local_requests += sum(d["requests"] for d in degradations if d["degradation"] == "local_text")
+            if degradations:
+                logger.warning(f"Brownout level {self.brownout.level}: {degradations}")
+
         total_requests = sum(len(reqs) for reqs in all_requests.values())
-        logger.info(f"Built {total_requests} API requests for {total_slides} slides")
+        logger.info(
+            f"Built {total_requests} API requests for {total_slides} slides "
+            f"({len(pruned_requests)} pruned as unused by layout, {local_requests} local)"
+        )
 
         # Step 2: Dispatch all API calls in parallel
         if progress_callback:
             progress_callback(f"Calling {total_requests} APIs in parallel", 2, 5)
 
+        # Step 3 runs inside step 2: each slide is mapped, validated and
+        # stitched the moment its last API call returns
+        slide_index = {
+            slide.slide_id: (slide, layout_assignment)
+            for slide, layout_assignment in zip(strawman.slides, layout_assignments)
+        }
+        processed: Dict[str, Tuple[Any, ValidationStatus]] = {}
+        # Seconds from start until each slide was ready
+        completed_at: Dict[str, float] = {}
+
+        def on_slide_complete(slide_id: str, slide_results: Dict[str, Any]) -> None:
+            entry = slide_index.get(slide_id)
+            if entry is not None:
+                processed[slide_id] = self._post_process_slide(entry[0], entry[1], slide_results)
+                completed_at[slide_id] = time.time() - start_time
+
         api_results = await self.api_dispatcher.dispatch_all(
             all_requests=all_requests,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            on_slide_complete=on_slide_complete,
+            shared_results=shared_results,
+            eta=eta
         )
 
-        logger.info(f"All API calls completed, got results for {len(api_results)} slides")
-
-        # Step 3: Validate results (minimal validation)
-        if progress_callback:
-            progress_callback("Validating results", 3, 5)
-
-        # Map API results to content dicts for validation
-        all_content = {}
-        for slide_id, results in api_results.items():
-            # Get the slide and layout for this slide_id
-            slide = next((s for s in strawman.slides if s.slide_id == slide_id), None)
-            layout = next((la for la in layout_assignments if la.slide_id == slide_id), None)
-
-            if slide and layout:
-                # Map to layout-specific fields
-                mapped_content = self.result_stitcher._map_to_layout(
-                    slide=slide,
-                    api_results=results,
-                    layout_id=layout.layout_id
-                )
-                all_content[slide_id] = mapped_content
-
-        validation_results = self.sla_validator.validate_batch(
-            all_content=all_content,
-            layout_assignments=layout_assignments
+        logger.info(
+            f"All API calls completed, got results for {len(api_results)} slides "
+            f"({len(processed)} post-processed in flight)"
         )
 
-        logger.info(f"Validation complete for {len(validation_results)} slides")
-
-        # Step 4: Stitch results into EnrichedSlides
+        # Step 3: Stitch slides without API results and build the report
         if progress_callback:
-            progress_callback("Stitching results", 4, 5)
+            progress_callback("Validating and stitching results", 3, 5)
 
-        enriched_slides = self.result_stitcher.stitch_batch(
-            slides=strawman.slides,
+        enriched_slides, validation_report = self._validate_and_stitch(
+            strawman=strawman,
             layout_assignments=layout_assignments,
-            all_api_results=api_results,
-            all_validation_statuses=validation_results
+            api_results=api_results,
+            processed=processed
         )
 
-        logger.info(f"Stitched {len(enriched_slides)} enriched slides")
+        stitched_at = time.time() - start_time
+        for slide in strawman.slides:
+            completed_at.setdefault(slide.slide_id, stitched_at)
+
+        logger.info(f"Validated and stitched {len(enriched_slides)} enriched slides")
 
-        # Step 5: Create validation report and metadata
+        # Optional: serve assets from the local blob store
+        asset_stats = None
+        if self.asset_localizer is not None and not draft:
+            if progress_callback:
+                progress_callback("Localizing assets", 4, 5)
+            asset_stats = await self.asset_localizer.localize(enriched_slides)
+            logger.info(f"Localized assets: {asset_stats}")
+
+        # Step 5: Create metadata
         if progress_callback:
             progress_callback("Creating final report", 5, 5)
 
-        validation_report = self._create_validation_report(enriched_slides)
-
         processing_time = time.time() - start_time
         generation_metadata = self._create_generation_metadata(
             api_results=api_results,
             processing_time=processing_time,
-            total_requests=total_requests
+            total_requests=total_requests,
+            pruned_requests=pruned_requests
         )
+        generation_metadata["local_api_requests"] = local_requests
+        generation_metadata["mode"] = "draft" if draft else "full"
+        generation_metadata["speculative_hits"] = self._count_flagged(api_results, "speculative")
+        generation_metadata["coalesced_requests"] = self._count_flagged(api_results, "coalesced")
+        generation_metadata["timeout_fallbacks"] = self._count_flagged(api_results, "timeout_fallback")
+        generation_metadata["tiers"] = self._count_tiers(api_results)
+        generation_metadata["degradations"] = degradations
+        generation_metadata["slide_timing"] = self._slide_timing(strawman, completed_at, schedule)
+        if shared_results is not None:
+            generation_metadata["deduplicated_requests"] = self._count_flagged(api_results, "deduplicated")
+        if asset_stats is not None:
+            generation_metadata["asset_localization"] = asset_stats
 
         # Return Director-compliant structure
         enriched_strawman = EnrichedPresentationStrawman(
@@ -207,76 +455,490 @@ class ContentOrchestratorV2:
 
         return enriched_strawman
 
+    async def enrich_many(
+        self,
+        decks: List[Dict[str, Any]],
+        max_concurrent_decks: int = 8,
+        tenant_id: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Enrich many presentations in one call.
+
+        All decks share this orchestrator's dispatcher and clients (one
+        connection pool per service) and one fingerprint → result table,
+        so a component request that appears in several decks is
+        generated once. The whole batch is one fair-queueing flow at
+        FAIR_BATCH_WEIGHT, so interactive decks keep their share of the
+        service slots.
+
+        Args:
+            decks: List of {"strawman", "layout_assignments" (optional),
+                "layout_specifications" (optional)}
+            max_concurrent_decks: Decks enriched at the same time
+            tenant_id: Fair-queueing flow (default: one flow per batch)
+
+        Returns:
+            One entry per deck, in input order: EnrichedPresentationStrawman,
+            or the exception that deck failed with
+        """
+        results: List[Any] = [None] * len(decks)
+        async for index, result in self.enrich_many_iter(decks, max_concurrent_decks, tenant_id):
+            results[index] = result
+        return results
+
+    async def enrich_many_iter(
+        self,
+        decks: List[Dict[str, Any]],
+        max_concurrent_decks: int = 8,
+        tenant_id: Optional[str] = None
+    ):
+        """
+        Enrich many presentations, yielding each as soon as it is done.
+
+        Same sharing and deduplication as enrich_many().
+
+        Yields:
+            (deck index, EnrichedPresentationStrawman or exception) in
+            completion order
+        """
+        shared_results: Dict[str, asyncio.Future] = {}
+        flow = self._make_flow(tenant_id, background=True)
+        semaphore = asyncio.Semaphore(max(1, max_concurrent_decks))
+
+        logger.info(f"Batch enrichment of {len(decks)} decks ({max_concurrent_decks} at a time)")
+
+        async def run(index: int, deck: Dict[str, Any]):
+            async with semaphore:
+                try:
+                    return index, await self._enrich_deck(deck, shared_results, flow)
+                except Exception as e:
+                    logger.error(f"Batch deck {index} failed: {e}", exc_info=True)
+                    return index, e
+
+        tasks = [asyncio.create_task(run(index, deck)) for index, deck in enumerate(decks)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        logger.info(f"Batch complete: {len(shared_results)} unique component requests across {len(decks)} decks")
+
+    async def _enrich_deck(
+        self,
+        deck: Dict[str, Any],
+        shared_results: Dict[str, asyncio.Future],
+        flow: Optional[Dict[str, Any]] = None
+    ) -> EnrichedPresentationStrawman:
+        """Validate one batch entry and run a full enrichment pass for it."""
+        strawman = deck["strawman"]
+        layout_assignments = self._resolve_layout_assignments(strawman, deck.get("layout_assignments"))
+
+        return await self._enrich(
+            strawman=strawman,
+            layout_assignments=layout_assignments,
+            shared_results=shared_results,
+            flow=flow
+        )
+
+    async def _enrich_draft(
+        self,
+        strawman: PresentationStrawman,
+        layout_assignments: List[LayoutAssignment],
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        upgrade_callback: Optional[Callable[[str, int, EnrichedPresentationStrawman], Any]] = None,
+        flow: Optional[Dict[str, Any]] = None,
+        schedule: Optional[Dict[str, Any]] = None
+    ) -> EnrichedPresentationStrawman:
+        """
+        Return a local draft now and schedule the full enrichment.
+
+        The draft is version 1 of a new enrichment in self.enrichment_store;
+        generation_metadata carries enrichment_id and version so the
+        Director can fetch (or be pushed) the upgrade.
+        """
+        enrichment_id = self.enrichment_store.create()
+
+        draft = await self._enrich(
+            strawman=strawman,
+            layout_assignments=layout_assignments,
+            progress_callback=progress_callback,
+            draft=True,
+            schedule=schedule
+        )
+
+        version = self.enrichment_store.publish(enrichment_id, draft, status="upgrading")
+        draft.generation_metadata.update({
+            "enrichment_id": enrichment_id,
+            "version": version,
+            "upgrade_pending": True
+        })
+
+        task = asyncio.create_task(
+            self._run_upgrade(enrichment_id, strawman, layout_assignments, upgrade_callback, flow, schedule)
+        )
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+        logger.info(f"Draft {enrichment_id} v{version} ready, full enrichment running in background")
+
+        return draft
+
+    async def _run_upgrade(
+        self,
+        enrichment_id: str,
+        strawman: PresentationStrawman,
+        layout_assignments: List[LayoutAssignment],
+        upgrade_callback: Optional[Callable[[str, int, EnrichedPresentationStrawman], Any]] = None,
+        flow: Optional[Dict[str, Any]] = None,
+        schedule: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Run the full enrichment for a draft and publish it as a new version."""
+        ticket = await self._admit_upgrade(enrichment_id, len(strawman.slides))
+        if ticket is False:
+            return
+
+        eta = DeckETA(self.latency_model)
+        self.enrichment_store.set_eta(enrichment_id, eta)
+        try:
+            result = await self._enrich(
+                strawman=strawman,
+                layout_assignments=layout_assignments,
+                flow=flow,
+                schedule=schedule,
+                eta=eta
+            )
+        except Exception as e:
+            logger.error(f"Upgrade of {enrichment_id} failed: {e}", exc_info=True)
+            self.enrichment_store.set_status(enrichment_id, "failed", error=str(e))
+            return
+        finally:
+            if ticket is not None:
+                self.admission.release(ticket)
+
+        version = self.enrichment_store.publish(enrichment_id, result, status="complete")
+        result.generation_metadata.update({
+            "enrichment_id": enrichment_id,
+            "version": version,
+            "upgrade_pending": False
+        })
+
+        logger.info(f"Enrichment {enrichment_id} upgraded to v{version}")
+
+        if upgrade_callback:
+            try:
+                pushed = upgrade_callback(enrichment_id, version, result)
+                if inspect.isawaitable(pushed):
+                    await pushed
+            except Exception as e:
+                logger.warning(f"Upgrade callback for {enrichment_id} failed: {e}")
+
+    async def _admit_upgrade(self, enrichment_id: str, slides: int):
+        """
+        Take an admission ticket for a background upgrade.
+
+        A shed upgrade waits Retry-After seconds and asks again; the draft
+        stays served meanwhile.
+
+        Returns:
+            The ticket, None without admission control, or False if the
+            upgrade was shed for longer than upgrade_max_defer (status
+            "failed")
+        """
+        if self.admission is None:
+            return None
+
+        deadline = time.monotonic() + self.upgrade_max_defer
+        while True:
+            decision = self.admission.try_admit(slides=slides)
+            if decision.admitted:
+                return decision.ticket
+            if time.monotonic() + decision.retry_after > deadline:
+                logger.warning(f"Upgrade of {enrichment_id} shed: {decision.reason} over limit")
+                self.enrichment_store.set_status(
+                    enrichment_id, "failed", error=f"upgrade shed: {decision.reason} over limit"
+                )
+                return False
+            logger.info(f"Upgrade of {enrichment_id} deferred {decision.retry_after}s: {decision.reason} over limit")
+            await asyncio.sleep(decision.retry_after)
+
+    def _count_flagged(self, api_results: Dict[str, Any], flag: str) -> int:
+        """Count results whose metadata has `flag` set (e.g. "speculative")."""
+        count = 0
+        for results in api_results.values():
+            text = results.get("text")
+            if text is not None and text.metadata.get(flag):
+                count += 1
+            for key in ("charts", "images", "diagrams"):
+                count += sum(1 for item in results.get(key, []) if item.metadata.get(flag))
+        return count
+
+    def _count_tiers(self, api_results: Dict[str, Any]) -> Dict[str, int]:
+        """Count results per fallback tier that produced them (metadata["tier"])."""
+        counts: Dict[str, int] = {}
+        for results in api_results.values():
+            items = [results["text"]] if results.get("text") is not None else []
+            for key in ("charts", "images", "diagrams"):
+                items.extend(results.get(key, []))
+            for item in items:
+                tier = item.metadata.get("tier")
+                if tier:
+                    counts[tier] = counts.get(tier, 0) + 1
+        return counts
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return runtime metrics of the orchestrator's components."""
+        return {
+            "dispatcher": self.api_dispatcher.get_metrics(),
+            "brownout": self.brownout.get_stats(),
+            "speculative_cache": self.speculative_cache.get_stats()
+        }
+
+    def _make_flow(self, tenant_id: Optional[str] = None, background: bool = False) -> Dict[str, Any]:
+        """
+        Build the fair-queueing flow stamped on a deck's requests.
+
+        Args:
+            tenant_id: Tenant sharing one flow (weight from FAIR_TENANT_WEIGHTS)
+            background: Batch/speculative work - weight × FAIR_BATCH_WEIGHT
+
+        Returns:
+            {"flow_id": str, "flow_weight": float}
+        """
+        if tenant_id:
+            flow_id = f"tenant:{tenant_id}"
+            weight = self.tenant_weights.get(tenant_id, 1.0)
+        else:
+            flow_id = f"{'batch' if background else 'deck'}:{uuid.uuid4().hex[:12]}"
+            weight = 1.0
+
+        if background:
+            weight *= self.batch_weight
+
+        return {"flow_id": flow_id, "flow_weight": weight}
+
+    def _make_schedule(
+        self,
+        strawman: PresentationStrawman,
+        priority: Optional[str] = None,
+        visible_slide_ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Resolve the priority mode of an enrichment.
+
+        Args:
+            strawman: Presentation strawman
+            priority: "makespan", "visible_first" or None (default mode)
+            visible_slide_ids: Slides on screen (implies visible_first)
+
+        Returns:
+            {"priority", "visible_slide_ids", "slide_priorities"}
+            (slide_priorities is None for makespan)
+        """
+        priority = priority or ("visible_first" if visible_slide_ids else self.priority_mode)
+        if priority not in PRIORITY_MODES:
+            raise ValueError(f"Unknown priority mode: {priority}")
+
+        slide_priorities = None
+        if priority == "visible_first":
+            deck_order = [s.slide_id for s in sorted(strawman.slides, key=lambda s: s.slide_number)]
+            slide_priorities = visible_first_priorities(deck_order, visible_slide_ids)
+
+        return {
+            "priority": priority,
+            "visible_slide_ids": list(visible_slide_ids or []),
+            "slide_priorities": slide_priorities
+        }
+
+    def _slide_timing(
+        self,
+        strawman: PresentationStrawman,
+        completed_at: Dict[str, float],
+        schedule: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Summarize when slides became ready.
+
+        The first slide is the one the user sees first: the first visible
+        slide if given, else the lowest slide_number.
+
+        Args:
+            strawman: Presentation strawman
+            completed_at: Seconds from start until each slide was ready
+            schedule: Priority mode from _make_schedule
+
+        Returns:
+            {"priority", "time_to_first_slide_seconds",
+             "time_to_visible_seconds" (visible_slide_ids only),
+             "time_to_nth_slide_seconds": [until 1, 2, ... slides ready],
+             "slide_completion_seconds": {slide_id: seconds}}
+        """
+        if not strawman.slides:
+            return {"priority": schedule["priority"]}
+
+        visible = [s for s in schedule["visible_slide_ids"] if s in completed_at]
+        first_slide = visible[0] if visible else min(strawman.slides, key=lambda s: s.slide_number).slide_id
+
+        timing = {
+            "priority": schedule["priority"],
+            "time_to_first_slide_seconds": round(completed_at[first_slide], 3),
+            "time_to_nth_slide_seconds": [round(t, 3) for t in sorted(completed_at.values())],
+            "slide_completion_seconds": {slide_id: round(t, 3) for slide_id, t in completed_at.items()}
+        }
+        if visible:
+            timing["time_to_visible_seconds"] = round(max(completed_at[s] for s in visible), 3)
+        return timing
+
+    def _resolve_layout_assignments(
+        self,
+        strawman: PresentationStrawman,
+        layout_assignments: Optional[List[LayoutAssignment]]
+    ) -> List[LayoutAssignment]:
+        """Default missing layout assignments and check they match the slides."""
+        # Create default layout assignments if not provided
+        if not layout_assignments:
+            layout_assignments = self._create_default_layout_assignments(strawman)
+            logger.info("Using default layout assignments (test mode)")
+
+        # Validate layout assignments match slides
+        if len(layout_assignments) != len(strawman.slides):
+            raise ValueError(
+                f"Layout assignments count ({len(layout_assignments)}) doesn't match "
+                f"slides count ({len(strawman.slides)})"
+            )
+
+        return layout_assignments
+
+    def _route_all_local(self, all_requests: Dict[str, List[Dict[str, Any]]]) -> int:
+        """Mark every request for the local tier (draft mode)."""
+        count = 0
+        for requests in all_requests.values():
+            for request in requests:
+                request["route"] = "local"
+                count += 1
+        return count
+
     def _build_all_requests(
         self,
         strawman: PresentationStrawman,
-        layout_assignments: List[LayoutAssignment]
+        layout_assignments: List[LayoutAssignment],
+        pruned: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         Build all API requests for all slides.
 
+        Uses the deck-level RequestCompiler: one shared presentation
+        context, fingerprints precomputed on every request, and requests
+        the slide's layout never reads are pruned.
+
         Args:
             strawman: Presentation strawman
             layout_assignments: Layout assignments
+            pruned: Optional list that receives pruned request records
 
         Returns:
             Dict of requests grouped by API type
         """
-        all_requests = {
-            "text": [],
-            "chart": [],
-            "image": [],
-            "diagram": []
-        }
+        all_requests = {api_type: [] for api_type in API_TYPES}
 
-        presentation_context = {
-            "overall_theme": strawman.overall_theme,
-            "target_audience": strawman.target_audience,
-            "main_title": strawman.main_title
-        }
+        for api_type, request in self.request_compiler.compile(
+            strawman,
+            layout_assignments,
+            pruned=pruned
+        ):
+            all_requests[api_type].append(request)
 
-        for slide, layout_assignment in zip(strawman.slides, layout_assignments):
-            slide_requests = self.request_builder.build_all_requests(
-                slide=slide,
-                layout_assignment=layout_assignment,
-                presentation_context=presentation_context
-            )
+        return all_requests
 
-            # Merge into all_requests
-            for api_type, requests in slide_requests.items():
-                all_requests[api_type].extend(requests)
+    def _post_process_slide(
+        self,
+        slide: Any,
+        layout_assignment: LayoutAssignment,
+        slide_results: Dict[str, Any]
+    ) -> Tuple[Any, ValidationStatus]:
+        """
+        Map a slide's results once, validate, and build its EnrichedSlide.
 
-        return all_requests
+        Args:
+            slide: Slide from the strawman
+            layout_assignment: Its layout assignment
+            slide_results: Dispatcher results for the slide
 
-    def _create_validation_report(self, enriched_slides: List[Any]) -> ValidationReport:
-        """Create overall validation report."""
-        total_slides = len(enriched_slides)
-        compliant_slides = sum(
-            1 for slide in enriched_slides if slide.validation_status.compliant
+        Returns:
+            (EnrichedSlide, ValidationStatus)
+        """
+        mapped_content = self.result_stitcher._map_to_layout(
+            slide=slide,
+            api_results=slide_results,
+            layout_id=layout_assignment.layout_id
         )
 
-        total_violations = sum(
-            len(slide.validation_status.violations) for slide in enriched_slides
+        validation_status = self.sla_validator.validate_slide(
+            content=mapped_content,
+            constraints=layout_assignment.constraints,
+            slide_id=slide.slide_id
         )
 
-        critical_violations = sum(
-            len([v for v in slide.validation_status.violations if v.severity == "critical"])
-            for slide in enriched_slides
+        enriched_slide = self.result_stitcher.build_enriched_slide(
+            slide=slide,
+            layout_assignment=layout_assignment,
+            mapped_content=mapped_content,
+            validation_status=validation_status
         )
 
-        return ValidationReport(
-            overall_compliant=(critical_violations == 0),
-            total_slides=total_slides,
-            compliant_slides=compliant_slides,
-            total_violations=total_violations,
-            critical_violations=critical_violations
-        )
+        return enriched_slide, validation_status
+
+    def _validate_and_stitch(
+        self,
+        strawman: PresentationStrawman,
+        layout_assignments: List[LayoutAssignment],
+        api_results: Dict[str, Any],
+        processed: Optional[Dict[str, Tuple[Any, ValidationStatus]]] = None
+    ) -> Tuple[List[Any], ValidationReport]:
+        """
+        Assemble enriched slides in deck order and build the report.
+
+        Slides already post-processed while the dispatch was in flight
+        are taken from `processed`; the rest (no API requests, or a failed
+        completion callback) are mapped, validated and stitched here.
+        Slides pair with layout assignments by position and find their
+        results by slide_id - O(n) overall.
+
+        Args:
+            strawman: Presentation strawman
+            layout_assignments: Layout assignments (same order as slides)
+            api_results: Dispatcher results by slide_id
+            processed: (EnrichedSlide, ValidationStatus) by slide_id
+
+        Returns:
+            (enriched_slides, validation_report)
+        """
+        processed = processed or {}
+        report = ValidationReportBuilder()
+        enriched_slides = []
+
+        for slide, layout_assignment in zip(strawman.slides, layout_assignments):
+            entry = processed.get(slide.slide_id)
+            if entry is None:
+                entry = self._post_process_slide(
+                    slide,
+                    layout_assignment,
+                    api_results.get(slide.slide_id) or empty_api_results()
+                )
+
+            enriched_slide, validation_status = entry
+            enriched_slides.append(enriched_slide)
+            report.add(validation_status)
+
+        return enriched_slides, report.build()
 
     def _create_generation_metadata(
         self,
         api_results: Dict[str, Any],
         processing_time: float,
-        total_requests: int
+        total_requests: int,
+        pruned_requests: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """Create generation metadata."""
         successful_items = 0
@@ -313,7 +975,9 @@ class ContentOrchestratorV2:
             "failures": failures,
             "orchestrator_version": "2.0",
             "architecture": "lightweight",
-            "total_api_requests": total_requests
+            "total_api_requests": total_requests,
+            "pruned_api_requests": len(pruned_requests or []),
+            "pruned_requests": pruned_requests or []
         }
 
     def _create_default_layout_assignments(
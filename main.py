@@ -7,21 +7,33 @@ Production-ready API for Railway deployment.
 This service provides a REST API for content orchestration with:
 - Health checks and status endpoints
 - Async presentation enrichment
+- Optional local asset serving (content-addressed, range + ETag support)
+- Draft-then-upgrade enrichment (versioned results, fetch or push)
+- Speculative pre-generation before layout assignment
+- Batch enrichment of many decks (collected or streamed as NDJSON)
+- Cancellation of abandoned requests when the client disconnects
+- Admission control (503 + Retry-After under overload)
 - Mock API clients (can be replaced with real clients)
 - Comprehensive error handling
 - CORS support for web clients
 """
 
+import asyncio
+import json
 import logging
 import os
+import re
 from contextlib import asynccontextmanager
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Literal
+from urllib.parse import urlsplit
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
+from starlette.background import BackgroundTask
 from dotenv import load_dotenv
+import httpx
 
 # Load environment variables
 load_dotenv()
@@ -39,6 +51,8 @@ from clients.real_text_client import RealTextClient  # Updated to use production
 from clients.real_image_client import RealImageClient  # Updated to use production service
 from clients.real_diagram_client import RealDiagramClient  # Updated to use production service
 from clients.real_chart_client import RealChartClient  # Updated to use production service
+from services.asset_store import AssetBlobStore, AssetLocalizer
+from services.admission_controller import AdmissionDecision, build_admission_controller
 
 # Import models
 from models.agents import PresentationStrawman, Slide
@@ -54,28 +68,52 @@ logger = logging.getLogger(__name__)
 # Global orchestrator instance
 orchestrator = None
 
+# Local asset store (None unless ASSET_LOCALIZATION_ENABLED=true)
+asset_store = None
+
+# Load shedding for enrichment endpoints (created with the orchestrator)
+admission = None
+
+ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
     # Startup
     logger.info("Starting Content Orchestrator v2.0 API")
-    global orchestrator
+    global orchestrator, asset_store, admission
 
     # Initialize API clients
     # All services now use production Railway deployment
-    text_client = RealTextClient()  # Uses TEXT_SERVICE_URL from .env
-    image_client = RealImageClient()  # Uses IMAGE_SERVICE_URL from .env
-    diagram_client = RealDiagramClient()  # Uses DIAGRAM_SERVICE_URL from .env
-    chart_client = RealChartClient()  # Uses CHART_SERVICE_URL from .env
+    text_client = RealTextClient()  # Uses TEXT_SERVICE_URL(S) from .env
+    image_client = RealImageClient()  # Uses IMAGE_SERVICE_URL(S) from .env
+    diagram_client = RealDiagramClient()  # Uses DIAGRAM_SERVICE_URL(S) from .env
+    chart_client = RealChartClient()  # Uses CHART_SERVICE_URL(S) from .env
+
+    # Optional: download generated assets once and serve them locally
+    asset_localizer = None
+    if os.getenv("ASSET_LOCALIZATION_ENABLED", "false").lower() == "true":
+        asset_store = AssetBlobStore(os.getenv("ASSET_STORE_DIR", "/tmp/content_orchestrator_assets"))
+        asset_localizer = AssetLocalizer(
+            store=asset_store,
+            public_base_url=os.getenv("ASSET_PUBLIC_BASE_URL", ""),
+            max_concurrency=int(os.getenv("ASSET_DOWNLOAD_CONCURRENCY", "16")),
+            timeout=float(os.getenv("ASSET_DOWNLOAD_TIMEOUT", "20"))
+        )
+        logger.info("Asset localization enabled")
 
     # Create orchestrator
     orchestrator = ContentOrchestratorV2(
         text_client=text_client,
         chart_client=chart_client,
         image_client=image_client,
-        diagram_client=diagram_client
+        diagram_client=diagram_client,
+        asset_localizer=asset_localizer
     )
+    admission = build_admission_controller(orchestrator.api_dispatcher.get_load)
+    # Draft upgrades hold their own ticket while they run
+    orchestrator.admission = admission
 
     logger.info("Content Orchestrator v2.0 initialized successfully")
 
@@ -83,6 +121,8 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down Content Orchestrator v2.0 API")
+    for client in (text_client, image_client, diagram_client, chart_client):
+        client.replicas.close()
 
 
 # Create FastAPI app
@@ -109,6 +149,24 @@ class EnrichPresentationRequest(BaseModel):
     strawman: PresentationStrawman
     layout_assignments: Optional[list[LayoutAssignment]] = None
     layout_specifications: Optional[Dict[str, Any]] = None
+    mode: Literal["full", "draft"] = Field(
+        default="full",
+        description="'full' or 'draft' (instant local deck, upgraded in the background)"
+    )
+    callback_url: Optional[str] = Field(
+        default=None,
+        description="Draft mode only: URL that receives upgraded versions via POST "
+                    "(host must be listed in UPGRADE_CALLBACK_HOSTS)"
+    )
+    priority: Optional[Literal["makespan", "visible_first"]] = Field(
+        default=None,
+        description="'makespan' (whole deck soonest) or 'visible_first' (slides in order, "
+                    "visible_slide_ids first); default PRIORITY_MODE"
+    )
+    visible_slide_ids: Optional[List[str]] = Field(
+        default=None,
+        description="Slides currently on screen, completed first (implies visible_first)"
+    )
 
     class Config:
         json_schema_extra = {
@@ -133,6 +191,27 @@ class EnrichPresentationRequest(BaseModel):
         }
 
 
+class BatchDeck(BaseModel):
+    """One presentation of a batch enrichment."""
+    strawman: PresentationStrawman
+    layout_assignments: Optional[list[LayoutAssignment]] = None
+    layout_specifications: Optional[Dict[str, Any]] = None
+
+
+class BatchEnrichRequest(BaseModel):
+    """Request model for batch enrichment."""
+    decks: List[BatchDeck]
+    stream: bool = Field(
+        default=False,
+        description="Stream one NDJSON line per deck as it completes"
+    )
+
+
+class SpeculateRequest(BaseModel):
+    """Request model for speculative pre-generation."""
+    strawman: PresentationStrawman
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
     status: str = Field(default="healthy")
@@ -140,6 +219,109 @@ class HealthResponse(BaseModel):
     orchestrator: str = Field(default="ready")
 
 
+def serialize_enriched_presentation(result) -> Dict[str, Any]:
+    """Convert an EnrichedPresentationStrawman to a JSON-ready dict."""
+    return {
+        "original_strawman": result.original_strawman.model_dump(),
+        "enriched_slides": [slide.model_dump() for slide in result.enriched_slides],
+        "validation_report": result.validation_report.model_dump(),
+        "generation_metadata": result.generation_metadata
+    }
+
+
+def _check_callback_url(callback_url: str) -> None:
+    """
+    Reject callback URLs outside the configured allowlist.
+
+    UPGRADE_CALLBACK_HOSTS lists the hosts (optionally host:port) the
+    server may POST upgrades to; empty disables callbacks. Without it any
+    caller could make the server send requests into internal networks.
+
+    Raises:
+        HTTPException: 422 if the URL is not an allowed http(s) URL
+    """
+    allowed = {host.strip().lower() for host in os.getenv("UPGRADE_CALLBACK_HOSTS", "").split(",") if host.strip()}
+    try:
+        parts = urlsplit(callback_url)
+        host = (parts.hostname or "").lower()
+        host_port = f"{host}:{parts.port}" if parts.port else host
+    except ValueError:
+        parts, host, host_port = None, "", ""
+
+    if parts is None or parts.scheme not in ("http", "https") or not host:
+        raise HTTPException(status_code=422, detail="callback_url must be an http(s) URL")
+    if host not in allowed and host_port not in allowed:
+        raise HTTPException(status_code=422, detail=f"callback_url host {host_port!r} is not allowed")
+
+
+def _make_upgrade_pusher(callback_url: str):
+    """Build an upgrade callback that POSTs each new version to callback_url."""
+    async def push(enrichment_id: str, version: int, result) -> None:
+        async with httpx.AsyncClient(timeout=float(os.getenv("UPGRADE_CALLBACK_TIMEOUT", "10"))) as http:
+            response = await http.post(callback_url, json={
+                "enrichment_id": enrichment_id,
+                "version": version,
+                "result": serialize_enriched_presentation(result)
+            })
+            response.raise_for_status()
+        logger.info(f"Pushed {enrichment_id} v{version} to {callback_url}")
+
+    return push
+
+
+# Non-standard status logged for requests abandoned by the client
+CLIENT_CLOSED_REQUEST = 499
+
+
+class ClientDisconnected(Exception):
+    """The client went away before the response was ready."""
+
+
+async def _run_until_disconnect(http_request: Request, coro):
+    """
+    Await coro, cancelling it if the client disconnects first.
+
+    The connection is checked every DISCONNECT_POLL_INTERVAL seconds.
+    Cancellation propagates through the orchestrator task tree: queued
+    calls are dropped, in-flight HTTP calls aborted, and chart/diagram
+    jobs cancelled where the service supports it.
+
+    Raises:
+        ClientDisconnected: If the client disconnected (coro cancelled)
+    """
+    interval = float(os.getenv("DISCONNECT_POLL_INTERVAL", "0.5"))
+    task = asyncio.ensure_future(coro)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=interval)
+            if done:
+                return task.result()
+            if await http_request.is_disconnected():
+                break
+    finally:
+        if not task.done():
+            task.cancel()
+
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    raise ClientDisconnected()
+
+
+def _shed_response(decision: AdmissionDecision) -> JSONResponse:
+    """503 for a request rejected by admission control."""
+    return JSONResponse(
+        status_code=503,
+        headers={"Retry-After": str(decision.retry_after)},
+        content={
+            "detail": f"Service overloaded ({decision.reason}), retry after {decision.retry_after}s",
+            "reason": decision.reason,
+            "retry_after": decision.retry_after
+        }
+    )
+
+
 # API Endpoints
 @app.get("/", response_class=JSONResponse)
 async def root():
@@ -164,7 +346,7 @@ async def health_check():
 
 
 @app.post("/api/v2/enrich", response_class=JSONResponse)
-async def enrich_presentation(request: EnrichPresentationRequest):
+async def enrich_presentation(request: EnrichPresentationRequest, http_request: Request):
     """
     Enrich a presentation strawman with generated content.
 
@@ -181,24 +363,33 @@ async def enrich_presentation(request: EnrichPresentationRequest):
             detail="Orchestrator not initialized"
         )
 
+    if request.callback_url:
+        if request.mode != "draft":
+            raise HTTPException(status_code=422, detail="callback_url requires mode 'draft'")
+        _check_callback_url(request.callback_url)
+
+    decision = admission.try_admit(slides=len(request.strawman.slides))
+    if not decision.admitted:
+        return _shed_response(decision)
+
     try:
         logger.info(f"Enriching presentation: {request.strawman.main_title}")
 
-        # Call orchestrator
-        result = await orchestrator.enrich_presentation(
+        # Call orchestrator (cancelled if the client goes away)
+        result = await _run_until_disconnect(http_request, orchestrator.enrich_presentation(
             strawman=request.strawman,
             layout_assignments=request.layout_assignments,
             layout_specifications=request.layout_specifications,
-            progress_callback=None  # Can add WebSocket support for progress
-        )
+            progress_callback=None,  # Can add WebSocket support for progress
+            mode=request.mode,
+            upgrade_callback=_make_upgrade_pusher(request.callback_url) if request.callback_url else None,
+            tenant_id=http_request.headers.get("X-Tenant-Id"),
+            priority=request.priority,
+            visible_slide_ids=request.visible_slide_ids
+        ))
 
         # Convert to dict for JSON response
-        response_data = {
-            "original_strawman": result.original_strawman.model_dump(),
-            "enriched_slides": [slide.model_dump() for slide in result.enriched_slides],
-            "validation_report": result.validation_report.model_dump(),
-            "generation_metadata": result.generation_metadata
-        }
+        response_data = serialize_enriched_presentation(result)
 
         logger.info(
             f"Enrichment complete: {result.validation_report.compliant_slides}/"
@@ -207,6 +398,13 @@ async def enrich_presentation(request: EnrichPresentationRequest):
 
         return JSONResponse(content=response_data)
 
+    except ClientDisconnected:
+        logger.warning(f"Client disconnected, enrichment cancelled: {request.strawman.main_title}")
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+
+    except ValueError:
+        raise  # invalid request options - 400 from value_error_handler
+
     except Exception as e:
         logger.error(f"Enrichment failed: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -214,6 +412,219 @@ async def enrich_presentation(request: EnrichPresentationRequest):
             detail=f"Enrichment failed: {str(e)}"
         )
 
+    finally:
+        admission.release(decision.ticket)
+
+
+@app.post("/api/v2/enrich/batch")
+async def enrich_batch(request: BatchEnrichRequest, http_request: Request):
+    """
+    Enrich many presentations in one call.
+
+    Decks share one dispatcher, the per-service connection pools and a
+    cross-deck deduplication table (identical component requests are
+    generated once). Results are per deck:
+    {"index", "status": "ok" | "error", "result" | "error"}
+
+    stream=false returns {"results": [...], "summary": {...}} in input
+    order; stream=true returns NDJSON lines in completion order.
+    """
+    if orchestrator is None:
+        raise HTTPException(status_code=503, detail="Orchestrator not initialized")
+
+    max_decks = int(os.getenv("BATCH_MAX_DECKS", "500"))
+    if len(request.decks) > max_decks:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {max_decks} decks")
+
+    decks = [
+        {
+            "strawman": deck.strawman,
+            "layout_assignments": deck.layout_assignments,
+            "layout_specifications": deck.layout_specifications
+        }
+        for deck in request.decks
+    ]
+    concurrency = int(os.getenv("BATCH_DECK_CONCURRENCY", "8"))
+    tenant_id = http_request.headers.get("X-Tenant-Id")
+
+    decision = admission.try_admit(
+        slides=sum(len(deck.strawman.slides) for deck in request.decks),
+        units=min(len(request.decks), concurrency)
+    )
+    if not decision.admitted:
+        return _shed_response(decision)
+
+    def deck_entry(index: int, result) -> Dict[str, Any]:
+        if isinstance(result, Exception):
+            return {"index": index, "status": "error", "error": str(result)}
+        return {"index": index, "status": "ok", "result": serialize_enriched_presentation(result)}
+
+    if request.stream:
+        async def lines():
+            try:
+                async for index, result in orchestrator.enrich_many_iter(decks, concurrency, tenant_id):
+                    yield json.dumps(deck_entry(index, result), default=str) + "\n"
+            finally:
+                # Client went away mid-stream
+                admission.release(decision.ticket)
+
+        # The background task also runs when the body is never iterated
+        # (release is idempotent)
+        return StreamingResponse(
+            lines(),
+            media_type="application/x-ndjson",
+            background=BackgroundTask(admission.release, decision.ticket)
+        )
+
+    try:
+        results = await _run_until_disconnect(
+            http_request, orchestrator.enrich_many(decks, concurrency, tenant_id)
+        )
+    except ClientDisconnected:
+        logger.warning(f"Client disconnected, batch of {len(decks)} decks cancelled")
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+    finally:
+        admission.release(decision.ticket)
+    entries = [deck_entry(index, result) for index, result in enumerate(results)]
+    failed = sum(1 for entry in entries if entry["status"] == "error")
+
+    return JSONResponse(content={
+        "results": entries,
+        "summary": {
+            "total_decks": len(entries),
+            "succeeded": len(entries) - failed,
+            "failed": failed,
+            "deduplicated_requests": sum(
+                entry["result"]["generation_metadata"].get("deduplicated_requests", 0)
+                for entry in entries if entry["status"] == "ok"
+            )
+        }
+    })
+
+
+@app.post("/api/v2/enrich/speculate", response_class=JSONResponse, status_code=202)
+async def speculate(request: SpeculateRequest, http_request: Request):
+    """
+    Start layout-independent generation for a strawman.
+
+    Call this as soon as the strawman exists; chart, image and diagram
+    generation overlaps with the Director's layout selection. The later
+    /api/v2/enrich call with the real layout_assignments attaches to the
+    in-flight or finished results.
+    """
+    if orchestrator is None:
+        raise HTTPException(status_code=503, detail="Orchestrator not initialized")
+
+    # Speculation is optional work - skip it whenever the queues are over
+    # their limits (no ticket held: its calls outlive this request)
+    decision = admission.try_admit(slides=len(request.strawman.slides), units=0)
+    if not decision.admitted:
+        return _shed_response(decision)
+
+    summary = await orchestrator.speculate(request.strawman, tenant_id=http_request.headers.get("X-Tenant-Id"))
+    return JSONResponse(status_code=202, content=summary)
+
+
+@app.get("/api/v2/enrich/{enrichment_id}", response_class=JSONResponse)
+async def get_enrichment(enrichment_id: str, since_version: int = 0, wait: float = 0.0):
+    """
+    Fetch the latest version of a draft enrichment.
+
+    Args:
+        since_version: Version the caller already has
+        wait: Long-poll up to this many seconds (max 60) for a newer version
+
+    Returns:
+        {"enrichment_id", "version", "status", "error", "eta", "result"} -
+        eta is the live estimate while upgrading ({"eta_seconds",
+        "estimated_completion", ...}, else null); result is null when
+        nothing newer than since_version is available
+    """
+    if orchestrator is None:
+        raise HTTPException(status_code=503, detail="Orchestrator not initialized")
+
+    store = orchestrator.enrichment_store
+    if wait > 0:
+        entry = await store.wait_for_update(enrichment_id, since_version, min(wait, 60.0))
+    else:
+        entry = store.get(enrichment_id)
+
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Enrichment not found")
+
+    newer = entry["version"] > since_version and entry["result"] is not None
+
+    return {
+        "enrichment_id": enrichment_id,
+        "version": entry["version"],
+        "status": entry["status"],
+        "error": entry["error"],
+        "eta": entry["eta"].snapshot() if entry.get("eta") is not None else None,
+        "result": serialize_enriched_presentation(entry["result"]) if newer else None
+    }
+
+
+@app.get("/api/v2/assets/{digest}")
+async def get_asset(digest: str, request: Request):
+    """
+    Serve a localized asset from the content-addressed blob store.
+
+    Supports single byte ranges (206), ETag revalidation (304) and
+    immutable long-lived caching - the digest never changes content.
+    """
+    if asset_store is None:
+        raise HTTPException(status_code=404, detail="Asset not found")
+
+    # Blob store reads are file I/O - keep them off the event loop
+    loop = asyncio.get_running_loop()
+    info = await loop.run_in_executor(None, asset_store.get_info, digest)
+    if info is None:
+        raise HTTPException(status_code=404, detail="Asset not found")
+
+    etag = f'"{digest}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": ASSET_CACHE_CONTROL,
+        "Accept-Ranges": "bytes"
+    }
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+
+    size = info["size"]
+    start, end = 0, size - 1
+    status_code = 200
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range.strip() == etag):
+        match = re.fullmatch(r"bytes=(\d*)-(\d*)", range_header.strip())
+        if not match or (not match.group(1) and not match.group(2)):
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+
+        if match.group(1):
+            start = int(match.group(1))
+            end = min(int(match.group(2)), size - 1) if match.group(2) else size - 1
+        else:
+            # Suffix range: last N bytes
+            start = max(size - int(match.group(2)), 0)
+
+        if start >= size or start > end:
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+
+        status_code = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    body = await loop.run_in_executor(None, asset_store.read_range, digest, start, end) if size else b""
+
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type=info["content_type"],
+        headers=headers
+    )
+
 
 @app.get("/api/v2/status", response_class=JSONResponse)
 async def get_status():
@@ -239,6 +650,15 @@ async def get_status():
     }
 
 
+@app.get("/api/v2/metrics", response_class=JSONResponse)
+async def get_metrics():
+    """Runtime metrics: admission control, request coalescing, fair queueing, speculative cache."""
+    if orchestrator is None:
+        raise HTTPException(status_code=503, detail="Orchestrator not initialized")
+
+    return {"admission": admission.get_stats(), **orchestrator.get_metrics()}
+
+
 # Error handlers
 @app.exception_handler(ValueError)
 async def value_error_handler(request, exc):
@@ -0,0 +1,238 @@
+"""
+Admission Controller - v2.0
+============================
+
+Load shedding for enrichment requests.
+
+Every enrichment is admitted or rejected up front from three signals:
+- in-flight enrichments (decks being enriched right now)
+- dispatcher queue depth (remote calls waiting for a service slot)
+- estimated queueing delay (backlog × average call time / slots)
+
+When any signal is over its limit the request is rejected with 503 and
+a Retry-After of the expected time until that signal is back under its
+limit, instead of being accepted into a queue where it - and everyone
+admitted before it - would time out. Small decks (at most
+ADMISSION_SMALL_DECK_SLIDES slides) are always admitted: they add little
+load and are usually interactive.
+
+Configuration:
+- ADMISSION_CONTROL=false disables shedding (everything admitted)
+- ADMISSION_MAX_IN_FLIGHT: concurrent enrichments (default 64)
+- ADMISSION_MAX_QUEUE_DEPTH: queued remote calls (default 1000)
+- ADMISSION_MAX_QUEUE_DELAY: expected queueing seconds (default 20)
+- ADMISSION_SMALL_DECK_SLIDES: always-admitted deck size (default 3)
+
+Performance: O(services) per decision, no locks (event loop only)
+"""
+
+import logging
+import math
+import os
+import time
+from typing import Dict, Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Smoothing of the average enrichment duration (Retry-After estimate)
+DURATION_ALPHA = 0.2
+
+MAX_RETRY_AFTER_SECONDS = 300
+
+
+class AdmissionTicket:
+    """An admitted request; pass back to release() when it finishes."""
+
+    def __init__(self, units: int, exempt: bool):
+        self.units = units
+        self.exempt = exempt
+        self.started = time.monotonic()
+        self.released = False
+
+
+class AdmissionDecision:
+    """Outcome of AdmissionController.try_admit()."""
+
+    def __init__(
+        self,
+        ticket: Optional[AdmissionTicket] = None,
+        reason: Optional[str] = None,
+        retry_after: int = 0
+    ):
+        self.ticket = ticket
+        self.reason = reason
+        self.retry_after = retry_after
+
+    @property
+    def admitted(self) -> bool:
+        return self.ticket is not None
+
+
+class AdmissionController:
+    """
+    Admit or shed enrichment requests based on current load.
+
+    Usage:
+        decision = controller.try_admit(slides=len(strawman.slides))
+        if not decision.admitted:
+            return 503 with Retry-After: decision.retry_after
+        try:
+            ...
+        finally:
+            controller.release(decision.ticket)
+    """
+
+    def __init__(
+        self,
+        load_fn: Callable[[], Dict[str, Any]],
+        max_in_flight: int = 64,
+        max_queue_depth: int = 1000,
+        max_queue_delay: float = 20.0,
+        small_deck_slides: int = 3,
+        enabled: bool = True
+    ):
+        """
+        Initialize controller.
+
+        Args:
+            load_fn: Returns {"queue_depth", "queue_delay_seconds"}
+                (APIDispatcher.get_load)
+            max_in_flight: Concurrent enrichments (batch decks count each)
+            max_queue_depth: Remote calls waiting for a service slot
+            max_queue_delay: Expected seconds a new call would queue
+            small_deck_slides: Decks up to this size are never shed
+            enabled: False admits everything (signals still reported)
+        """
+        self.load_fn = load_fn
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_queue_depth = max_queue_depth
+        self.max_queue_delay = max_queue_delay
+        self.small_deck_slides = small_deck_slides
+        self.enabled = enabled
+
+        self.in_flight = 0
+        # EWMA of seconds per admitted enrichment (None until one finishes)
+        self.avg_duration_seconds: Optional[float] = None
+
+        self.stats = {
+            "admitted": 0,
+            "admitted_small": 0,
+            "shed": 0,
+            "shed_in_flight": 0,
+            "shed_queue_depth": 0,
+            "shed_queue_delay": 0
+        }
+
+    def try_admit(self, slides: int, units: int = 1) -> AdmissionDecision:
+        """
+        Admit a request or say when to retry.
+
+        Args:
+            slides: Slides to enrich (total across decks for a batch)
+            units: Enrichments the request runs concurrently (decks)
+
+        Returns:
+            AdmissionDecision (ticket set if admitted, else reason and
+            retry_after seconds)
+        """
+        units = min(units, self.max_in_flight)
+        exempt = units == 1 and slides <= self.small_deck_slides
+        if self.enabled and not exempt:
+            reason, retry_after = self._over_limit(units)
+            if reason is not None:
+                self.stats["shed"] += 1
+                self.stats[f"shed_{reason}"] += 1
+                logger.warning(
+                    f"Shedding request ({slides} slides): {reason} over limit, "
+                    f"retry after {retry_after}s"
+                )
+                return AdmissionDecision(reason=reason, retry_after=retry_after)
+
+        self.in_flight += units
+        self.stats["admitted"] += 1
+        if exempt:
+            self.stats["admitted_small"] += 1
+        return AdmissionDecision(ticket=AdmissionTicket(units, exempt))
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """Mark an admitted request finished (a second release is a no-op)."""
+        if ticket.released:
+            return
+        ticket.released = True
+        self.in_flight -= ticket.units
+        if ticket.units != 1:
+            return  # batch durations say little about one enrichment
+
+        duration = time.monotonic() - ticket.started
+        if self.avg_duration_seconds is None:
+            self.avg_duration_seconds = duration
+        else:
+            self.avg_duration_seconds += DURATION_ALPHA * (duration - self.avg_duration_seconds)
+
+    def _over_limit(self, units: int):
+        """
+        Check the signals.
+
+        Returns:
+            (reason, retry_after seconds) for the first signal over its
+            limit, or (None, 0)
+        """
+        if self.in_flight + units > self.max_in_flight:
+            # Enough running enrichments must finish; they run
+            # max_in_flight at a time at the average duration
+            excess = self.in_flight + units - self.max_in_flight
+            duration = self.avg_duration_seconds or 1.0
+            return "in_flight", self._retry_after(duration * excess / self.max_in_flight)
+
+        load = self.load_fn()
+        depth = load.get("queue_depth", 0)
+        delay = load.get("queue_delay_seconds", 0.0)
+
+        if depth > self.max_queue_depth:
+            # The excess drains at the same rate as the whole queue
+            return "queue_depth", self._retry_after(delay * (depth - self.max_queue_depth) / depth)
+
+        if delay > self.max_queue_delay:
+            return "queue_delay", self._retry_after(delay - self.max_queue_delay)
+
+        return None, 0
+
+    @staticmethod
+    def _retry_after(seconds: float) -> int:
+        return int(min(MAX_RETRY_AFTER_SECONDS, max(1, math.ceil(seconds))))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return limits, current signals and shed counts."""
+        load = self.load_fn()
+        return {
+            "enabled": self.enabled,
+            "limits": {
+                "max_in_flight": self.max_in_flight,
+                "max_queue_depth": self.max_queue_depth,
+                "max_queue_delay_seconds": self.max_queue_delay,
+                "small_deck_slides": self.small_deck_slides
+            },
+            "in_flight": self.in_flight,
+            "queue_depth": load.get("queue_depth", 0),
+            "queue_delay_seconds": round(load.get("queue_delay_seconds", 0.0), 3),
+            "avg_duration_seconds": round(self.avg_duration_seconds or 0.0, 3),
+            **self.stats
+        }
+
+
+def build_admission_controller(load_fn: Callable[[], Dict[str, Any]]) -> AdmissionController:
+    """Create an AdmissionController from environment variables."""
+    controller = AdmissionController(
+        load_fn=load_fn,
+        max_in_flight=int(os.getenv("ADMISSION_MAX_IN_FLIGHT", "64")),
+        max_queue_depth=int(os.getenv("ADMISSION_MAX_QUEUE_DEPTH", "1000")),
+        max_queue_delay=float(os.getenv("ADMISSION_MAX_QUEUE_DELAY", "20")),
+        small_deck_slides=int(os.getenv("ADMISSION_SMALL_DECK_SLIDES", "3")),
+        enabled=os.getenv("ADMISSION_CONTROL", "true").lower() == "true"
+    )
+    logger.info(
+        f"Admission control {'enabled' if controller.enabled else 'disabled'} "
+        f"(in-flight {controller.max_in_flight}, queue depth {controller.max_queue_depth}, "
+        f"queue delay {controller.max_queue_delay}s)"
+    )
+    return controller
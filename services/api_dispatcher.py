@@ -4,33 +4,90 @@ API Dispatcher - v2.0
 
 Parallel API execution with progress streaming.
 
-This service orchestrates parallel API calls using asyncio.gather().
-All APIs are called simultaneously for maximum performance.
+This service orchestrates parallel API calls. Requests run as a
+dependency DAG (DAGScheduler); without dependency rules all APIs are
+called simultaneously for maximum performance.
 
 Performance target: <10s for 10 slides (all APIs in parallel)
 """
 
 import asyncio
 import logging
+import os
 import time
 from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime
 
+from clients.replica_pool import tracking_replicas
+from services.dag_scheduler import DAGScheduler
+from services.deck_eta import DeckETA
+from services.fair_scheduler import FairScheduler, build_service_schedulers
+from services.fallback_chain import FallbackChain, Tier, build_fallback_chain
+from services.local_generators import placeholder_result
+from services.micro_batcher import MicroBatcher, build_micro_batchers
+from services.latency_model import LatencyModel
+from services.timeout_tuner import AdaptiveTimeoutError, TimeoutTuner, build_timeout_tuner
+
 logger = logging.getLogger(__name__)
 
 
+def _cancel_requested() -> bool:
+    """True if the current task itself is being cancelled (Python 3.11+)."""
+    task = asyncio.current_task()
+    return bool(task is not None and hasattr(task, "cancelling") and task.cancelling())
+
+
 class APIDispatcher:
     """
     Dispatches API requests in parallel with progress streaming.
 
     Key features:
-    - Parallel execution using asyncio.gather()
+    - Parallel execution scheduled as a dependency DAG (DAGScheduler);
+      without dependency rules every request starts at once
     - Real-time progress callbacks
     - Error handling with partial results
     - Automatic retry on transient failures
+    - Local tier: requests marked route="local" go to in-process generators
+    - Per-slide completion callbacks (post-process a slide while others
+      are still in flight)
+    - Speculative tier: attaches to generations started before the layout
+      was known (see SpeculativeCache)
+    - Batch deduplication: decks of one enrich_many() batch share a
+      fingerprint → result table, so identical requests run once
+    - Singleflight coalescing: concurrent identical requests from any
+      decks share one in-flight call (no result retention - not a cache)
+    - Weighted fair queueing: per-service slots shared fairly between
+      flows (request["flow_id"] - tenant or presentation)
+    - Micro-batching: calls to clients with a batch endpoint are
+      collected across slides and decks into batch requests
+    - Latency learning: every remote call's duration feeds the
+      LatencyModel used for longest-expected-job-first ordering
+    - Live ETA: a DeckETA per dispatch predicts when each call and the
+      deck will finish; progress events report it
+    - Adaptive timeouts (opt-in): remote calls are cut off at their
+      service's learned p99.9 plus margin (TimeoutTuner) and fall back
+      to the local tier
+    - Fallback chain (opt-in): cache → remote → secondary replica → local
+      → placeholder within a per-service latency budget (FallbackChain);
+      every item records the tier that produced it in metadata["tier"]
     """
 
-    def __init__(self, text_client, chart_client, image_client, diagram_client):
+    def __init__(
+        self,
+        text_client,
+        chart_client,
+        image_client,
+        diagram_client,
+        local_clients: Optional[Dict[str, Any]] = None,
+        speculative_cache=None,
+        scheduler: Optional[DAGScheduler] = None,
+        coalesce: Optional[bool] = None,
+        fair_schedulers: Optional[Dict[str, FairScheduler]] = None,
+        micro_batchers: Optional[Dict[str, MicroBatcher]] = None,
+        latency_model: Optional[LatencyModel] = None,
+        timeouts: Optional[TimeoutTuner] = None,
+        fallback_chain: Optional[FallbackChain] = None
+    ):
         """
         Initialize dispatcher with API clients.
 
@@ -39,17 +96,76 @@ class APIDispatcher:
             chart_client: Chart generation API client
             image_client: Image generation API client
             diagram_client: Diagram generation API client
+            local_clients: Optional in-process clients by API type
+                (used for requests with route="local")
+            speculative_cache: Optional SpeculativeCache checked before
+                calling a remote client
+            scheduler: DAGScheduler ordering the requests (default: no
+                dependencies, everything in parallel)
+            coalesce: Share in-flight calls between identical concurrent
+                requests (default: REQUEST_COALESCING env var, true)
+            fair_schedulers: FairScheduler per API type limiting concurrent
+                remote calls (default: from env, see fair_scheduler)
+            micro_batchers: MicroBatcher per API type (default: one for
+                each client with supports_batch, see micro_batcher)
+            latency_model: Learns call latencies per service and subtype
+                (default: a new LatencyModel)
+            timeouts: Adaptive per-service timeouts (default: from
+                ADAPTIVE_TIMEOUT* env vars, off unless ADAPTIVE_TIMEOUTS=true)
+            fallback_chain: Tiers tried per request (default: from env,
+                off unless FALLBACK_CHAIN=true)
         """
         self.text_client = text_client
         self.chart_client = chart_client
         self.image_client = image_client
         self.diagram_client = diagram_client
-        logger.info("APIDispatcher initialized with 4 API clients")
+        self.local_clients = local_clients or {}
+        self.speculative_cache = speculative_cache
+        self.scheduler = scheduler or DAGScheduler()
+        if coalesce is None:
+            coalesce = os.getenv("REQUEST_COALESCING", "true").lower() == "true"
+        self.coalesce = coalesce
+
+        if fair_schedulers is None:
+            fair_schedulers = build_service_schedulers()
+        self.fair_schedulers = fair_schedulers or {}
+
+        if micro_batchers is None:
+            micro_batchers = build_micro_batchers({
+                "text": text_client,
+                "chart": chart_client,
+                "image": image_client,
+                "diagram": diagram_client
+            })
+        self.micro_batchers = micro_batchers
+        self.latency_model = latency_model or LatencyModel.from_env()
+        self.timeouts = timeouts or build_timeout_tuner(self.latency_model)
+        self.fallback_chain = fallback_chain or build_fallback_chain()
+
+        # Singleflight table: fingerprint → future of the leader's call
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.coalesce_stats = {"leaders": 0, "coalesced": 0, "leader_failures": 0}
+
+        # Work thrown away by dispatches cancelled before they finished
+        self.abandoned_stats = {
+            "abandoned_dispatches": 0,
+            "completed_calls": 0,
+            "cancelled_calls": 0,
+            "call_seconds": 0.0
+        }
+
+        logger.info(
+            f"APIDispatcher initialized with 4 API clients "
+            f"(local tier: {sorted(self.local_clients) or 'none'}, coalescing: {self.coalesce})"
+        )
 
     async def dispatch_all(
         self,
         all_requests: Dict[str, List[Dict[str, Any]]],
-        progress_callback: Optional[Callable[[str, int, int], None]] = None
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        on_slide_complete: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        shared_results: Optional[Dict[str, asyncio.Future]] = None,
+        eta: Optional[DeckETA] = None
     ) -> Dict[str, Any]:
         """
         Dispatch all API requests in parallel.
@@ -65,6 +181,11 @@ class APIDispatcher:
                     "diagram": [req1, req2, ...]
                 }
             progress_callback: Optional callback(message, current, total)
+            on_slide_complete: Optional callback(slide_id, slide_results),
+                called as soon as all requests of a slide have finished
+            shared_results: Optional fingerprint → future table shared by
+                several dispatches (batch deduplication)
+            eta: DeckETA to keep updated (default: a new one)
 
         Returns:
             Dict with results grouped by slide_id:
@@ -80,32 +201,55 @@ class APIDispatcher:
         """
         start_time = time.time()
 
-        # Flatten all requests into a single list with metadata
-        tasks = []
-        task_metadata = []
+        # Outstanding requests per slide, for completion callbacks
+        remaining: Dict[str, int] = {}
+        grouped: Dict[str, Any] = {}
 
-        for api_type, requests in all_requests.items():
+        for requests in all_requests.values():
             for req in requests:
-                # Create coroutine for this request
-                task = self._dispatch_single(api_type, req, progress_callback)
-                tasks.append(task)
-                task_metadata.append({
-                    "api_type": api_type,
-                    "slide_id": req.get("slide_id"),
-                    "slide_number": req.get("slide_number")
-                })
-
-        total_tasks = len(tasks)
+                slide_id = req.get("slide_id")
+                remaining[slide_id] = remaining.get(slide_id, 0) + 1
+
+        total_tasks = sum(remaining.values())
         logger.info(f"Dispatching {total_tasks} API requests in parallel")
 
         if progress_callback:
             progress_callback(f"Starting {total_tasks} parallel API calls", 0, total_tasks)
 
-        # Execute all tasks in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        call_seconds = [0.0]
+        eta = eta or DeckETA(self.latency_model)
 
-        # Group results by slide_id
-        grouped_results = self._group_results_by_slide(results, task_metadata)
+        async def execute(api_type: str, req: Dict[str, Any]) -> Dict[str, Any]:
+            meta = {
+                "api_type": api_type,
+                "slide_id": req.get("slide_id"),
+                "slide_number": req.get("slide_number")
+            }
+            started = time.time()
+            key = eta.start(api_type, req, self._expected_wait(api_type, req))
+            try:
+                outcome = await self._dispatch_tracked(
+                    api_type, req, meta, grouped, remaining, progress_callback, on_slide_complete, shared_results
+                )
+            finally:
+                eta.finish(key)
+                call_seconds[0] += time.time() - started
+
+            if progress_callback:
+                progress_callback(
+                    f"Completed {eta.calls_done}/{total_tasks} API calls, ETA {eta.eta_seconds():.0f}s",
+                    eta.calls_done,
+                    total_tasks
+                )
+            return outcome
+
+        # Each request starts as soon as its dependencies (if any) are done;
+        # results are grouped as they arrive
+        try:
+            await self.scheduler.run(all_requests, execute)
+        except asyncio.CancelledError:
+            self._record_abandoned(total_tasks, sum(remaining.values()), call_seconds[0], start_time)
+            raise
 
         elapsed_time = time.time() - start_time
         logger.info(f"All {total_tasks} API calls completed in {elapsed_time:.2f}s")
@@ -113,13 +257,52 @@ class APIDispatcher:
         if progress_callback:
             progress_callback(f"Completed {total_tasks} API calls", total_tasks, total_tasks)
 
-        return grouped_results
+        return grouped
+
+    async def _dispatch_tracked(
+        self,
+        api_type: str,
+        request: Dict[str, Any],
+        meta: Dict[str, Any],
+        grouped: Dict[str, Any],
+        remaining: Dict[str, int],
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        on_slide_complete: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        shared_results: Optional[Dict[str, asyncio.Future]] = None
+    ) -> Any:
+        """
+        Dispatch one request, group its result, and signal slide completion.
+
+        When the last outstanding request of a slide finishes,
+        on_slide_complete(slide_id, slide_results) runs immediately - while
+        other slides are still waiting on I/O.
+
+        Returns:
+            Result dict from _dispatch_single (or the exception it raised)
+        """
+        try:
+            result = await self._dispatch_single(api_type, request, progress_callback, shared_results)
+        except Exception as e:
+            result = e
+
+        self._record_result(grouped, result, meta)
+
+        slide_id = meta["slide_id"]
+        remaining[slide_id] -= 1
+        if remaining[slide_id] == 0 and on_slide_complete:
+            try:
+                on_slide_complete(slide_id, grouped[slide_id])
+            except Exception as e:
+                logger.error(f"Post-processing failed for slide {slide_id}: {e}", exc_info=True)
+
+        return result
 
     async def _dispatch_single(
         self,
         api_type: str,
         request: Dict[str, Any],
-        progress_callback: Optional[Callable[[str, int, int], None]] = None
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        shared_results: Optional[Dict[str, asyncio.Future]] = None
     ) -> Dict[str, Any]:
         """
         Dispatch a single API request with error handling.
@@ -128,6 +311,7 @@ class APIDispatcher:
             api_type: Type of API ("text", "chart", "image", "diagram")
             request: Request dict
             progress_callback: Optional progress callback
+            shared_results: Optional fingerprint → future table (batch dedup)
 
         Returns:
             Result dict with metadata
@@ -139,17 +323,10 @@ class APIDispatcher:
             progress_callback(f"Calling {api_type} API for slide {slide_number}", 0, 1)
 
         try:
-            # Route to appropriate API client
-            if api_type == "text":
-                result = await self.text_client.generate(request)
-            elif api_type == "chart":
-                result = await self.chart_client.generate(request)
-            elif api_type == "image":
-                result = await self.image_client.generate(request)
-            elif api_type == "diagram":
-                result = await self.diagram_client.generate(request)
-            else:
-                raise ValueError(f"Unknown API type: {api_type}")
+            with tracking_replicas():
+                result = await self.fallback_chain.run(
+                    api_type, request, self._fallback_tiers(api_type, request, shared_results)
+                )
 
             logger.info(f"Successfully generated {api_type} for slide {slide_number}")
 
@@ -174,6 +351,380 @@ class APIDispatcher:
                 "error": str(e)
             }
 
+    def _fallback_tiers(
+        self,
+        api_type: str,
+        request: Dict[str, Any],
+        shared_results: Optional[Dict[str, asyncio.Future]] = None
+    ) -> List[Tier]:
+        """
+        Tiers that can serve a request, in fallback order.
+
+        Local-route requests start at the local tier. With the chain
+        disabled only the primary tiers are listed. A finished speculative
+        generation is the cache tier; one still running is this request's
+        remote call and is awaited as the remote tier, so a cut-off cache
+        slice never starts a duplicate generation next to it.
+        """
+        local_client = self.local_clients.get(api_type)
+        if request.get("route") == "local" and local_client is not None:
+            tiers = [("local", lambda: local_client.generate(request))]
+        else:
+            tiers = []
+            speculative = None
+            if request.get("route") != "local" and self.speculative_cache is not None:
+                speculative = self.speculative_cache.lookup(api_type, request)
+
+            if speculative is None:
+                tiers.append(("remote", lambda: self._generate_shared(api_type, request, shared_results)))
+            elif speculative.done():
+                tiers.append(("cache", lambda: self._attach_speculative(api_type, request, speculative)))
+                tiers.append(("remote", lambda: self._generate_shared(api_type, request, shared_results)))
+            else:
+                tiers.append((
+                    "remote",
+                    lambda: self._generate_after_speculative(api_type, request, speculative, shared_results)
+                ))
+            if self.fallback_chain.enabled:
+                if len(getattr(getattr(self._client(api_type), "replicas", None), "urls", ())) > 1:
+                    tiers.append(("secondary", lambda: self._call_remote(api_type, request, batch=False)))
+                if local_client is not None:
+                    tiers.append(("local", lambda: local_client.generate(request)))
+
+        if self.fallback_chain.enabled:
+            tiers.append(("placeholder", lambda: self._placeholder(api_type, request)))
+        return tiers
+
+    async def _placeholder(self, api_type: str, request: Dict[str, Any]) -> Any:
+        """Last tier: a placeholder built from the request."""
+        return placeholder_result(api_type, request)
+
+    async def call_client(self, api_type: str, request: Dict[str, Any]) -> Any:
+        """
+        Route a request to its client and generate.
+
+        Args:
+            api_type: Type of API ("text", "chart", "image", "diagram")
+            request: Request dict (route="local" selects the local tier;
+                flow_id/flow_weight select the fair-queueing flow;
+                priority - visible_first - or else expected_seconds
+                orders it within the flow)
+
+        Returns:
+            Generated model from the client (from the local tier, with
+            metadata["timeout_fallback"] set, if the adaptive timeout fired)
+        """
+        if request.get("route") == "local" and api_type in self.local_clients:
+            return await self.local_clients[api_type].generate(request)
+
+        try:
+            return await self._call_remote(api_type, request)
+        except AdaptiveTimeoutError as e:
+            local_client = self.local_clients.get(api_type)
+            if local_client is None:
+                raise
+            logger.warning(f"{e} - falling back to local {api_type} for slide {request.get('slide_number', '?')}")
+            result = await local_client.generate(request)
+            result.metadata["timeout_fallback"] = True
+            return result
+
+    def _client(self, api_type: str) -> Any:
+        """Return the remote client for an API type."""
+        if api_type == "text":
+            return self.text_client
+        elif api_type == "chart":
+            return self.chart_client
+        elif api_type == "image":
+            return self.image_client
+        elif api_type == "diagram":
+            return self.diagram_client
+        raise ValueError(f"Unknown API type: {api_type}")
+
+    async def _call_remote(self, api_type: str, request: Dict[str, Any], batch: bool = True) -> Any:
+        """
+        Call the remote client through its batcher and fair-queueing slot.
+
+        Args:
+            batch: Go through the micro-batcher if there is one (False for
+                calls that must pick their own replica)
+        """
+        client = self._client(api_type)
+
+        # The batcher sees the same calls the fair scheduler admitted,
+        # so slots keep counting items in flight, batched or not
+        batcher = self.micro_batchers.get(api_type) if batch else None
+        generate = batcher.submit if batcher is not None else client.generate
+
+        scheduler = self.fair_schedulers.get(api_type)
+        if scheduler is None:
+            return await self._timed_generate(generate, api_type, request)
+
+        async with scheduler.slot(
+            request.get("flow_id", "default"),
+            request.get("flow_weight", 1.0),
+            priority=request.get("priority", request.get("expected_seconds", 0.0))
+        ):
+            return await self._timed_generate(generate, api_type, request)
+
+    async def _timed_generate(self, generate: Callable, api_type: str, request: Dict[str, Any]) -> Any:
+        """
+        Generate within the adaptive timeout and record the call's latency.
+
+        Successful calls record their latency; calls cut off by the
+        timeout record the timeout in the quantile sketch only (their
+        latency is at least that) and leave the EWMA estimate alone.
+
+        The timeout frees the fair-queueing slot at once. A client running
+        on a ServiceTransport keeps its bulkhead thread until the abort of
+        the cancelled call lands (its socket is shut down).
+
+        Raises:
+            AdaptiveTimeoutError: If the adaptive timeout fired
+        """
+        timeout = self.timeouts.timeout_for(api_type)
+        started = time.monotonic()
+        if timeout is None:
+            result = await generate(request)
+        else:
+            try:
+                result = await asyncio.wait_for(generate(request), timeout)
+            except asyncio.TimeoutError:
+                if time.monotonic() - started < timeout:
+                    raise  # the client's own timeout, not ours
+                self.latency_model.observe_timeout(api_type, request, timeout)
+                self.timeouts.record_timeout(api_type)
+                raise AdaptiveTimeoutError(f"{api_type} call exceeded adaptive timeout of {timeout:.1f}s")
+        self.latency_model.observe(api_type, request, time.monotonic() - started)
+        return result
+
+    async def _generate_shared(
+        self,
+        api_type: str,
+        request: Dict[str, Any],
+        shared_results: Optional[Dict[str, asyncio.Future]] = None
+    ) -> Any:
+        """
+        Generate via the client, once per fingerprint within shared_results.
+
+        The first request for a fingerprint generates and publishes its
+        outcome in the table; later identical requests await it and get a
+        private copy (metadata["deduplicated"] set). Local-tier requests
+        are cheap and always generated directly.
+        """
+        fingerprint = request.get("fingerprint")
+        if shared_results is None or not fingerprint or request.get("route") == "local":
+            return await self._call_coalesced(api_type, request)
+
+        shared = shared_results.get(fingerprint)
+        if shared is not None:
+            result = await asyncio.shield(shared)
+            result = result.model_copy(deep=True)
+            result.metadata["deduplicated"] = True
+            return result
+
+        shared = asyncio.get_running_loop().create_future()
+        shared_results[fingerprint] = shared
+        try:
+            result = await self._call_coalesced(api_type, request)
+        except BaseException as e:
+            # Failures are not shared - the next duplicate retries
+            shared_results.pop(fingerprint, None)
+            if isinstance(e, Exception):
+                shared.set_exception(e)
+                shared.exception()  # waiters re-raise; mark retrieved
+            else:
+                shared.cancel()
+            raise
+
+        shared.set_result(result)
+        return result
+
+    async def _call_coalesced(self, api_type: str, request: Dict[str, Any]) -> Any:
+        """
+        Call the client, sharing the call with identical in-flight requests.
+
+        The first request for a fingerprint becomes the leader and calls
+        the client; requests with the same fingerprint arriving while it
+        is in flight await the leader's future and get a private copy
+        (metadata["coalesced"] set). The entry is removed as soon as the
+        leader finishes. If the leader fails, waiters get the same error;
+        if it is cancelled, a waiter takes over as the new leader.
+        """
+        fingerprint = request.get("fingerprint")
+        if not self.coalesce or not fingerprint or request.get("route") == "local":
+            return await self.call_client(api_type, request)
+
+        while True:
+            leader = self._in_flight.get(fingerprint)
+            if leader is None:
+                break
+
+            try:
+                result = await asyncio.shield(leader)
+            except asyncio.CancelledError:
+                if leader.cancelled() and not _cancel_requested():
+                    continue  # leader gave up - retry as leader
+                raise
+            except Exception:
+                self.coalesce_stats["coalesced"] += 1
+                raise
+
+            # Counted once, when served by a leader - not per retry after a
+            # cancelled leader, and not at all if the waiter took over
+            self.coalesce_stats["coalesced"] += 1
+            result = result.model_copy(deep=True)
+            result.metadata["coalesced"] = True
+            return result
+
+        leader = asyncio.get_running_loop().create_future()
+        self._in_flight[fingerprint] = leader
+        self.coalesce_stats["leaders"] += 1
+
+        try:
+            result = await self.call_client(api_type, request)
+        except asyncio.CancelledError:
+            leader.cancel()
+            raise
+        except Exception as e:
+            self.coalesce_stats["leader_failures"] += 1
+            leader.set_exception(e)
+            leader.exception()  # mark retrieved when nobody waits
+            raise
+        else:
+            leader.set_result(result)
+            return result
+        finally:
+            self._in_flight.pop(fingerprint, None)
+
+    def _record_abandoned(
+        self,
+        total_tasks: int,
+        outstanding: int,
+        call_seconds: float,
+        start_time: float
+    ) -> None:
+        """Log and count the work of a dispatch cancelled midway."""
+        completed = total_tasks - outstanding
+        self.abandoned_stats["abandoned_dispatches"] += 1
+        self.abandoned_stats["completed_calls"] += completed
+        self.abandoned_stats["cancelled_calls"] += outstanding
+        self.abandoned_stats["call_seconds"] += call_seconds
+
+        logger.warning(
+            f"Dispatch abandoned after {time.time() - start_time:.2f}s: "
+            f"{completed}/{total_tasks} calls completed and discarded, "
+            f"{outstanding} cancelled, {call_seconds:.2f} call-seconds wasted"
+        )
+
+    def _expected_wait(self, api_type: str, request: Dict[str, Any]) -> float:
+        """Expected seconds a call dispatched now waits for a service slot."""
+        scheduler = self.fair_schedulers.get(api_type)
+        if scheduler is None or request.get("route") == "local":
+            return 0.0
+        return scheduler.estimated_wait_seconds(
+            default_hold=self.latency_model.estimate(api_type, request)
+        )
+
+    def get_load(self) -> Dict[str, Any]:
+        """
+        Current backlog of remote calls (admission control signal).
+
+        Returns:
+            {"queue_depth": calls waiting for a service slot,
+             "queue_delay_seconds": worst expected wait across services}
+        """
+        schedulers = self.fair_schedulers.values()
+        return {
+            "queue_depth": sum(scheduler.waiting for scheduler in schedulers),
+            "queue_delay_seconds": max(
+                (scheduler.estimated_wait_seconds() for scheduler in schedulers),
+                default=0.0
+            )
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return dispatcher metrics."""
+        return {
+            "coalescing": {
+                "enabled": self.coalesce,
+                "in_flight": len(self._in_flight),
+                **self.coalesce_stats
+            },
+            "fair_queueing": {
+                api_type: scheduler.get_stats()
+                for api_type, scheduler in self.fair_schedulers.items()
+            },
+            "latency_model": self.latency_model.get_stats(),
+            "adaptive_timeouts": self.timeouts.get_stats(),
+            "fallback_chain": self.fallback_chain.get_stats(),
+            "micro_batching": {
+                api_type: batcher.get_stats()
+                for api_type, batcher in self.micro_batchers.items()
+            },
+            "abandoned": {
+                **self.abandoned_stats,
+                "call_seconds": round(self.abandoned_stats["call_seconds"], 3)
+            },
+            "transport": {
+                api_type: client.transport.get_stats()
+                for api_type, client in (
+                    ("text", self.text_client),
+                    ("chart", self.chart_client),
+                    ("image", self.image_client),
+                    ("diagram", self.diagram_client)
+                )
+                if hasattr(getattr(client, "transport", None), "get_stats")
+            },
+            "replicas": {
+                api_type: client.replicas.get_stats()
+                for api_type, client in (
+                    ("text", self.text_client),
+                    ("chart", self.chart_client),
+                    ("image", self.image_client),
+                    ("diagram", self.diagram_client)
+                )
+                if hasattr(getattr(client, "replicas", None), "get_stats")
+            }
+        }
+
+    async def _attach_speculative(self, api_type: str, request: Dict[str, Any], task: asyncio.Task) -> Optional[Any]:
+        """
+        Wait for a matching speculative generation (SpeculativeCache.lookup).
+
+        Returns:
+            A private copy of the speculative result (metadata["speculative"]
+            set), or None to generate normally
+        """
+        try:
+            # shield: one consumer cancelling must not kill the shared task
+            result = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if task.cancelled() and not _cancel_requested():
+                return None
+            raise
+        except Exception as e:
+            logger.warning(f"Speculative {api_type} for slide {request.get('slide_number')} failed: {e}")
+            return None
+
+        result = result.model_copy(deep=True)
+        result.metadata["speculative"] = True
+        logger.info(f"Attached speculative {api_type} for slide {request.get('slide_number')}")
+        return result
+
+    async def _generate_after_speculative(
+        self,
+        api_type: str,
+        request: Dict[str, Any],
+        task: asyncio.Task,
+        shared_results: Optional[Dict[str, asyncio.Future]] = None
+    ) -> Any:
+        """Remote tier of a request whose speculative generation is running."""
+        result = await self._attach_speculative(api_type, request, task)
+        if result is None:
+            # Speculation failed or was cancelled - make the call ourselves
+            result = await self._generate_shared(api_type, request, shared_results)
+        return result
+
     def _group_results_by_slide(
         self,
         results: List[Any],
@@ -192,48 +743,59 @@ class APIDispatcher:
         grouped = {}
 
         for result, meta in zip(results, metadata):
-            slide_id = meta["slide_id"]
-            api_type = meta["api_type"]
-
-            # Initialize slide entry if needed
-            if slide_id not in grouped:
-                grouped[slide_id] = {
-                    "text": None,
-                    "charts": [],
-                    "images": [],
-                    "diagrams": [],
-                    "errors": []
-                }
-
-            # Handle exceptions from asyncio.gather
-            if isinstance(result, Exception):
-                logger.error(f"Exception for slide {slide_id}, {api_type}: {result}")
-                grouped[slide_id]["errors"].append({
-                    "api_type": api_type,
-                    "error": str(result)
-                })
-                continue
-
-            # Handle failed API calls
-            if not result.get("success"):
-                grouped[slide_id]["errors"].append({
-                    "api_type": api_type,
-                    "error": result.get("error")
-                })
-                continue
-
-            # Add successful result to appropriate field
-            if api_type == "text":
-                grouped[slide_id]["text"] = result["result"]
-            elif api_type == "chart":
-                grouped[slide_id]["charts"].append(result["result"])
-            elif api_type == "image":
-                grouped[slide_id]["images"].append(result["result"])
-            elif api_type == "diagram":
-                grouped[slide_id]["diagrams"].append(result["result"])
+            self._record_result(grouped, result, meta)
 
         return grouped
 
+    def _record_result(self, grouped: Dict[str, Any], result: Any, meta: Dict[str, Any]) -> None:
+        """
+        Add one API result to the per-slide grouping.
+
+        Args:
+            grouped: Results grouped by slide_id (updated in place)
+            result: Result dict from _dispatch_single, or an exception
+            meta: {"api_type", "slide_id", "slide_number"}
+        """
+        slide_id = meta["slide_id"]
+        api_type = meta["api_type"]
+
+        # Initialize slide entry if needed
+        if slide_id not in grouped:
+            grouped[slide_id] = {
+                "text": None,
+                "charts": [],
+                "images": [],
+                "diagrams": [],
+                "errors": []
+            }
+
+        # Handle exceptions raised by the dispatch
+        if isinstance(result, Exception):
+            logger.error(f"Exception for slide {slide_id}, {api_type}: {result}")
+            grouped[slide_id]["errors"].append({
+                "api_type": api_type,
+                "error": str(result)
+            })
+            return
+
+        # Handle failed API calls
+        if not result.get("success"):
+            grouped[slide_id]["errors"].append({
+                "api_type": api_type,
+                "error": result.get("error")
+            })
+            return
+
+        # Add successful result to appropriate field
+        if api_type == "text":
+            grouped[slide_id]["text"] = result["result"]
+        elif api_type == "chart":
+            grouped[slide_id]["charts"].append(result["result"])
+        elif api_type == "image":
+            grouped[slide_id]["images"].append(result["result"])
+        elif api_type == "diagram":
+            grouped[slide_id]["diagrams"].append(result["result"])
+
     async def dispatch_batch(
         self,
         requests: List[Dict[str, Any]],
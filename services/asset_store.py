@@ -0,0 +1,253 @@
+"""
+Asset Store - v2.0
+===================
+
+Local content-addressed blob store for generated assets.
+
+Generated images, charts and diagrams live on remote CDNs that the
+Director fetches again and again. The AssetLocalizer downloads every
+asset of a presentation once, in parallel, stores the bytes under their
+SHA-256 digest, and rewrites EnrichedSlide URLs to the local serving
+endpoint (`GET /api/v2/assets/{digest}` in main.py).
+
+Content addressing makes assets immutable: the digest is the ETag and
+responses can be cached forever.
+
+Performance: one download per unique URL, bounded parallelism
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+# generated_content fields that hold asset URLs
+ASSET_URL_FIELDS = ("image_url", "chart_url", "diagram_url")
+
+
+class AssetBlobStore:
+    """
+    Content-addressed blob store on the local filesystem.
+
+    Layout: <root>/<aa>/<bb>/<digest> plus <digest>.json metadata.
+    """
+
+    def __init__(self, root_dir: str):
+        """
+        Initialize blob store.
+
+        Args:
+            root_dir: Directory for blobs (created if missing)
+        """
+        self.root_dir = root_dir
+        os.makedirs(root_dir, exist_ok=True)
+        logger.info(f"AssetBlobStore initialized (root: {root_dir})")
+
+    @staticmethod
+    def is_valid_digest(digest: str) -> bool:
+        """Check a digest is a lowercase SHA-256 hex string."""
+        return bool(_DIGEST_RE.match(digest or ""))
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.root_dir, digest[:2], digest[2:4], digest)
+
+    def put(self, data: bytes, content_type: str, source_url: str = "") -> str:
+        """
+        Store bytes and return their digest.
+
+        Writes are atomic (temp file + rename) and idempotent.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+
+        if os.path.exists(path):
+            return digest
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._atomic_write(path + ".json", json.dumps({
+            "content_type": content_type,
+            "size": len(data),
+            "source_url": source_url
+        }).encode("utf-8"))
+        self._atomic_write(path, data)
+
+        return digest
+
+    def _atomic_write(self, path: str, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def get_info(self, digest: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a stored blob.
+
+        Returns:
+            {"path", "size", "content_type"} or None if unknown
+        """
+        if not self.is_valid_digest(digest):
+            return None
+
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            return None
+
+        content_type = "application/octet-stream"
+        try:
+            with open(path + ".json", "r") as f:
+                content_type = json.load(f).get("content_type") or content_type
+        except (OSError, ValueError):
+            pass
+
+        return {
+            "path": path,
+            "size": os.path.getsize(path),
+            "content_type": content_type
+        }
+
+    def read_range(self, digest: str, start: int, end: int) -> bytes:
+        """Read bytes [start, end] (inclusive) of a blob."""
+        with open(self._blob_path(digest), "rb") as f:
+            f.seek(start)
+            return f.read(end - start + 1)
+
+
+class AssetLocalizer:
+    """
+    Downloads presentation assets once and rewrites their URLs.
+
+    Failed downloads keep the original remote URL.
+    """
+
+    def __init__(
+        self,
+        store: AssetBlobStore,
+        public_base_url: str = "",
+        max_concurrency: int = 16,
+        timeout: float = 20.0,
+        max_remembered_urls: int = 4096,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Initialize localizer.
+
+        Args:
+            store: Blob store for downloaded bytes
+            public_base_url: Prefix for rewritten URLs (empty = relative path)
+            max_concurrency: Parallel downloads
+            timeout: Per-download timeout in seconds
+            max_remembered_urls: Size of the remote URL → digest memo
+            transport: httpx transport for downloads (default: network)
+        """
+        self.store = store
+        self.public_base_url = public_base_url.rstrip("/")
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_remembered_urls = max_remembered_urls
+        self.transport = transport
+        self._url_digests: "OrderedDict[str, str]" = OrderedDict()
+
+    def local_url(self, digest: str) -> str:
+        """Public URL of a stored asset."""
+        return f"{self.public_base_url}/api/v2/assets/{digest}"
+
+    async def localize(self, enriched_slides: List[Any]) -> Dict[str, Any]:
+        """
+        Download all asset URLs of the slides and rewrite them in place.
+
+        Args:
+            enriched_slides: EnrichedSlide objects (generated_content is updated)
+
+        Returns:
+            Stats dict for generation_metadata
+        """
+        references: List[Tuple[Dict[str, Any], str]] = []
+        urls = set()
+
+        for slide in enriched_slides:
+            content = slide.generated_content
+            for field in ASSET_URL_FIELDS:
+                url = content.get(field)
+                if isinstance(url, str) and url.startswith(("http://", "https://")):
+                    references.append((content, field))
+                    urls.add(url)
+
+        to_fetch = [url for url in urls if url not in self._url_digests]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with httpx.AsyncClient(
+            timeout=self.timeout, follow_redirects=True, transport=self.transport
+        ) as http:
+            results = await asyncio.gather(
+                *(self._download(http, semaphore, url) for url in to_fetch)
+            )
+
+        failed = 0
+        for url, digest in zip(to_fetch, results):
+            if digest is None:
+                failed += 1
+                continue
+            self._remember(url, digest)
+
+        rewritten = 0
+        for content, field in references:
+            digest = self._url_digests.get(content[field])
+            if digest:
+                content[field] = self.local_url(digest)
+                rewritten += 1
+
+        return {
+            "unique_assets": len(urls),
+            "downloaded": len(to_fetch) - failed,
+            "reused": len(urls) - len(to_fetch),
+            "failed": failed,
+            "rewritten_urls": rewritten
+        }
+
+    async def _download(
+        self,
+        http: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        url: str
+    ) -> Optional[str]:
+        """Download one asset into the store; returns digest or None."""
+        async with semaphore:
+            try:
+                response = await http.get(url)
+                response.raise_for_status()
+            except Exception as e:
+                logger.warning(f"Asset download failed for {url}: {e}")
+                return None
+
+        content_type = response.headers.get("content-type", "application/octet-stream")
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None,
+            self.store.put,
+            response.content,
+            content_type,
+            url
+        )
+
+    def _remember(self, url: str, digest: str) -> None:
+        self._url_digests[url] = digest
+        self._url_digests.move_to_end(url)
+        while len(self._url_digests) > self.max_remembered_urls:
+            self._url_digests.popitem(last=False)
@@ -0,0 +1,211 @@
+"""
+Brownout Controller - v2.0
+===========================
+
+Steps output quality down under sustained overload instead of shedding.
+
+The signal is the dispatcher's expected queueing delay for a new remote
+call. Each level is entered when the delay stays at or above its
+threshold for BROWNOUT_ENTER_SECONDS, and left when it stays below half
+of it (BROWNOUT_EXIT_RATIO) for BROWNOUT_EXIT_SECONDS - so the level
+does not flap around a threshold. Levels move one step at a time and
+degradations are cumulative:
+
+1. skip_optional_images - no image requests for layouts that only show
+   an image if one exists (everything except BROWNOUT_IMAGE_LAYOUTS, L10)
+2. local_text - text for BROWNOUT_LOCAL_TEXT_LAYOUTS (L01, L05) from the
+   local generator tier
+3. slow_polling - chart/diagram job status polled
+   BROWNOUT_POLL_MULTIPLIER times less often
+
+Each enrichment records the degradations applied to it in
+generation_metadata["degradations"].
+
+Configuration:
+- BROWNOUT=false disables it
+- BROWNOUT_THRESHOLDS: queue-delay seconds per level (default "4,8,12")
+
+Performance: O(requests) per enrichment, one pass over image/text lists
+"""
+
+import logging
+import os
+import time
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Degradations in the order levels enable them
+DEGRADATIONS = ("skip_optional_images", "local_text", "slow_polling")
+
+
+class BrownoutController:
+    """
+    Queue-delay driven quality levels with hysteresis.
+
+    Usage:
+        degradations = brownout.apply(all_requests)
+    """
+
+    def __init__(
+        self,
+        signal_fn: Callable[[], float],
+        thresholds: Tuple[float, ...] = (4.0, 8.0, 12.0),
+        enter_seconds: float = 5.0,
+        exit_seconds: float = 30.0,
+        exit_ratio: float = 0.5,
+        image_layouts: Iterable[str] = ("L10",),
+        local_text_layouts: Iterable[str] = ("L01", "L05"),
+        poll_multiplier: float = 2.0,
+        enabled: bool = True
+    ):
+        """
+        Initialize controller.
+
+        Args:
+            signal_fn: Returns the current expected queueing delay (seconds)
+            thresholds: Delay that enters each level (ascending, one per
+                degradation)
+            enter_seconds: How long the delay must stay at/above a
+                threshold before stepping up
+            exit_seconds: How long it must stay below threshold × exit_ratio
+                before stepping down
+            exit_ratio: Exit threshold as a fraction of the entry threshold
+            image_layouts: Layouts whose image is required (never skipped)
+            local_text_layouts: Layouts whose text goes local at level 2
+            poll_multiplier: Poll interval multiplier at level 3
+            enabled: False keeps level 0
+        """
+        self.signal_fn = signal_fn
+        self.thresholds = tuple(thresholds)[:len(DEGRADATIONS)]
+        self.enter_seconds = enter_seconds
+        self.exit_seconds = exit_seconds
+        self.exit_ratio = exit_ratio
+        self.image_layouts = frozenset(image_layouts)
+        self.local_text_layouts = frozenset(local_text_layouts)
+        self.poll_multiplier = poll_multiplier
+        self.enabled = enabled
+
+        self.level = 0
+        self.last_signal = 0.0
+        self._above_since: Optional[float] = None
+        self._below_since: Optional[float] = None
+
+        self.stats = {"level_changes": 0, "degraded_enrichments": 0}
+
+    def update(self, now: Optional[float] = None) -> int:
+        """
+        Sample the signal and move at most one level.
+
+        Returns:
+            Current level (0 = full quality)
+        """
+        if not self.enabled:
+            return 0
+
+        now = time.monotonic() if now is None else now
+        delay = self.last_signal = self.signal_fn()
+
+        # Step up: next threshold exceeded for enter_seconds
+        if self.level < len(self.thresholds) and delay >= self.thresholds[self.level]:
+            self._below_since = None
+            if self._above_since is None:
+                self._above_since = now
+            if now - self._above_since >= self.enter_seconds:
+                self._set_level(self.level + 1, delay)
+                self._above_since = None
+            return self.level
+        self._above_since = None
+
+        # Step down: clearly below the current level's threshold for exit_seconds
+        if self.level > 0 and delay < self.thresholds[self.level - 1] * self.exit_ratio:
+            if self._below_since is None:
+                self._below_since = now
+            if now - self._below_since >= self.exit_seconds:
+                self._set_level(self.level - 1, delay)
+                self._below_since = None
+        else:
+            self._below_since = None
+
+        return self.level
+
+    def _set_level(self, level: int, delay: float) -> None:
+        logger.warning(
+            f"Brownout level {self.level} → {level} (queue delay {delay:.1f}s): "
+            f"{', '.join(DEGRADATIONS[:level]) or 'full quality'}"
+        )
+        self.level = level
+        self.stats["level_changes"] += 1
+
+    def apply(self, all_requests: Dict[str, List[Dict[str, Any]]], local_types: Iterable[str] = ("text",)) -> List[Dict[str, Any]]:
+        """
+        Degrade a deck's requests for the current level (in place).
+
+        Args:
+            all_requests: Requests grouped by API type
+            local_types: API types the local tier can serve
+
+        Returns:
+            Applied degradations: [{"degradation", "level", "requests"}]
+            (empty at level 0)
+        """
+        level = self.update()
+        if level == 0:
+            return []
+
+        applied = []
+
+        # Level 1: drop images the layout only shows if present
+        images = all_requests.get("image", [])
+        kept = [r for r in images if r.get("layout_id") in self.image_layouts]
+        all_requests["image"] = kept
+        applied.append({"degradation": DEGRADATIONS[0], "level": 1, "requests": len(images) - len(kept)})
+
+        if level >= 2 and "text" in local_types:
+            routed = 0
+            for request in all_requests.get("text", []):
+                if request.get("layout_id") in self.local_text_layouts and request.get("route") != "local":
+                    request["route"] = "local"
+                    routed += 1
+            applied.append({"degradation": DEGRADATIONS[1], "level": 2, "requests": routed})
+
+        if level >= 3:
+            slowed = 0
+            for api_type in ("chart", "diagram"):
+                for request in all_requests.get(api_type, []):
+                    request["poll_interval_multiplier"] = self.poll_multiplier
+                    slowed += 1
+            applied.append({"degradation": DEGRADATIONS[2], "level": 3, "requests": slowed})
+
+        self.stats["degraded_enrichments"] += 1
+        return applied
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return current level, signal and thresholds."""
+        return {
+            "enabled": self.enabled,
+            "level": self.level,
+            "active_degradations": list(DEGRADATIONS[:self.level]),
+            "queue_delay_seconds": round(self.last_signal, 3),
+            "thresholds": list(self.thresholds),
+            **self.stats
+        }
+
+
+def _layouts(name: str, default: str) -> List[str]:
+    return [l.strip() for l in os.getenv(name, default).split(",") if l.strip()]
+
+
+def build_brownout_controller(signal_fn: Callable[[], float]) -> BrownoutController:
+    """Create a BrownoutController from environment variables."""
+    return BrownoutController(
+        signal_fn=signal_fn,
+        thresholds=tuple(float(t) for t in os.getenv("BROWNOUT_THRESHOLDS", "4,8,12").split(",")),
+        enter_seconds=float(os.getenv("BROWNOUT_ENTER_SECONDS", "5")),
+        exit_seconds=float(os.getenv("BROWNOUT_EXIT_SECONDS", "30")),
+        exit_ratio=float(os.getenv("BROWNOUT_EXIT_RATIO", "0.5")),
+        image_layouts=_layouts("BROWNOUT_IMAGE_LAYOUTS", "L10"),
+        local_text_layouts=_layouts("BROWNOUT_LOCAL_TEXT_LAYOUTS", "L01,L05"),
+        poll_multiplier=float(os.getenv("BROWNOUT_POLL_MULTIPLIER", "2")),
+        enabled=os.getenv("BROWNOUT", "true").lower() == "true"
+    )
@@ -0,0 +1,357 @@
+"""
+DAG Scheduler - v2.0
+=====================
+
+Dependency-aware scheduling of a deck's API requests.
+
+Request kinds can declare dependencies through rules:
+- text_after_chart: a slide's text waits for its chart and receives the
+  chart data in context["chart_data"] (e.g. L17 key_insights written
+  from the actual numbers)
+- text_after_previous_text: slide N's text waits for slide N-1's text
+  and receives it in context["previous_slides"] (the text service's
+  session context, last 5 slides)
+
+A rule provides dependencies(node, nodes_by_slide, previous_slide) →
+keys it waits for, and bind(request, {key: (request, result)}) → the
+request to send (a copy with the dependency output in its context).
+
+Every request becomes a node; a node starts the moment all of its
+dependencies have finished (failed dependencies still release it, it
+just gets no bound data). Ready nodes start in critical-path order -
+longest remaining chain of expected latencies first. With no rules
+enabled every node is ready at once and this is longest-expected-job-
+first (LPT) order. Expected latencies come from the LatencyModel when
+one is given (learned per service and subtype), else static costs; each
+request carries its estimate in request["expected_seconds"] and its
+rank in request["critical_path_seconds"] (used for deck ETAs).
+
+Priority modes (PRIORITY_MODES):
+- makespan (default): the order above - the whole deck finishes soonest
+- visible_first: every request carries request["priority"] from its
+  slide's position (visible_first_priorities) - caller-supplied visible
+  slides first, then slide_number order - and higher priority starts
+  first, critical path breaking ties. Slide 1 and the slides on screen
+  complete first, at some cost in total time.
+
+Rules are opt-in: DAG_DEPENDENCIES=text_after_chart,text_after_previous_text
+
+Performance: O(nodes + edges) to build and rank
+"""
+
+import asyncio
+import logging
+import os
+from types import MappingProxyType
+from typing import Dict, Any, Awaitable, Callable, Iterable, List, Optional
+
+from services.latency_model import DEFAULT_COSTS, LatencyModel
+from services.request_compiler import request_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Previous slides the text service keeps in its session context
+PREVIOUS_SLIDES_WINDOW = 5
+
+PRIORITY_MODES = ("makespan", "visible_first")
+
+
+def _with_context(request: Dict[str, Any], **updates: Any) -> Dict[str, Any]:
+    """Copy a request with extra keys in its (read-only) context."""
+    bound = dict(request)
+    bound["context"] = MappingProxyType({**(request.get("context") or {}), **updates})
+    return bound
+
+
+class TextAfterChart:
+    """A slide's text depends on the same slide's chart."""
+
+    name = "text_after_chart"
+
+    def dependencies(self, node: Dict[str, Any], nodes_by_slide: Dict[str, Dict[str, List[str]]],
+                     previous_slide: Dict[str, str]) -> List[str]:
+        if node["api_type"] != "text":
+            return []
+        return nodes_by_slide.get(node["slide_id"], {}).get("chart", [])
+
+    def bind(self, request: Dict[str, Any], dependencies: Dict[str, tuple]) -> Dict[str, Any]:
+        charts = [result for _, result in dependencies.values() if result is not None]
+        if not charts:
+            return request
+        chart = charts[0]
+        return _with_context(request, chart_data={"type": chart.type, "data": chart.data})
+
+
+class TextAfterPreviousText:
+    """Slide N's text depends on slide N-1's text."""
+
+    name = "text_after_previous_text"
+
+    def dependencies(self, node: Dict[str, Any], nodes_by_slide: Dict[str, Dict[str, List[str]]],
+                     previous_slide: Dict[str, str]) -> List[str]:
+        if node["api_type"] != "text":
+            return []
+        previous_id = previous_slide.get(node["slide_id"])
+        if previous_id is None:
+            return []
+        return nodes_by_slide.get(previous_id, {}).get("text", [])
+
+    def bind(self, request: Dict[str, Any], dependencies: Dict[str, tuple]) -> Dict[str, Any]:
+        previous = []
+        for dependency_request, result in dependencies.values():
+            context = dependency_request.get("context") or {}
+            previous.extend(context.get("previous_slides", []))
+            if result is not None:
+                previous.append({
+                    "slide_id": dependency_request.get("slide_id"),
+                    "slide_number": dependency_request.get("slide_number"),
+                    "content": result.content
+                })
+        if not previous:
+            return request
+        return _with_context(request, previous_slides=previous[-PREVIOUS_SLIDES_WINDOW:])
+
+
+DEPENDENCY_RULES = {
+    rule.name: rule for rule in (TextAfterChart, TextAfterPreviousText)
+}
+
+
+def rules_from_env() -> List[Any]:
+    """Instantiate the rules listed in DAG_DEPENDENCIES (comma-separated)."""
+    names = [n.strip() for n in os.getenv("DAG_DEPENDENCIES", "").split(",") if n.strip()]
+    unknown = [n for n in names if n not in DEPENDENCY_RULES]
+    if unknown:
+        raise ValueError(f"Unknown DAG dependency rules: {unknown}")
+    return [DEPENDENCY_RULES[n]() for n in names]
+
+
+def visible_first_priorities(
+    slide_ids: List[str],
+    visible_slide_ids: Optional[Iterable[str]] = None
+) -> Dict[str, float]:
+    """
+    Rank slides for visible_first scheduling.
+
+    Args:
+        slide_ids: The deck's slide ids in slide_number order
+        visible_slide_ids: Slides on screen, most important first
+            (ids not in the deck are ignored)
+
+    Returns:
+        Priority by slide_id - higher completes sooner: visible slides in
+        the given order, then the others in deck order
+    """
+    known = set(slide_ids)
+    visible = [s for s in dict.fromkeys(visible_slide_ids or ()) if s in known]
+    visible_set = set(visible)
+    order = visible + [s for s in slide_ids if s not in visible_set]
+    return {slide_id: float(len(order) - position) for position, slide_id in enumerate(order)}
+
+
+class DAGScheduler:
+    """
+    Runs a deck's requests as a dependency graph.
+
+    Node layout:
+    {
+        "key": "text:slide_001",
+        "api_type": str,
+        "slide_id": str,
+        "request": dict,
+        "deps": {rule_name: [key, ...]},
+        "dependents": [key, ...],
+        "rank": float   # expected seconds from node start to end of its longest chain
+    }
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[Any] = (),
+        costs: Optional[Dict[str, float]] = None,
+        latency_model: Optional[LatencyModel] = None
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            rules: Dependency rules (see DEPENDENCY_RULES)
+            costs: Static expected seconds per API type for ranking
+            latency_model: Learned latencies (used instead of costs)
+        """
+        self.rules = list(rules)
+        self.costs = {**DEFAULT_COSTS, **(costs or {})}
+        self.latency_model = latency_model
+        logger.info(f"DAGScheduler initialized (rules: {[r.name for r in self.rules] or 'none'})")
+
+    def build(self, all_requests: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Build and rank the dependency graph.
+
+        Args:
+            all_requests: Requests grouped by API type
+
+        Returns:
+            Nodes by key, in topological order
+
+        Raises:
+            ValueError: If the rules produce a cycle
+        """
+        nodes: Dict[str, Dict[str, Any]] = {}
+        nodes_by_slide: Dict[str, Dict[str, List[str]]] = {}
+        slide_numbers: Dict[str, Any] = {}
+
+        for api_type, requests in all_requests.items():
+            for request in requests:
+                slide_id = request.get("slide_id")
+                key = f"{api_type}:{slide_id}"
+                if key in nodes:
+                    key = f"{key}#{len(nodes)}"
+
+                nodes[key] = {
+                    "key": key,
+                    "api_type": api_type,
+                    "slide_id": slide_id,
+                    "request": request,
+                    "deps": {},
+                    "dependents": [],
+                    "rank": 0.0
+                }
+                nodes_by_slide.setdefault(slide_id, {}).setdefault(api_type, []).append(key)
+                slide_numbers.setdefault(slide_id, request.get("slide_number", 0))
+
+        ordered_slides = sorted(slide_numbers, key=lambda s: slide_numbers[s])
+        previous_slide = dict(zip(ordered_slides[1:], ordered_slides))
+
+        for node in nodes.values():
+            for rule in self.rules:
+                deps = [d for d in rule.dependencies(node, nodes_by_slide, previous_slide) if d != node["key"]]
+                if deps:
+                    node["deps"][rule.name] = deps
+                    for dep in deps:
+                        nodes[dep]["dependents"].append(node["key"])
+
+        order = self._topological_order(nodes)
+
+        # Critical path: own cost + longest chain of dependents
+        for key in reversed(order):
+            node = nodes[key]
+            cost = self._cost(node["api_type"], node["request"])
+            node["request"]["expected_seconds"] = cost
+            downstream = max((nodes[d]["rank"] for d in node["dependents"]), default=0.0)
+            node["rank"] = cost + downstream
+            node["request"]["critical_path_seconds"] = node["rank"]
+
+        return {key: nodes[key] for key in order}
+
+    def _cost(self, api_type: str, request: Dict[str, Any]) -> float:
+        """Expected seconds for one request."""
+        if self.latency_model is not None:
+            return self.latency_model.estimate(api_type, request)
+        return self.costs.get(api_type, 1.0)
+
+    async def run(
+        self,
+        all_requests: Dict[str, List[Dict[str, Any]]],
+        execute: Callable[[str, Dict[str, Any]], Awaitable[Any]]
+    ) -> Dict[str, Any]:
+        """
+        Execute every request as soon as its dependencies are done.
+
+        Args:
+            all_requests: Requests grouped by API type
+            execute: Coroutine (api_type, request) → dispatcher result dict
+                ({"success", "result", ...})
+
+        Returns:
+            Schedule stats: {"nodes", "edges", "critical_path_seconds"}
+        """
+        nodes = self.build(all_requests)
+        if not nodes:
+            return {"nodes": 0, "edges": 0, "critical_path_seconds": 0.0}
+
+        waiting = {key: sum(len(deps) for deps in node["deps"].values()) for key, node in nodes.items()}
+        outcomes: Dict[str, Any] = {}
+        running: Dict[asyncio.Task, str] = {}
+
+        def start(keys: List[str]) -> None:
+            for key in sorted(
+                keys, key=lambda k: (nodes[k]["request"].get("priority", 0.0), nodes[k]["rank"]), reverse=True
+            ):
+                node = nodes[key]
+                request = self._bind(node, nodes, outcomes)
+                node["request"] = request
+                running[asyncio.ensure_future(execute(node["api_type"], request))] = key
+
+        start([key for key, count in waiting.items() if count == 0])
+
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                ready = []
+                for task in done:
+                    key = running.pop(task)
+                    outcome = task.result() if not task.cancelled() and task.exception() is None else None
+                    outcomes[key] = outcome.get("result") if isinstance(outcome, dict) and outcome.get("success") else None
+
+                    for dependent in nodes[key]["dependents"]:
+                        waiting[dependent] -= 1
+                        if waiting[dependent] == 0:
+                            ready.append(dependent)
+                start(ready)
+        except asyncio.CancelledError:
+            # Abandoned: cancel the calls still running (not-yet-started
+            # dependents are simply never started)
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            raise
+
+        edges = sum(len(node["dependents"]) for node in nodes.values())
+        critical_path = max(node["rank"] for node in nodes.values())
+        if edges:
+            logger.info(
+                f"DAG schedule: {len(nodes)} nodes, {edges} edges, "
+                f"expected critical path {critical_path:.1f}s"
+            )
+
+        return {
+            "nodes": len(nodes),
+            "edges": edges,
+            "critical_path_seconds": critical_path
+        }
+
+    def _bind(self, node: Dict[str, Any], nodes: Dict[str, Dict[str, Any]], outcomes: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply each rule's binder to the node's request."""
+        request = node["request"]
+        if not node["deps"]:
+            return request
+
+        for rule in self.rules:
+            deps = node["deps"].get(rule.name)
+            if not deps:
+                continue
+            request = rule.bind(request, {d: (nodes[d]["request"], outcomes.get(d)) for d in deps})
+
+        if request is not node["request"]:
+            request["fingerprint"] = request_fingerprint(node["api_type"], request)
+        return request
+
+    @staticmethod
+    def _topological_order(nodes: Dict[str, Dict[str, Any]]) -> List[str]:
+        """Kahn's algorithm; raises ValueError on a cycle."""
+        indegree = {key: sum(len(d) for d in node["deps"].values()) for key, node in nodes.items()}
+        queue = [key for key, count in indegree.items() if count == 0]
+        order = []
+
+        while queue:
+            key = queue.pop()
+            order.append(key)
+            for dependent in nodes[key]["dependents"]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    queue.append(dependent)
+
+        if len(order) != len(nodes):
+            raise ValueError("Dependency rules produced a cycle")
+        return order
@@ -0,0 +1,144 @@
+"""
+Deck ETA - v2.0
+================
+
+Live completion estimate for one deck's dispatch.
+
+When a call starts, its predicted completion is
+
+    start + expected queueing delay for its service + expected latency
+
+(latency from the LatencyModel, queueing from the service's fair
+scheduler). Calls that other calls wait on (DAG dependencies) add the
+rest of their chain: critical_path_seconds - expected_seconds. The deck
+ETA is the latest predicted completion over calls in flight; a call
+already past its prediction is assumed to need OVERDUE_FRACTION of its
+expected latency more, so the ETA never claims zero while work remains.
+
+Local-tier calls predict no latency.
+
+Performance: O(calls in flight) per ETA
+"""
+
+import logging
+import time
+from typing import Dict, Any, List, Optional
+
+from services.latency_model import LatencyModel
+
+logger = logging.getLogger(__name__)
+
+# Remaining time assumed for a call running past its prediction,
+# as a fraction of its expected latency
+OVERDUE_FRACTION = 0.1
+
+
+class DeckETA:
+    """
+    Predicted completion of a deck's calls.
+
+    Usage:
+        eta = DeckETA(latency_model)
+        key = eta.start(api_type, request, queue_wait=2.5)
+        ...
+        eta.finish(key)
+        eta.eta_seconds()
+    """
+
+    def __init__(self, latency_model: LatencyModel):
+        """
+        Initialize tracker.
+
+        Args:
+            latency_model: Source of expected call latencies
+        """
+        self.latency_model = latency_model
+        self.started_at = time.monotonic()
+        self.calls_done = 0
+        self._next_key = 0
+        # key → {"api_type", "slide_id", "expected", "downstream", "predicted_at"}
+        self._in_flight: Dict[int, Dict[str, Any]] = {}
+
+    def start(self, api_type: str, request: Dict[str, Any], queue_wait: float = 0.0) -> int:
+        """
+        Register a call that has just been dispatched.
+
+        Args:
+            api_type: API type
+            request: Request dict (expected_seconds/critical_path_seconds
+                from the DAG scheduler are used when present)
+            queue_wait: Expected seconds before it gets a service slot
+
+        Returns:
+            Key to pass to finish()
+        """
+        if request.get("route") == "local":
+            expected = 0.0
+        else:
+            expected = request.get("expected_seconds")
+            if expected is None:
+                expected = self.latency_model.estimate(api_type, request)
+
+        downstream = max(0.0, request.get("critical_path_seconds", expected) - expected)
+
+        key = self._next_key
+        self._next_key += 1
+        self._in_flight[key] = {
+            "api_type": api_type,
+            "slide_id": request.get("slide_id"),
+            "expected": expected,
+            "downstream": downstream,
+            "predicted_at": time.monotonic() + queue_wait + expected
+        }
+        return key
+
+    def finish(self, key: int) -> None:
+        """Mark a call finished (successfully or not)."""
+        if self._in_flight.pop(key, None) is not None:
+            self.calls_done += 1
+
+    def _remaining(self, call: Dict[str, Any], now: float) -> float:
+        """Seconds until a call's chain completes."""
+        own = max(call["predicted_at"] - now, call["expected"] * OVERDUE_FRACTION)
+        return own + call["downstream"]
+
+    def eta_seconds(self, now: Optional[float] = None) -> float:
+        """Predicted seconds until every call in flight (and its chain) is done."""
+        now = time.monotonic() if now is None else now
+        return max((self._remaining(call, now) for call in self._in_flight.values()), default=0.0)
+
+    def predictions(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Predicted completion per call in flight.
+
+        Returns:
+            [{"api_type", "slide_id", "remaining_seconds"}], soonest first
+        """
+        now = time.monotonic() if now is None else now
+        calls = [
+            {
+                "api_type": call["api_type"],
+                "slide_id": call["slide_id"],
+                "remaining_seconds": round(max(call["predicted_at"] - now, 0.0), 3)
+            }
+            for call in self._in_flight.values()
+        ]
+        return sorted(calls, key=lambda c: c["remaining_seconds"])
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current estimate for progress events and the job API.
+
+        Returns:
+            {"eta_seconds", "estimated_completion" (unix time),
+             "elapsed_seconds", "calls_in_flight", "calls_done"}
+        """
+        now = time.monotonic()
+        eta = self.eta_seconds(now)
+        return {
+            "eta_seconds": round(eta, 1),
+            "estimated_completion": round(time.time() + eta, 1),
+            "elapsed_seconds": round(now - self.started_at, 1),
+            "calls_in_flight": len(self._in_flight),
+            "calls_done": self.calls_done
+        }
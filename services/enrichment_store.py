@@ -0,0 +1,173 @@
+"""
+Enrichment Store - v2.0
+========================
+
+Versioned results for draft-then-upgrade enrichment.
+
+A draft enrichment returns version 1 immediately (local text, chart
+data from guidance, placeholder images). Real generation continues in
+the background and publishes higher versions here. Clients fetch the
+latest version (optionally long-polling for a newer one) or receive it
+via push callback.
+
+Performance: in-memory, O(1) per lookup, TTL-bounded
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class EnrichmentVersionStore:
+    """
+    In-memory store of versioned enrichment results.
+
+    Entry layout:
+    {
+        "enrichment_id": str,
+        "version": int,
+        "status": "draft" | "upgrading" | "complete" | "failed",
+        "result": EnrichedPresentationStrawman or None,
+        "error": str or None,
+        "eta": DeckETA of the running upgrade or None,
+        "updated_at": float
+    }
+    """
+
+    def __init__(self, ttl_seconds: int = 3600, max_entries: int = 1000):
+        """
+        Initialize store.
+
+        Args:
+            ttl_seconds: How long finished enrichments stay fetchable
+            max_entries: Maximum number of enrichments kept
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._changed: Dict[str, asyncio.Event] = {}
+
+    def create(self) -> str:
+        """Register a new enrichment and return its id."""
+        self._evict()
+
+        enrichment_id = f"enr_{uuid.uuid4().hex[:16]}"
+        self._entries[enrichment_id] = {
+            "enrichment_id": enrichment_id,
+            "version": 0,
+            "status": "draft",
+            "result": None,
+            "error": None,
+            "eta": None,
+            "updated_at": time.time()
+        }
+        return enrichment_id
+
+    def publish(self, enrichment_id: str, result: Any, status: str) -> int:
+        """
+        Publish a new version of an enrichment.
+
+        Args:
+            enrichment_id: Enrichment identifier
+            result: EnrichedPresentationStrawman for this version
+            status: Status after this version
+
+        Returns:
+            The new version number
+        """
+        entry = self._entries.get(enrichment_id)
+        if entry is None:
+            raise KeyError(f"Unknown enrichment: {enrichment_id}")
+
+        entry["version"] += 1
+        entry["result"] = result
+        entry["status"] = status
+        if status in ("complete", "failed"):
+            entry["eta"] = None
+        entry["updated_at"] = time.time()
+        self._notify(enrichment_id)
+
+        return entry["version"]
+
+    def set_status(self, enrichment_id: str, status: str, error: Optional[str] = None) -> None:
+        """Update status without publishing a new version."""
+        entry = self._entries.get(enrichment_id)
+        if entry is None:
+            return
+
+        entry["status"] = status
+        entry["error"] = error
+        if status in ("complete", "failed"):
+            entry["eta"] = None
+        entry["updated_at"] = time.time()
+        self._notify(enrichment_id)
+
+    def set_eta(self, enrichment_id: str, eta: Any) -> None:
+        """Attach the live DeckETA of an enrichment's running upgrade."""
+        entry = self._entries.get(enrichment_id)
+        if entry is not None:
+            entry["eta"] = eta
+
+    def get(self, enrichment_id: str) -> Optional[Dict[str, Any]]:
+        """Return the entry for an enrichment, or None if unknown/expired."""
+        entry = self._entries.get(enrichment_id)
+        if entry is None:
+            return None
+
+        if entry["status"] in ("complete", "failed") and time.time() - entry["updated_at"] > self.ttl_seconds:
+            self._entries.pop(enrichment_id, None)
+            return None
+
+        return entry
+
+    async def wait_for_update(
+        self,
+        enrichment_id: str,
+        since_version: int,
+        timeout: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Long-poll until the enrichment moves past since_version or finishes.
+
+        Returns:
+            Current entry (possibly unchanged after timeout), or None if unknown
+        """
+        deadline = time.monotonic() + timeout
+
+        while True:
+            entry = self.get(enrichment_id)
+            if entry is None:
+                return None
+            if entry["version"] > since_version or entry["status"] in ("complete", "failed"):
+                return entry
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return entry
+
+            event = self._changed.setdefault(enrichment_id, asyncio.Event())
+            try:
+                await asyncio.wait_for(event.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return self.get(enrichment_id)
+
+    def _notify(self, enrichment_id: str) -> None:
+        event = self._changed.pop(enrichment_id, None)
+        if event is not None:
+            event.set()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the oldest ones beyond max_entries."""
+        now = time.time()
+        for enrichment_id, entry in list(self._entries.items()):
+            if entry["status"] in ("complete", "failed") and now - entry["updated_at"] > self.ttl_seconds:
+                del self._entries[enrichment_id]
+
+        if len(self._entries) >= self.max_entries:
+            oldest = sorted(self._entries.values(), key=lambda e: e["updated_at"])
+            for entry in oldest[:len(self._entries) - self.max_entries + 1]:
+                del self._entries[entry["enrichment_id"]]
@@ -0,0 +1,253 @@
+"""
+Fair Scheduler - v2.0
+======================
+
+Weighted fair queueing of service calls across presentations/tenants.
+
+Each downstream service has a fixed number of concurrent slots. Calls
+queue per flow - a tenant (X-Tenant-Id) or, without one, a single
+presentation - and free slots are handed out by deficit round-robin:
+every flow in turn earns `quantum × weight` credit and spends one unit
+per call. An 80-slide deck therefore gets the same share of slots as a
+3-slide deck, and the small deck's few calls go out on the next rounds
+instead of behind the large deck's backlog. Within a flow, queued calls
+are served highest-priority first - longest-expected-first by default
+(request["expected_seconds"] from the latency model), slide position in
+visible_first mode (request["priority"]) - FIFO among equals.
+
+Configuration:
+- <SERVICE>_SERVICE_CONCURRENCY: slots per service
+  (defaults: text 16, image 8, chart 8, diagram 8)
+- FAIR_TENANT_WEIGHTS: "tenant_a:2,nightly:0.5" (default weight 1)
+- FAIR_QUEUEING=false disables the scheduler (unlimited concurrency)
+
+Performance: O(1) per grant (amortized), no polling
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Deque, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SERVICE_CONCURRENCY = {
+    "text": 16,
+    "image": 8,
+    "chart": 8,
+    "diagram": 8
+}
+
+MIN_WEIGHT = 0.01
+
+# Smoothing of the average slot hold time (queue delay estimate)
+HOLD_TIME_ALPHA = 0.1
+
+
+class FairScheduler:
+    """
+    Deficit round-robin slot scheduler for one service.
+
+    Usage:
+        async with scheduler.slot(flow_id, weight):
+            await client.generate(request)
+    """
+
+    def __init__(self, name: str, capacity: int, quantum: float = 1.0):
+        """
+        Initialize scheduler.
+
+        Args:
+            name: Service name (for logs/metrics)
+            capacity: Concurrent slots
+            quantum: Credit per round for a flow of weight 1
+        """
+        self.name = name
+        self.capacity = max(1, capacity)
+        self.quantum = quantum
+        self.in_use = 0
+
+        # Per-flow heap of (-priority, seq, future, cost)
+        self._queues: Dict[str, List[Tuple[float, int, asyncio.Future, float]]] = {}
+        self._seq = itertools.count()
+        self._weights: Dict[str, float] = {}
+        self._deficit: Dict[str, float] = {}
+        self._ring: Deque[str] = deque()
+        self._head_credited = False
+        # Live waiters; cancelled ones leave their heap lazily (_schedule)
+        self._waiting = 0
+
+        # EWMA of seconds a call holds its slot (None until the first call)
+        self.avg_hold_seconds: Optional[float] = None
+
+        self.stats = {"granted": 0, "queued": 0, "max_queue_depth": 0}
+
+    @asynccontextmanager
+    async def slot(self, flow_id: str, weight: float = 1.0, cost: float = 1.0, priority: float = 0.0):
+        """Hold one slot of this service for the duration of the block."""
+        await self.acquire(flow_id, weight, cost, priority)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._observe_hold(time.monotonic() - started)
+            self.release()
+
+    async def acquire(self, flow_id: str, weight: float = 1.0, cost: float = 1.0, priority: float = 0.0) -> None:
+        """
+        Wait for a slot.
+
+        Args:
+            flow_id: Tenant or presentation the call belongs to
+            weight: Share of this flow relative to others (default 1)
+            cost: Units of credit the call consumes (default 1)
+            priority: Higher is served first within the flow (expected
+                seconds - longest job first - or visible_first slide rank)
+        """
+        # Fast path: free slot and nobody waiting
+        if self.in_use < self.capacity and not self._ring:
+            self.in_use += 1
+            self.stats["granted"] += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        queue = self._queues.get(flow_id)
+        if queue is None:
+            queue = self._queues[flow_id] = []
+            self._deficit[flow_id] = 0.0
+            self._ring.append(flow_id)
+        self._weights[flow_id] = max(MIN_WEIGHT, weight)
+        heapq.heappush(queue, (-priority, next(self._seq), future, cost))
+        self._waiting += 1
+
+        self.stats["queued"] += 1
+        self.stats["max_queue_depth"] = max(self.stats["max_queue_depth"], self.waiting)
+
+        self._schedule()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was granted just as we were cancelled - hand it on
+                self.release()
+            else:
+                future.cancel()
+                self._waiting -= 1
+            raise
+
+    def release(self) -> None:
+        """Return a slot and grant it to the next flow in line."""
+        self.in_use -= 1
+        self._schedule()
+
+    def _schedule(self) -> None:
+        """Grant free slots by deficit round-robin over waiting flows."""
+        while self.in_use < self.capacity and self._ring:
+            flow_id = self._ring[0]
+            queue = self._queues[flow_id]
+
+            # Skip waiters that were cancelled while queued
+            while queue and queue[0][2].done():
+                heapq.heappop(queue)
+
+            if not queue:
+                self._ring.popleft()
+                del self._queues[flow_id]
+                del self._deficit[flow_id]
+                self._weights.pop(flow_id, None)
+                self._head_credited = False
+                continue
+
+            if not self._head_credited:
+                self._deficit[flow_id] += self.quantum * self._weights[flow_id]
+                self._head_credited = True
+
+            _, _, future, cost = queue[0]
+            if self._deficit[flow_id] >= cost:
+                self._deficit[flow_id] -= cost
+                heapq.heappop(queue)
+                self._waiting -= 1
+                self.in_use += 1
+                self.stats["granted"] += 1
+                future.set_result(None)
+            else:
+                # Turn over - next flow
+                self._ring.rotate(-1)
+                self._head_credited = False
+
+    def _observe_hold(self, seconds: float) -> None:
+        if self.avg_hold_seconds is None:
+            self.avg_hold_seconds = seconds
+        else:
+            self.avg_hold_seconds += HOLD_TIME_ALPHA * (seconds - self.avg_hold_seconds)
+
+    @property
+    def waiting(self) -> int:
+        """Calls queued for a slot (cancelled waiters excluded)."""
+        return self._waiting
+
+    def estimated_wait_seconds(self, default_hold: float = 0.0) -> float:
+        """
+        Expected wait for a call queued now: backlog × hold time / slots.
+
+        Args:
+            default_hold: Hold time to assume before any call has finished
+        """
+        hold = self.avg_hold_seconds if self.avg_hold_seconds is not None else default_hold
+        return self.waiting * hold / self.capacity
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return scheduler statistics."""
+        return {
+            "capacity": self.capacity,
+            "in_use": self.in_use,
+            "waiting": self.waiting,
+            "active_flows": len(self._ring),
+            "avg_hold_seconds": round(self.avg_hold_seconds or 0.0, 3),
+            "estimated_wait_seconds": round(self.estimated_wait_seconds(), 3),
+            **self.stats
+        }
+
+
+def parse_weights(spec: str) -> Dict[str, float]:
+    """Parse "tenant_a:2,nightly:0.5" into a weight map."""
+    weights = {}
+    for item in spec.split(","):
+        if ":" not in item:
+            continue
+        flow_id, weight = item.rsplit(":", 1)
+        try:
+            weights[flow_id.strip()] = float(weight)
+        except ValueError:
+            logger.warning(f"Ignoring invalid fair-queueing weight: {item!r}")
+    return weights
+
+
+def build_service_schedulers() -> Optional[Dict[str, FairScheduler]]:
+    """
+    Build one FairScheduler per service from environment variables.
+
+    Returns:
+        Schedulers by API type, or None if FAIR_QUEUEING=false
+    """
+    if os.getenv("FAIR_QUEUEING", "true").lower() != "true":
+        return None
+
+    schedulers = {
+        api_type: FairScheduler(
+            name=api_type,
+            capacity=int(os.getenv(f"{api_type.upper()}_SERVICE_CONCURRENCY", str(default)))
+        )
+        for api_type, default in DEFAULT_SERVICE_CONCURRENCY.items()
+    }
+    logger.info(
+        "Fair queueing enabled: "
+        + ", ".join(f"{name}={s.capacity}" for name, s in schedulers.items())
+    )
+    return schedulers
@@ -0,0 +1,202 @@
+"""
+Fallback Chain - v2.0
+======================
+
+Ordered fallback tiers per request, within a latency budget.
+
+Without the chain a failed call surfaces as an error after the client's
+full timeout and the slide falls back to ResultStitcher's hard-coded
+placeholder URLs. With FALLBACK_CHAIN=true every request walks
+
+    cache → remote → secondary → local → placeholder
+
+- cache: a finished speculative generation of the same request
+  (SpeculativeCache)
+- remote: the service call (deduplicated, coalesced, fair-queued); a
+  speculative generation still in flight is the service call and is
+  awaited here, within the remote slice, instead of calling again
+- secondary: the same call on another replica of the service (only
+  for clients with several replica URLs, see ReplicaPool)
+- local: the in-process generator (LocalTextClient etc.)
+- placeholder: a minimal result built from the request
+
+Each request has a budget of <SERVICE>_LATENCY_BUDGET seconds. A network
+tier (cache, remote, secondary) gets a slice of what is left of it,
+weighted by FALLBACK_TIER_WEIGHTS against the network tiers after it; a
+tier that fails fast leaves its time to the next. The chain moves on
+when a tier fails or its slice runs out. Local and placeholder tiers run
+in-process in microseconds and always run, so every item gets a result.
+
+The tier that produced an item is recorded in its metadata["tier"]
+(with the failed tiers in metadata["fallbacks"]), also with the chain
+disabled - then a failure is raised as before.
+
+Performance: one wait_for per network tier, no overhead for local tiers
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Tuple
+
+from services.fair_scheduler import parse_weights
+from services.timeout_tuner import DEFAULT_MAX_TIMEOUTS
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_TIERS = ("cache", "remote", "secondary", "local", "placeholder")
+
+# Tiers bounded by the budget; the others run in-process
+NETWORK_TIERS = frozenset({"cache", "remote", "secondary"})
+
+# Budget share of a network tier relative to the network tiers after it
+DEFAULT_TIER_WEIGHTS = {
+    "cache": 1.0,
+    "remote": 2.0,
+    "secondary": 1.0
+}
+
+# A network tier with less time left than this is skipped
+MIN_SLICE_SECONDS = 0.05
+
+# A tier: (name, coroutine factory returning a result, or None to pass)
+Tier = Tuple[str, Callable[[], Awaitable[Any]]]
+
+
+class FallbackChain:
+    """
+    Runs a request's tiers in order within its latency budget.
+
+    Usage:
+        result = await chain.run("image", request, [
+            ("cache", lambda: attach_speculative(request)),
+            ("remote", lambda: call_service(request)),
+            ("local", lambda: local_client.generate(request))
+        ])
+        result.metadata["tier"]   # "remote", or the tier that took over
+    """
+
+    def __init__(
+        self,
+        budgets: Optional[Dict[str, float]] = None,
+        tier_weights: Optional[Dict[str, float]] = None,
+        enabled: bool = False
+    ):
+        """
+        Initialize chain.
+
+        Args:
+            budgets: Latency budget per service in seconds (default: the
+                fixed client timeouts)
+            tier_weights: Budget weight per network tier
+            enabled: False runs the tiers without budget and raises the
+                first failure (tiers are still recorded)
+        """
+        self.budgets = {**DEFAULT_MAX_TIMEOUTS, **(budgets or {})}
+        self.tier_weights = {**DEFAULT_TIER_WEIGHTS, **(tier_weights or {})}
+        self.enabled = enabled
+        self.stats = {"served": {}, "failed": {}}
+
+    async def run(self, api_type: str, request: Dict[str, Any], tiers: List[Tier]) -> Any:
+        """
+        Produce a request's result from the first tier that delivers one.
+
+        Args:
+            api_type: Type of API ("text", "chart", "image", "diagram")
+            request: Request dict
+            tiers: Tiers in order; a tier returning None is skipped (e.g.
+                a cache miss)
+
+        Returns:
+            The result, with metadata["tier"] (and metadata["fallbacks"]:
+            [{"tier", "error"}, ...] if earlier tiers failed)
+
+        Raises:
+            The failing tier's error if the chain is disabled, else
+            RuntimeError if every tier failed
+        """
+        deadline = time.monotonic() + self.budgets.get(api_type, max(self.budgets.values()))
+        fallbacks: List[Dict[str, str]] = []
+
+        for index, (tier, attempt) in enumerate(tiers):
+            timeout = self._slice(tier, tiers[index + 1:], deadline)
+            if timeout is not None and timeout < MIN_SLICE_SECONDS:
+                fallbacks.append({"tier": tier, "error": "latency budget spent"})
+                self._count("failed", api_type, tier)
+                continue
+
+            started = time.monotonic()
+            try:
+                if timeout is None:
+                    result = await attempt()
+                else:
+                    result = await asyncio.wait_for(attempt(), timeout)
+            except Exception as e:
+                if not self.enabled:
+                    raise
+                if isinstance(e, asyncio.TimeoutError) and time.monotonic() - started >= timeout:
+                    error = f"no result within its {timeout:.1f}s budget slice"
+                else:
+                    error = f"{type(e).__name__}: {e}"
+                fallbacks.append({"tier": tier, "error": error})
+                self._count("failed", api_type, tier)
+                logger.warning(
+                    f"{api_type} {tier} tier failed for slide {request.get('slide_number', '?')}: {error}"
+                )
+                continue
+
+            if result is None:
+                continue
+
+            # The remote tier falls back to local itself on adaptive timeouts
+            if tier == "remote" and result.metadata.get("timeout_fallback"):
+                fallbacks.append({"tier": tier, "error": "adaptive timeout"})
+                tier = "local"
+
+            result.metadata["tier"] = tier
+            if fallbacks:
+                result.metadata["fallbacks"] = fallbacks
+            self._count("served", api_type, tier)
+            return result
+
+        raise RuntimeError(
+            f"All {api_type} fallback tiers failed: "
+            + "; ".join(f"{f['tier']}: {f['error']}" for f in fallbacks)
+        )
+
+    def _slice(self, tier: str, later_tiers: List[Tier], deadline: float) -> Optional[float]:
+        """Seconds a tier may take (None = unbounded)."""
+        if not self.enabled or tier not in NETWORK_TIERS:
+            return None
+
+        weight = self.tier_weights.get(tier, 1.0)
+        later_weight = sum(self.tier_weights.get(name, 1.0) for name, _ in later_tiers if name in NETWORK_TIERS)
+        remaining = deadline - time.monotonic()
+        return remaining * weight / (weight + later_weight) if weight > 0 else 0.0
+
+    def _count(self, kind: str, api_type: str, tier: str) -> None:
+        counts = self.stats[kind].setdefault(api_type, {})
+        counts[tier] = counts.get(tier, 0) + 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return budgets and items served / failures per service and tier."""
+        return {
+            "enabled": self.enabled,
+            "budgets": dict(self.budgets),
+            "tier_weights": dict(self.tier_weights),
+            "served": {api_type: dict(counts) for api_type, counts in self.stats["served"].items()},
+            "failed": {api_type: dict(counts) for api_type, counts in self.stats["failed"].items()}
+        }
+
+
+def build_fallback_chain() -> FallbackChain:
+    """Create a FallbackChain from environment variables."""
+    return FallbackChain(
+        budgets={
+            api_type: float(os.getenv(f"{api_type.upper()}_LATENCY_BUDGET", str(default)))
+            for api_type, default in DEFAULT_MAX_TIMEOUTS.items()
+        },
+        tier_weights=parse_weights(os.getenv("FALLBACK_TIER_WEIGHTS", "")),
+        enabled=os.getenv("FALLBACK_CHAIN", "false").lower() == "true"
+    )
@@ -0,0 +1,245 @@
+"""
+Latency Model - v2.0
+=====================
+
+Learned per-service, per-subtype call latencies.
+
+Every completed remote call updates, for its (service, subtype) - chart
+type, diagram type, image aspect ratio, text topic count - and for the
+service as a whole:
+- an exponentially weighted moving average (estimate(): the expected
+  seconds used for scheduling and ETAs)
+- a quantile sketch (quantile(): tail latencies for timeouts and
+  hedging) - log-spaced buckets with QUANTILE_RELATIVE_ACCURACY error,
+  over the last one to two LATENCY_SKETCH_WINDOW calls so it follows
+  drift
+
+Calls cut off by a timeout only know a lower bound of their latency;
+they go into the sketch at the timeout (observe_timeout()) so the tail
+does not drift down, but not into the average, which would otherwise be
+pulled towards the timeout and skew scheduling and ETAs.
+
+Estimates fall back from subtype to service to the static DEFAULT_COSTS,
+so a fresh process schedules by the static costs and converges on real
+latencies as calls complete.
+
+The estimates drive longest-expected-job-first ordering (the DAG
+scheduler ranks nodes by them, the fair scheduler serves a flow's queued
+calls longest-first) and deck ETAs (DeckETA).
+
+Configuration:
+- LATENCY_EWMA_ALPHA: weight of the newest observation (default 0.2)
+- LATENCY_SKETCH_WINDOW: calls per quantile sketch window (default 500)
+
+Performance: O(1) per estimate/observation, O(buckets) per quantile
+"""
+
+import logging
+import math
+import os
+from typing import Dict, Any, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Expected seconds per API type before anything has been observed
+DEFAULT_COSTS = {
+    "text": 8.0,
+    "chart": 10.0,
+    "image": 12.0,
+    "diagram": 10.0
+}
+
+
+# Relative error of sketch quantiles (2%: p99 of 10s is within 9.8-10.2s)
+QUANTILE_RELATIVE_ACCURACY = 0.02
+
+# Shortest latency the sketch distinguishes
+MIN_SKETCH_SECONDS = 0.001
+
+
+def latency_subtype(api_type: str, request: Mapping[str, Any]) -> str:
+    """
+    Return the request's latency class within its service.
+
+    Args:
+        api_type: "text", "chart", "image" or "diagram"
+        request: Request dict
+
+    Returns:
+        Subtype key (e.g. "line", "16:9", "3 topics")
+    """
+    if api_type == "chart":
+        return str(request.get("chart_type", "bar"))
+    if api_type == "diagram":
+        return str(request.get("diagram_type", "flowchart"))
+    if api_type == "image":
+        dimensions = request.get("dimensions") or {}
+        return str(dimensions.get("aspect_ratio") or f"{dimensions.get('width', 0)}x{dimensions.get('height', 0)}")
+    return f"{len(request.get('topics') or ())} topics"
+
+
+class QuantileSketch:
+    """
+    Latency quantiles from log-spaced bucket counts.
+
+    A value lands in bucket ceil(log_gamma(seconds)); every value in a
+    bucket is within the relative accuracy of the bucket's midpoint.
+    Counts go to the current window; when it holds `window` values it
+    replaces the previous one, so quantiles cover the last window to
+    two windows of calls.
+    """
+
+    def __init__(self, relative_accuracy: float = QUANTILE_RELATIVE_ACCURACY, window: int = 500):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.window = max(1, window)
+        self._current: Dict[int, int] = {}
+        self._previous: Dict[int, int] = {}
+        self._current_count = 0
+        self._previous_count = 0
+
+    @property
+    def count(self) -> int:
+        """Values the quantiles are computed over."""
+        return self._current_count + self._previous_count
+
+    def add(self, seconds: float) -> None:
+        """Record one latency."""
+        index = math.ceil(math.log(max(seconds, MIN_SKETCH_SECONDS)) / self._log_gamma)
+        self._current[index] = self._current.get(index, 0) + 1
+        self._current_count += 1
+        if self._current_count >= self.window:
+            self._previous, self._previous_count = self._current, self._current_count
+            self._current, self._current_count = {}, 0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Return the q-quantile (0 <= q <= 1) in seconds, None if empty.
+        """
+        total = self.count
+        if total == 0:
+            return None
+
+        counts = dict(self._previous)
+        for index, n in self._current.items():
+            counts[index] = counts.get(index, 0) + n
+
+        rank = q * (total - 1)
+        seen = 0
+        for index in sorted(counts):
+            seen += counts[index]
+            if seen > rank:
+                break
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+
+class LatencyModel:
+    """EWMA latency estimates keyed by (service, subtype)."""
+
+    def __init__(
+        self,
+        alpha: float = 0.2,
+        defaults: Optional[Dict[str, float]] = None,
+        sketch_window: int = 500
+    ):
+        """
+        Initialize model.
+
+        Args:
+            alpha: Weight of the newest observation
+            defaults: Seconds per API type before observations
+                (default: DEFAULT_COSTS)
+            sketch_window: Calls per quantile sketch window
+        """
+        self.alpha = alpha
+        self.defaults = {**DEFAULT_COSTS, **(defaults or {})}
+        self.sketch_window = sketch_window
+        self._estimates: Dict[Tuple[str, Optional[str]], float] = {}
+        self._samples: Dict[Tuple[str, Optional[str]], int] = {}
+        self._sketches: Dict[Tuple[str, Optional[str]], QuantileSketch] = {}
+
+    @classmethod
+    def from_env(cls) -> "LatencyModel":
+        """Build model from environment variables."""
+        return cls(
+            alpha=float(os.getenv("LATENCY_EWMA_ALPHA", "0.2")),
+            sketch_window=int(os.getenv("LATENCY_SKETCH_WINDOW", "500"))
+        )
+
+    def estimate(self, api_type: str, request: Mapping[str, Any]) -> float:
+        """
+        Expected seconds for a call.
+
+        Returns:
+            Subtype estimate, else service estimate, else the static default
+        """
+        subtype = self._estimates.get((api_type, latency_subtype(api_type, request)))
+        if subtype is not None:
+            return subtype
+        service = self._estimates.get((api_type, None))
+        if service is not None:
+            return service
+        return self.defaults.get(api_type, 1.0)
+
+    def quantile(
+        self,
+        api_type: str,
+        request: Optional[Mapping[str, Any]],
+        q: float,
+        min_samples: int = 20
+    ) -> Optional[float]:
+        """
+        Latency quantile for a call (e.g. q=0.999 for a timeout).
+
+        Args:
+            api_type: API type
+            request: Request dict (None: the whole service)
+            q: Quantile, 0-1
+            min_samples: Sketch size needed to trust the quantile
+
+        Returns:
+            Subtype quantile, else service quantile, else None (too few
+            observations)
+        """
+        keys = [(api_type, None)]
+        if request is not None:
+            keys.insert(0, (api_type, latency_subtype(api_type, request)))
+        for key in keys:
+            sketch = self._sketches.get(key)
+            if sketch is not None and sketch.count >= min_samples:
+                return sketch.quantile(q)
+        return None
+
+    def observe(self, api_type: str, request: Mapping[str, Any], seconds: float) -> None:
+        """Record a completed call's latency."""
+        for key in ((api_type, latency_subtype(api_type, request)), (api_type, None)):
+            current = self._estimates.get(key)
+            self._estimates[key] = seconds if current is None else current + self.alpha * (seconds - current)
+            self._samples[key] = self._samples.get(key, 0) + 1
+            sketch = self._sketches.get(key)
+            if sketch is None:
+                sketch = self._sketches[key] = QuantileSketch(window=self.sketch_window)
+            sketch.add(seconds)
+
+    def observe_timeout(self, api_type: str, request: Mapping[str, Any], seconds: float) -> None:
+        """Record a call cut off after `seconds` (quantile sketch only)."""
+        for key in ((api_type, latency_subtype(api_type, request)), (api_type, None)):
+            sketch = self._sketches.get(key)
+            if sketch is None:
+                sketch = self._sketches[key] = QuantileSketch(window=self.sketch_window)
+            sketch.add(seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return current estimates:
+        {api_type: {"all"|subtype: {seconds, samples, p50, p90, p99}}}.
+        """
+        stats: Dict[str, Any] = {}
+        for (api_type, subtype), seconds in sorted(self._estimates.items(), key=lambda item: str(item[0])):
+            sketch = self._sketches[(api_type, subtype)]
+            stats.setdefault(api_type, {})[subtype or "all"] = {
+                "seconds": round(seconds, 3),
+                "samples": self._samples[(api_type, subtype)],
+                **{f"p{int(q * 100)}": round(sketch.quantile(q), 3) for q in (0.5, 0.9, 0.99)}
+            }
+        return stats
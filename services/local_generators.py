@@ -0,0 +1,353 @@
+"""
+Local Generators - v2.0
+========================
+
+Deterministic, in-process content generators.
+
+Simple layouts do not need an LLM: an L01 title slide only needs a
+subtitle, and L05 bullet lists usually end up showing the slide's
+key_points anyway. The local tier builds that text from key_points and
+narrative with templates and constraint-aware trimming in microseconds,
+so these slides never wait 5-15s on the text service.
+
+Draft enrichment also uses the local tier for every other kind: chart
+data parsed from the guidance ("Q1=$25k, Q2=$35k") and placeholder
+images/diagrams sized to the layout.
+
+Local clients expose the same `generate(request)` interface as the API
+clients. GenerationPolicy decides per layout which tier serves a request.
+placeholder_result() is the fallback chain's last tier.
+
+Performance: <100µs per request
+"""
+
+import logging
+import os
+import re
+import time
+from typing import Dict, Any, Iterable, List, Optional
+
+from models.director_models import (
+    GeneratedText,
+    GeneratedChart,
+    GeneratedImage,
+    GeneratedDiagram
+)
+
+logger = logging.getLogger(__name__)
+
+PLACEHOLDER_URL = "https://via.placeholder.com/{width}x{height}"
+
+# One data point per comma/semicolon segment, number at the end:
+# "Q1=$25k", "Revenue: 12.5%", "North $40", "West 12%"
+# → (label, separator, currency, number, suffix). A number after a plain
+# space needs a currency or unit marker ("Revenue 2024" is not a point).
+_DATA_POINT_RE = re.compile(
+    r"^(.*?[^\s=:])(?:\s*([=:])\s*|\s+)([$€£]?)(-?\d+(?:\.\d+)?)\s*([kKmMbB%]?)$"
+)
+
+_SCALE = {"k": 1e3, "m": 1e6, "b": 1e9}
+
+
+def trim_to_limit(text: str, limit: Optional[int]) -> str:
+    """
+    Trim text to a character limit on a word boundary.
+
+    Args:
+        text: Text to trim
+        limit: Maximum characters (None = no limit)
+
+    Returns:
+        Text of at most `limit` characters, ending in "..." if trimmed
+    """
+    if not limit or len(text) <= limit:
+        return text
+    if limit <= 3:
+        return text[:limit]
+
+    cut = text[:limit - 3]
+    space = cut.rfind(" ")
+    if space > 0 and text[limit - 3] != " ":
+        # Cut fell inside a word - back off to the previous word
+        cut = cut[:space]
+    return cut.rstrip(" ,;:.-") + "..."
+
+
+def _as_sentence(text: str) -> str:
+    """Normalize a key point into a sentence fragment without final period."""
+    text = " ".join(text.split()).rstrip(".")
+    # ". " is the stitcher's sentence separator - keep items atomic
+    text = text.replace(". ", "; ")
+    return text[:1].upper() + text[1:]
+
+
+class LocalTextClient:
+    """
+    Template-based text generator.
+
+    Templates by layout:
+    - L01: one-line subtitle from narrative (or first key point)
+    - Bullet layouts (L05, L17 or any request with max_items): one item
+      per key point, joined with ". " so the stitcher splits them back
+    - Everything else: narrative + key points as a short paragraph
+    """
+
+    SUBTITLE_LAYOUTS = frozenset({"L01"})
+
+    def __init__(self):
+        """Initialize local text generator."""
+        logger.info("LocalTextClient initialized (deterministic templates)")
+
+    async def generate(self, request: Dict[str, Any]) -> GeneratedText:
+        """
+        Generate text locally from key_points and narrative.
+
+        Args:
+            request: Text request (topics, narrative, constraints, layout_id)
+
+        Returns:
+            GeneratedText
+        """
+        start = time.perf_counter()
+
+        topics = [t for t in request.get("topics", []) if t and t.strip()]
+        narrative = (request.get("narrative") or "").strip()
+        constraints = request.get("constraints") or {}
+        layout_id = request.get("layout_id", "")
+
+        if layout_id in self.SUBTITLE_LAYOUTS:
+            template = "subtitle"
+            content = self._subtitle(narrative, topics, constraints)
+        elif constraints.get("max_items") or layout_id in ("L05", "L17"):
+            template = "bullets"
+            content = self._bullets(topics or [narrative], constraints)
+        else:
+            template = "paragraph"
+            content = self._paragraph(narrative, topics, constraints)
+
+        return GeneratedText(
+            content=content,
+            metadata={
+                "word_count": len(content.split()),
+                "template": template,
+                "generation_time_ms": round((time.perf_counter() - start) * 1000, 3),
+                "source": "local_text_generator"
+            }
+        )
+
+    def _subtitle(self, narrative: str, topics: List[str], constraints: Dict[str, Any]) -> str:
+        text = narrative or (topics[0] if topics else "")
+        return trim_to_limit(_as_sentence(text), constraints.get("max_characters"))
+
+    def _bullets(self, topics: List[str], constraints: Dict[str, Any]) -> str:
+        max_items = constraints.get("max_items")
+        item_limit = constraints.get("max_item_characters")
+
+        items = [
+            trim_to_limit(_as_sentence(topic), item_limit)
+            for topic in (topics[:max_items] if max_items else topics)
+        ]
+        content = ". ".join(item for item in items if item)
+
+        return trim_to_limit(content, constraints.get("max_characters"))
+
+    def _paragraph(self, narrative: str, topics: List[str], constraints: Dict[str, Any]) -> str:
+        sentences = [_as_sentence(narrative)] if narrative else []
+        sentences.extend(_as_sentence(topic) for topic in topics)
+        content = ". ".join(s for s in sentences if s)
+        if content:
+            content += "."
+
+        return trim_to_limit(content, constraints.get("max_characters"))
+
+
+class LocalChartClient:
+    """
+    Chart data straight from the guidance - no rendered image.
+
+    Extracts label/value pairs from the chart request's content and goal.
+    Without numbers in the guidance the chart has labels only.
+    """
+
+    def __init__(self):
+        """Initialize local chart generator."""
+        logger.info("LocalChartClient initialized (guidance data)")
+
+    async def generate(self, request: Dict[str, Any]) -> GeneratedChart:
+        """
+        Build Chart.js data from the request's guidance text.
+
+        Args:
+            request: Chart request (goal, content, chart_type)
+
+        Returns:
+            GeneratedChart without URL
+        """
+        text = request.get("content") or request.get("goal") or ""
+        labels, values = self.extract_data_points(text)
+
+        return GeneratedChart(
+            type=request.get("chart_type", "bar"),
+            data={
+                "labels": labels,
+                "datasets": [{
+                    "label": request.get("goal") or "Data",
+                    "data": values
+                }]
+            },
+            url=None,
+            metadata={
+                "data_points": len(values),
+                "source": "local_chart_generator"
+            }
+        )
+
+    @staticmethod
+    def extract_data_points(text: str) -> tuple:
+        """
+        Extract (labels, values) from guidance text.
+
+        Returns:
+            Tuple of (labels list, values list); values empty if none found
+        """
+        labels = []
+        values = []
+
+        for segment in re.split(r"[,;\n]", text):
+            match = _DATA_POINT_RE.match(segment.strip())
+            if not match:
+                continue
+
+            label, separator, currency, number, suffix = match.groups()
+            if not (separator or currency or suffix):
+                continue  # "Launch in 2025" - a year, not a value
+
+            value = float(number)
+            if suffix.lower() in _SCALE:
+                value *= _SCALE[suffix.lower()]
+
+            # "Revenue for 2024: Q1=$25k" → "Q1"
+            labels.append(label.rsplit(":", 1)[-1].strip())
+            values.append(int(value) if value.is_integer() else value)
+
+        if not values:
+            labels = [part.strip() for part in re.split(r",|\band\b", text) if part.strip()]
+
+        return labels, values
+
+
+def placeholder_result(api_type: str, request: Dict[str, Any]) -> Any:
+    """
+    Build a minimal result for a request without any generation.
+
+    Text is the key points as they are, charts have no data and a
+    placeholder image, images/diagrams are placeholder images.
+
+    Args:
+        api_type: Type of API ("text", "chart", "image", "diagram")
+        request: Request dict
+
+    Returns:
+        Generated model with metadata["placeholder"] set
+    """
+    if api_type == "text":
+        topics = [t.strip() for t in request.get("topics", []) if t and t.strip()]
+        return GeneratedText(
+            content=". ".join(topics) or (request.get("narrative") or "").strip(),
+            metadata={"placeholder": True, "source": "placeholder_text"}
+        )
+    elif api_type == "chart":
+        return GeneratedChart(
+            type=request.get("chart_type", "bar"),
+            data={},
+            url=PLACEHOLDER_URL.format(width=800, height=400),
+            metadata={"placeholder": True, "source": "placeholder_chart"}
+        )
+    elif api_type == "image":
+        dimensions = request.get("dimensions") or {}
+        width = dimensions.get("width", 1600)
+        height = dimensions.get("height", 900)
+
+        return GeneratedImage(
+            url=PLACEHOLDER_URL.format(width=width, height=height),
+            caption=request.get("goal") or request.get("content") or "Illustrative image",
+            metadata={
+                "placeholder": True,
+                "aspect_ratio": dimensions.get("aspect_ratio"),
+                "source": "placeholder_image"
+            }
+        )
+    elif api_type == "diagram":
+        return GeneratedDiagram(
+            type=request.get("diagram_type", "flowchart"),
+            url=PLACEHOLDER_URL.format(width=800, height=600),
+            data=None,
+            metadata={
+                "placeholder": True,
+                "source": "placeholder_diagram"
+            }
+        )
+    raise ValueError(f"Unknown API type: {api_type}")
+
+
+class PlaceholderImageClient:
+    """Placeholder image sized to the requested dimensions."""
+
+    async def generate(self, request: Dict[str, Any]) -> GeneratedImage:
+        """Return a placeholder GeneratedImage for the request."""
+        return placeholder_result("image", request)
+
+
+class PlaceholderDiagramClient:
+    """Placeholder diagram of the requested type."""
+
+    async def generate(self, request: Dict[str, Any]) -> GeneratedDiagram:
+        """Return a placeholder GeneratedDiagram for the request."""
+        return placeholder_result("diagram", request)
+
+
+class GenerationPolicy:
+    """
+    Chooses the local or remote tier per API type and layout.
+
+    Configured with LOCAL_TEXT_LAYOUTS (comma-separated layout IDs,
+    default "L01").
+    """
+
+    def __init__(self, local_text_layouts: Iterable[str] = ("L01",)):
+        """
+        Initialize policy.
+
+        Args:
+            local_text_layouts: Layout IDs whose text is generated locally
+        """
+        self.local_layouts = {
+            "text": frozenset(local_text_layouts)
+        }
+
+    @classmethod
+    def from_env(cls) -> "GenerationPolicy":
+        """Build policy from environment variables."""
+        layouts = os.getenv("LOCAL_TEXT_LAYOUTS", "L01")
+        return cls(local_text_layouts=[l.strip() for l in layouts.split(",") if l.strip()])
+
+    def route(self, api_type: str, layout_id: str) -> str:
+        """Return "local" or "remote" for a request."""
+        if layout_id in self.local_layouts.get(api_type, ()):
+            return "local"
+        return "remote"
+
+    def apply(self, all_requests: Dict[str, List[Dict[str, Any]]]) -> int:
+        """
+        Mark requests served by the local tier (request["route"] = "local").
+
+        Returns:
+            Number of requests routed locally
+        """
+        local_count = 0
+        for api_type, requests in all_requests.items():
+            for request in requests:
+                if self.route(api_type, request.get("layout_id", "")) == "local":
+                    request["route"] = "local"
+                    local_count += 1
+        return local_count
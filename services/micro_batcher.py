@@ -0,0 +1,172 @@
+"""
+Micro Batcher - v2.0
+=====================
+
+Collects same-type service calls into batch requests.
+
+Requests submitted by any slide of any concurrent deck are queued per
+API type and flushed as one `client.generate_batch()` call when either
+the batch is full (MICRO_BATCH_MAX_SIZE) or the oldest queued request
+has waited MICRO_BATCH_LINGER_MS. Each caller awaits its own future and
+gets its own result (or error) back.
+
+Only clients with `supports_batch = True` are batched - i.e. clients
+whose generate_batch() calls a real batch endpoint rather than fanning
+out single calls.
+
+Performance: one round trip and one LLM prompt setup per batch instead
+of per request, for at most MICRO_BATCH_LINGER_MS added latency
+"""
+
+import asyncio
+import logging
+import os
+from typing import Dict, Any, List, Callable, Awaitable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """
+    Size/linger-bounded batching of requests for one client.
+
+    Usage:
+        batcher = MicroBatcher("text", client.generate_batch)
+        result = await batcher.submit(request)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        flush_batch: Callable[[List[Dict[str, Any]]], Awaitable[List[Any]]],
+        max_batch_size: int = 16,
+        linger_ms: float = 5.0
+    ):
+        """
+        Initialize batcher.
+
+        Args:
+            name: API type (for logs/metrics)
+            flush_batch: Batch call - takes a list of requests, returns one
+                result per request (an Exception entry fails that request)
+            max_batch_size: Flush as soon as this many requests are queued
+            linger_ms: Flush at most this long after the first request queued
+        """
+        self.name = name
+        self.flush_batch = flush_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.linger_ms = linger_ms
+
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: set = set()
+
+        self.stats = {"batches": 0, "items": 0, "size_flushes": 0, "linger_flushes": 0, "max_batch": 0}
+
+    async def submit(self, request: Dict[str, Any]) -> Any:
+        """
+        Queue a request for the next batch and wait for its result.
+
+        Args:
+            request: Request dict for the client
+
+        Returns:
+            The client's result for this request
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((request, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self.stats["size_flushes"] += 1
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.linger_ms / 1000.0, self._on_linger)
+
+        # Cancelling the caller cancels only its future - the batch task
+        # is shared and keeps running for the others
+        return await future
+
+    def _on_linger(self) -> None:
+        self._timer = None
+        if self._pending:
+            self.stats["linger_flushes"] += 1
+            self._flush()
+
+    def _flush(self) -> None:
+        """Send everything queued as one batch call."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        # Requests whose caller was cancelled while queued are dropped
+        batch = [(request, future) for request, future in batch if not future.cancelled()]
+        if not batch:
+            return
+
+        self.stats["batches"] += 1
+        self.stats["items"] += len(batch)
+        self.stats["max_batch"] = max(self.stats["max_batch"], len(batch))
+
+        task = asyncio.ensure_future(self._run_batch(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _run_batch(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        try:
+            results = await self.flush_batch([request for request, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"{self.name} batch returned {len(results)} results for {len(batch)} requests"
+                )
+        except Exception as e:
+            logger.error(f"{self.name} batch of {len(batch)} failed: {e}")
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return batching statistics."""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "linger_ms": self.linger_ms,
+            "queued": len(self._pending),
+            "avg_batch": round(self.stats["items"] / self.stats["batches"], 2) if self.stats["batches"] else 0.0,
+            **self.stats
+        }
+
+
+def build_micro_batchers(clients: Dict[str, Any]) -> Dict[str, MicroBatcher]:
+    """
+    Build a MicroBatcher for every client with a real batch endpoint.
+
+    Args:
+        clients: Client by API type
+
+    Returns:
+        Batchers by API type (empty if MICRO_BATCHING=false)
+    """
+    if os.getenv("MICRO_BATCHING", "true").lower() != "true":
+        return {}
+
+    max_batch_size = int(os.getenv("MICRO_BATCH_MAX_SIZE", "16"))
+    linger_ms = float(os.getenv("MICRO_BATCH_LINGER_MS", "5"))
+
+    batchers = {
+        api_type: MicroBatcher(api_type, client.generate_batch, max_batch_size, linger_ms)
+        for api_type, client in clients.items()
+        if getattr(client, "supports_batch", False)
+    }
+    if batchers:
+        logger.info(
+            f"Micro-batching enabled for {', '.join(batchers)} "
+            f"(max {max_batch_size}, linger {linger_ms}ms)"
+        )
+    return batchers
@@ -11,7 +11,8 @@ Performance: <1ms per request
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 from utils.guidance_parser import parse_guidance
 
 logger = logging.getLogger(__name__)
@@ -26,13 +27,58 @@ class RequestBuilder:
 
     def __init__(self):
         """Initialize request builder."""
+        # Text constraints only vary by character limit - share one
+        # immutable mapping per limit instead of a new dict per request
+        self._text_constraints: Dict[tuple, Mapping[str, Any]] = {}
         logger.info("RequestBuilder initialized (v2.0 - no GenAI)")
 
+    def build_slide_context(
+        self,
+        slide: Any,
+        presentation_context: Mapping[str, Any]
+    ) -> Mapping[str, Any]:
+        """
+        Build the immutable context shared by all requests of a slide.
+
+        Args:
+            slide: Slide being built
+            presentation_context: Overall presentation info
+
+        Returns:
+            Read-only mapping with theme, audience and slide title
+        """
+        return MappingProxyType({
+            "theme": presentation_context.get("overall_theme", ""),
+            "audience": presentation_context.get("target_audience", ""),
+            "presentation_context": presentation_context.get("summary", ""),
+            "slide_title": slide.title
+        })
+
+    def _get_text_constraints(
+        self,
+        char_limit: Optional[int],
+        max_items: Optional[int] = None,
+        item_char_limit: Optional[int] = None
+    ) -> Mapping[str, Any]:
+        """Return the shared constraints mapping for a set of limits."""
+        key = (char_limit, max_items, item_char_limit)
+        constraints = self._text_constraints.get(key)
+        if constraints is None:
+            constraints = MappingProxyType({
+                "max_characters": char_limit,
+                "max_items": max_items,
+                "max_item_characters": item_char_limit,
+                "style": "professional",
+                "tone": "data-driven"
+            })
+            self._text_constraints[key] = constraints
+        return constraints
+
     def build_all_requests(
         self,
         slide: Any,
         layout_assignment: Any,
-        presentation_context: Dict[str, Any]
+        presentation_context: Mapping[str, Any]
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         Build all API requests for a slide in one shot.
@@ -58,27 +104,30 @@ class RequestBuilder:
             "diagram": []
         }
 
+        # One context object shared by every request of this slide
+        context = self.build_slide_context(slide, presentation_context)
+
         # Build text requests from key_points
         if hasattr(slide, 'key_points') and slide.key_points:
-            text_req = self.build_text_request(slide, layout_assignment, presentation_context)
+            text_req = self.build_text_request(slide, layout_assignment, presentation_context, context)
             if text_req:
                 requests["text"].append(text_req)
 
         # Build chart requests from analytics_needed
         if hasattr(slide, 'analytics_needed') and slide.analytics_needed:
-            chart_req = self.build_chart_request(slide, layout_assignment, presentation_context)
+            chart_req = self.build_chart_request(slide, layout_assignment, presentation_context, context)
             if chart_req:
                 requests["chart"].append(chart_req)
 
         # Build image requests from visuals_needed
         if hasattr(slide, 'visuals_needed') and slide.visuals_needed:
-            image_req = self.build_image_request(slide, layout_assignment, presentation_context)
+            image_req = self.build_image_request(slide, layout_assignment, presentation_context, context)
             if image_req:
                 requests["image"].append(image_req)
 
         # Build diagram requests from diagrams_needed
         if hasattr(slide, 'diagrams_needed') and slide.diagrams_needed:
-            diagram_req = self.build_diagram_request(slide, layout_assignment, presentation_context)
+            diagram_req = self.build_diagram_request(slide, layout_assignment, presentation_context, context)
             if diagram_req:
                 requests["diagram"].append(diagram_req)
 
@@ -88,7 +137,8 @@ class RequestBuilder:
         self,
         slide: Any,
         layout_assignment: Any,
-        presentation_context: Dict[str, Any]
+        presentation_context: Mapping[str, Any],
+        context: Optional[Mapping[str, Any]] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Build text generation request from key_points.
@@ -99,6 +149,7 @@ class RequestBuilder:
             slide: Slide with key_points
             layout_assignment: Layout with character limits
             presentation_context: Overall theme/audience
+            context: Shared slide context (default: built for this request)
 
         Returns:
             API request dict
@@ -110,34 +161,37 @@ class RequestBuilder:
         char_limit = None
         if layout_assignment.constraints.character_limits:
             # Get the first text field limit (body_text, summary, etc.)
-            for field in ["body_text", "summary", "description", "content"]:
+            for field in ["body_text", "summary", "description", "content", "subtitle"]:
                 if field in layout_assignment.constraints.character_limits:
                     char_limit = layout_assignment.constraints.character_limits[field]
                     break
 
+        # Array limits for layouts that split text into bullets/insights
+        max_items = None
+        item_char_limit = None
+        for field in ["bullets", "key_insights"]:
+            if field in layout_assignment.constraints.array_limits:
+                max_items = layout_assignment.constraints.array_limits[field]
+                item_char_limit = layout_assignment.constraints.array_item_limits.get(f"{field}_item")
+                break
+
         return {
             "slide_id": slide.slide_id,
             "slide_number": slide.slide_number,
+            "layout_id": layout_assignment.layout_id,
             "type": "text",
             "topics": slide.key_points,
             "narrative": slide.narrative if hasattr(slide, 'narrative') else "",
-            "context": {
-                "theme": presentation_context.get("overall_theme", ""),
-                "audience": presentation_context.get("target_audience", ""),
-                "slide_title": slide.title
-            },
-            "constraints": {
-                "max_characters": char_limit,
-                "style": "professional",
-                "tone": "data-driven"
-            }
+            "context": context or self.build_slide_context(slide, presentation_context),
+            "constraints": self._get_text_constraints(char_limit, max_items, item_char_limit)
         }
 
     def build_chart_request(
         self,
         slide: Any,
         layout_assignment: Any,
-        presentation_context: Dict[str, Any]
+        presentation_context: Mapping[str, Any],
+        context: Optional[Mapping[str, Any]] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Build chart generation request from analytics_needed guidance.
@@ -148,6 +202,7 @@ class RequestBuilder:
             slide: Slide with analytics_needed
             layout_assignment: Layout with dimension constraints
             presentation_context: Overall context
+            context: Shared slide context (default: built for this request)
 
         Returns:
             Chart API request dict
@@ -182,23 +237,22 @@ class RequestBuilder:
         return {
             "slide_id": slide.slide_id,
             "slide_number": slide.slide_number,
+            "layout_id": layout_assignment.layout_id,
             "type": "chart",
             "goal": guidance.get("goal", ""),
             "content": guidance.get("content", ""),
             "chart_type": chart_type,
             "style": guidance.get("style", ""),
             "dimensions": dimensions,
-            "context": {
-                "theme": presentation_context.get("overall_theme", ""),
-                "slide_title": slide.title
-            }
+            "context": context or self.build_slide_context(slide, presentation_context)
         }
 
     def build_image_request(
         self,
         slide: Any,
         layout_assignment: Any,
-        presentation_context: Dict[str, Any]
+        presentation_context: Mapping[str, Any],
+        context: Optional[Mapping[str, Any]] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Build image generation request from visuals_needed guidance.
@@ -209,6 +263,7 @@ class RequestBuilder:
             slide: Slide with visuals_needed
             layout_assignment: Layout with dimension constraints
             presentation_context: Overall context
+            context: Shared slide context (default: built for this request)
 
         Returns:
             Image API request dict
@@ -233,23 +288,21 @@ class RequestBuilder:
         return {
             "slide_id": slide.slide_id,
             "slide_number": slide.slide_number,
+            "layout_id": layout_assignment.layout_id,
             "type": "image",
             "goal": guidance.get("goal", ""),
             "content": guidance.get("content", ""),
             "style": guidance.get("style", ""),
             "dimensions": dimensions,
-            "context": {
-                "theme": presentation_context.get("overall_theme", ""),
-                "audience": presentation_context.get("target_audience", ""),
-                "slide_title": slide.title
-            }
+            "context": context or self.build_slide_context(slide, presentation_context)
         }
 
     def build_diagram_request(
         self,
         slide: Any,
         layout_assignment: Any,
-        presentation_context: Dict[str, Any]
+        presentation_context: Mapping[str, Any],
+        context: Optional[Mapping[str, Any]] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Build diagram generation request from diagrams_needed guidance.
@@ -260,6 +313,7 @@ class RequestBuilder:
             slide: Slide with diagrams_needed
             layout_assignment: Layout with constraints
             presentation_context: Overall context
+            context: Shared slide context (default: built for this request)
 
         Returns:
             Diagram API request dict
@@ -285,13 +339,11 @@ class RequestBuilder:
         return {
             "slide_id": slide.slide_id,
             "slide_number": slide.slide_number,
+            "layout_id": layout_assignment.layout_id,
             "type": "diagram",
             "goal": guidance.get("goal", ""),
             "content": guidance.get("content", ""),
             "diagram_type": diagram_type,
             "style": guidance.get("style", ""),
-            "context": {
-                "theme": presentation_context.get("overall_theme", ""),
-                "slide_title": slide.title
-            }
+            "context": context or self.build_slide_context(slide, presentation_context)
         }
@@ -23,6 +23,34 @@ from models.layout_models import LayoutAssignment, ValidationStatus
 
 logger = logging.getLogger(__name__)
 
+# API result kinds each layout mapper actually reads. Layouts not listed
+# go through _map_generic, which reads every kind. Keep in sync with the
+# _map_* methods below - RequestCompiler prunes requests with it.
+LAYOUT_CONSUMPTION: Dict[str, frozenset] = {
+    "L01": frozenset({"text"}),            # subtitle only
+    "L05": frozenset({"text"}),            # bullets
+    "L10": frozenset({"text", "image"}),   # body_text + image_url
+    "L17": frozenset({"text", "chart"}),   # key_insights + chart_url/chart_data
+}
+
+ALL_API_TYPES = frozenset({"text", "chart", "image", "diagram"})
+
+
+def consumed_api_types(layout_id: str) -> frozenset:
+    """Return the API result kinds the mapper for layout_id reads."""
+    return LAYOUT_CONSUMPTION.get(layout_id, ALL_API_TYPES)
+
+
+def empty_api_results() -> Dict[str, Any]:
+    """Return the dispatcher result structure for a slide with no results."""
+    return {
+        "text": None,
+        "charts": [],
+        "images": [],
+        "diagrams": [],
+        "errors": []
+    }
+
 
 class ResultStitcher:
     """
@@ -69,8 +97,36 @@ class ResultStitcher:
             layout_id=layout_assignment.layout_id
         )
 
-        # Create enriched slide
-        enriched_slide = EnrichedSlide(
+        return self.build_enriched_slide(
+            slide=slide,
+            layout_assignment=layout_assignment,
+            mapped_content=mapped_content,
+            validation_status=validation_status
+        )
+
+    def build_enriched_slide(
+        self,
+        slide: Any,
+        layout_assignment: LayoutAssignment,
+        mapped_content: Dict[str, Any],
+        validation_status: ValidationStatus
+    ) -> EnrichedSlide:
+        """
+        Create an EnrichedSlide from already-mapped content.
+
+        Lets callers map once, validate the mapped content, and stitch
+        without mapping again.
+
+        Args:
+            slide: Original slide from strawman
+            layout_assignment: Layout assignment for this slide
+            mapped_content: Output of _map_to_layout
+            validation_status: Validation status for mapped_content
+
+        Returns:
+            EnrichedSlide ready for Director
+        """
+        return EnrichedSlide(
             original_slide=slide,
             slide_id=slide.slide_id,
             layout_id=layout_assignment.layout_id,
@@ -78,8 +134,6 @@ class ResultStitcher:
             validation_status=validation_status
         )
 
-        return enriched_slide
-
     def _map_to_layout(
         self,
         slide: Any,
@@ -284,13 +338,7 @@ class ResultStitcher:
         enriched_slides = []
 
         for slide, layout_assignment in zip(slides, layout_assignments):
-            api_results = all_api_results.get(slide.slide_id, {
-                "text": None,
-                "charts": [],
-                "images": [],
-                "diagrams": [],
-                "errors": []
-            })
+            api_results = all_api_results.get(slide.slide_id) or empty_api_results()
 
             validation_status = all_validation_statuses.get(
                 slide.slide_id,
@@ -16,6 +16,7 @@ from models.layout_models import (
     LayoutConstraints,
     ValidationStatus,
     ValidationViolation,
+    ValidationReport,
     LayoutAssignment
 )
 
@@ -234,3 +235,36 @@ class SLAValidator:
             if field not in content or content[field] is None:
                 return False
         return True
+
+
+class ValidationReportBuilder:
+    """
+    Builds a ValidationReport incrementally, one slide status at a time.
+    """
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self.total_slides = 0
+        self.compliant_slides = 0
+        self.total_violations = 0
+        self.critical_violations = 0
+
+    def add(self, validation_status: ValidationStatus) -> None:
+        """Count one slide's validation status."""
+        self.total_slides += 1
+        if validation_status.compliant:
+            self.compliant_slides += 1
+        self.total_violations += len(validation_status.violations)
+        self.critical_violations += sum(
+            1 for v in validation_status.violations if v.severity == "critical"
+        )
+
+    def build(self) -> ValidationReport:
+        """Return the report for all slides added so far."""
+        return ValidationReport(
+            overall_compliant=(self.critical_violations == 0),
+            total_slides=self.total_slides,
+            compliant_slides=self.compliant_slides,
+            total_violations=self.total_violations,
+            critical_violations=self.critical_violations
+        )
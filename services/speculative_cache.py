@@ -0,0 +1,176 @@
+"""
+Speculative Cache - v2.0
+=========================
+
+Short-lived cache of speculative generations.
+
+The Director sends the strawman before layout selection is final. Chart,
+image and diagram requests depend almost entirely on the slide guidance,
+so they can start right away and overlap with the Director's layout
+phase. Each speculative generation is kept here as an asyncio task (in
+flight or done) under a layout-independent key; the dispatcher attaches
+to it when the real enrichment arrives.
+
+A speculative result is only attached when the layout-dependent part of
+the real request (its dimensions) matches what was speculated.
+
+Performance: O(1) per lookup, entries expire after ttl_seconds
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Awaitable, Callable, Optional
+
+from services.request_compiler import FINGERPRINT_FIELDS, _json_default
+
+logger = logging.getLogger(__name__)
+
+# API types worth speculating on - text constraints come from the layout
+SPECULATIVE_API_TYPES = ("chart", "image", "diagram")
+
+# Request fields that depend on the layout rather than the guidance
+LAYOUT_DEPENDENT_FIELDS = ("dimensions",)
+
+
+def speculation_key(api_type: str, request: Dict[str, Any]) -> str:
+    """
+    Compute the layout-independent key of a request.
+
+    Same as request_fingerprint without LAYOUT_DEPENDENT_FIELDS.
+
+    Args:
+        api_type: "chart", "image" or "diagram"
+        request: Request dict
+
+    Returns:
+        32-char hex digest
+    """
+    fields = [f for f in FINGERPRINT_FIELDS.get(api_type, ()) if f not in LAYOUT_DEPENDENT_FIELDS]
+    payload = [api_type] + [request.get(field) for field in fields]
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=_json_default)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+
+class SpeculativeCache:
+    """
+    Layout-independent key → speculative generation task.
+
+    Entry layout:
+    {
+        "task": asyncio.Task,
+        "dimensions": dict or None,
+        "created_at": float
+    }
+    """
+
+    def __init__(self, ttl_seconds: float = 120.0, max_entries: int = 500):
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: How long a speculative generation stays attachable
+            max_entries: Maximum number of entries (oldest evicted first)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.stats = {
+            "started": 0,
+            "hits": 0,
+            "misses": 0,
+            "mismatched": 0,
+            "failed": 0
+        }
+
+    def start(
+        self,
+        api_type: str,
+        request: Dict[str, Any],
+        generate: Callable[[], Awaitable[Any]]
+    ) -> bool:
+        """
+        Start a speculative generation unless one is already cached.
+
+        Must be called from a running event loop.
+
+        Args:
+            api_type: API type of the request
+            request: Request dict
+            generate: Zero-argument coroutine factory doing the generation
+
+        Returns:
+            True if a new generation was started
+        """
+        key = speculation_key(api_type, request)
+        if self._get_live(key) is not None:
+            return False
+
+        task = asyncio.create_task(generate())
+        # Failures surface on attach; don't warn about unretrieved exceptions
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+        self._entries[key] = {
+            "task": task,
+            "dimensions": request.get("dimensions"),
+            "created_at": time.monotonic()
+        }
+        self._entries.move_to_end(key)
+        self.stats["started"] += 1
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        return True
+
+    def lookup(self, api_type: str, request: Dict[str, Any]) -> Optional[asyncio.Task]:
+        """
+        Find a speculative generation usable for a real request.
+
+        Args:
+            api_type: API type of the request
+            request: Real request dict (with final layout)
+
+        Returns:
+            The in-flight or finished task, or None
+        """
+        if not self._entries or api_type not in SPECULATIVE_API_TYPES:
+            return None
+
+        entry = self._get_live(speculation_key(api_type, request))
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+
+        if entry["dimensions"] != request.get("dimensions"):
+            self.stats["mismatched"] += 1
+            return None
+
+        task = entry["task"]
+        if task.done() and (task.cancelled() or task.exception() is not None):
+            self.stats["failed"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        return task
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache statistics."""
+        return {**self.stats, "entries": len(self._entries)}
+
+    def _get_live(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the entry for key unless expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if time.monotonic() - entry["created_at"] > self.ttl_seconds:
+            del self._entries[key]
+            if not entry["task"].done():
+                entry["task"].cancel()
+            return None
+
+        return entry
@@ -0,0 +1,171 @@
+"""
+Timeout Tuner - v2.0
+=====================
+
+Per-service call timeouts derived from observed latencies.
+
+The fixed <SERVICE>_SERVICE_TIMEOUT values are guesses sized for the
+worst case - a hung call holds its service slot for up to 60s. With
+ADAPTIVE_TIMEOUTS=true each service's timeout becomes
+
+    p99.9 latency (LatencyModel sketch) × (1 + ADAPTIVE_TIMEOUT_MARGIN)
+
+clamped to [ADAPTIVE_TIMEOUT_MIN, <SERVICE>_SERVICE_TIMEOUT]. It is
+recomputed at most every ADAPTIVE_TIMEOUT_UPDATE_SECONDS and only once
+ADAPTIVE_TIMEOUT_MIN_SAMPLES calls have been observed; until then the
+clients' fixed timeouts apply alone. Changes are logged.
+
+The dispatcher enforces the timeout around the client call, frees the
+fair-queueing slot, and falls back to the local tier when it fires (see
+APIDispatcher.call_client). The client's bulkhead thread is freed only
+once the transport abort shuts down the call's socket. Timed-out calls
+are recorded at their timeout in the quantile sketch (not the average
+estimate) so the quantile is not biased towards the calls that finished.
+
+Performance: O(buckets) per recompute, O(1) per call otherwise
+"""
+
+import logging
+import os
+import time
+from typing import Dict, Any, Optional
+
+from services.latency_model import LatencyModel
+
+logger = logging.getLogger(__name__)
+
+# Fixed client timeouts: the ceiling of the adaptive ones
+DEFAULT_MAX_TIMEOUTS = {
+    "text": 30.0,
+    "image": 20.0,
+    "chart": 60.0,
+    "diagram": 60.0
+}
+
+# Relative change below which a recomputed timeout is not logged
+LOG_CHANGE_RATIO = 0.1
+
+
+class AdaptiveTimeoutError(TimeoutError):
+    """A call exceeded its service's adaptive timeout."""
+
+
+class TimeoutTuner:
+    """
+    Adaptive timeout per service.
+
+    Usage:
+        timeout = tuner.timeout_for("chart")   # None: not enough data
+        ...
+        tuner.record_timeout("chart")
+    """
+
+    def __init__(
+        self,
+        latency_model: LatencyModel,
+        quantile: float = 0.999,
+        margin: float = 0.5,
+        min_timeout: float = 2.0,
+        max_timeouts: Optional[Dict[str, float]] = None,
+        min_samples: int = 200,
+        update_seconds: float = 10.0,
+        enabled: bool = False
+    ):
+        """
+        Initialize tuner.
+
+        Args:
+            latency_model: Source of latency quantiles
+            quantile: Latency quantile the timeout is based on
+            margin: Added fraction of the quantile
+            min_timeout: Lower bound (seconds)
+            max_timeouts: Upper bound per service (default: the fixed
+                client timeouts)
+            min_samples: Observed calls needed before adapting
+            update_seconds: Minimum seconds between recomputations
+            enabled: False keeps the fixed timeouts only
+        """
+        self.latency_model = latency_model
+        self.quantile = quantile
+        self.margin = margin
+        self.min_timeout = min_timeout
+        self.max_timeouts = {**DEFAULT_MAX_TIMEOUTS, **(max_timeouts or {})}
+        self.min_samples = min_samples
+        self.update_seconds = update_seconds
+        self.enabled = enabled
+
+        self._timeouts: Dict[str, Optional[float]] = {}
+        self._updated_at: Dict[str, float] = {}
+        self.stats = {"timeouts_fired": {}, "changes": 0}
+
+    def timeout_for(self, api_type: str, now: Optional[float] = None) -> Optional[float]:
+        """
+        Current timeout for a service call.
+
+        Returns:
+            Seconds, or None when disabled or too few calls were observed
+        """
+        if not self.enabled:
+            return None
+
+        now = time.monotonic() if now is None else now
+        updated_at = self._updated_at.get(api_type)
+        if updated_at is None or now - updated_at >= self.update_seconds:
+            self._updated_at[api_type] = now
+            self._update(api_type)
+        return self._timeouts.get(api_type)
+
+    def _update(self, api_type: str) -> None:
+        """Recompute a service's timeout from its latency quantile."""
+        latency = self.latency_model.quantile(api_type, None, self.quantile, min_samples=self.min_samples)
+        if latency is None:
+            return
+
+        ceiling = self.max_timeouts.get(api_type, max(self.max_timeouts.values()))
+        timeout = min(ceiling, max(self.min_timeout, latency * (1 + self.margin)))
+
+        previous = self._timeouts.get(api_type)
+        self._timeouts[api_type] = timeout
+        if previous is None or abs(timeout - previous) >= LOG_CHANGE_RATIO * previous:
+            self.stats["changes"] += 1
+            logger.info(
+                f"Adaptive {api_type} timeout {previous or ceiling:.1f}s → {timeout:.1f}s "
+                f"(p{self.quantile * 100:g} {latency:.2f}s, bounds {self.min_timeout:g}-{ceiling:g}s)"
+            )
+
+    def record_timeout(self, api_type: str) -> None:
+        """Count a call cut off by its adaptive timeout."""
+        fired = self.stats["timeouts_fired"]
+        fired[api_type] = fired.get(api_type, 0) + 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return current timeouts (None = fixed client timeout) and counts."""
+        return {
+            "enabled": self.enabled,
+            "quantile": self.quantile,
+            "margin": self.margin,
+            "timeouts": {
+                api_type: round(self._timeouts[api_type], 3) if self._timeouts.get(api_type) else None
+                for api_type in self.max_timeouts
+            },
+            "bounds": {api_type: [self.min_timeout, ceiling] for api_type, ceiling in self.max_timeouts.items()},
+            "timeouts_fired": dict(self.stats["timeouts_fired"]),
+            "changes": self.stats["changes"]
+        }
+
+
+def build_timeout_tuner(latency_model: LatencyModel) -> TimeoutTuner:
+    """Create a TimeoutTuner from environment variables."""
+    return TimeoutTuner(
+        latency_model=latency_model,
+        quantile=float(os.getenv("ADAPTIVE_TIMEOUT_QUANTILE", "0.999")),
+        margin=float(os.getenv("ADAPTIVE_TIMEOUT_MARGIN", "0.5")),
+        min_timeout=float(os.getenv("ADAPTIVE_TIMEOUT_MIN", "2")),
+        max_timeouts={
+            api_type: float(os.getenv(f"{api_type.upper()}_SERVICE_TIMEOUT", str(default)))
+            for api_type, default in DEFAULT_MAX_TIMEOUTS.items()
+        },
+        min_samples=int(os.getenv("ADAPTIVE_TIMEOUT_MIN_SAMPLES", "200")),
+        update_seconds=float(os.getenv("ADAPTIVE_TIMEOUT_UPDATE_SECONDS", "10")),
+        enabled=os.getenv("ADAPTIVE_TIMEOUTS", "false").lower() == "true"
+    )
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+Adaptive Timeouts Test
+=======================
+
+Tests timeouts derived from latency quantiles: off by default, no
+adaptation before enough samples, p99.9 plus margin within the
+configured bounds, a hung call cut off early, freeing its slot and
+falling back to the local tier without skewing the average estimate, and
+its bulkhead thread held until the transport abort lands.
+
+Run with: python tests/test_adaptive_timeouts.py
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from clients.http_transport import ServiceTransport
+from models.director_models import GeneratedImage
+from services.api_dispatcher import APIDispatcher
+from services.fair_scheduler import FairScheduler
+from services.latency_model import LatencyModel
+from services.local_generators import PlaceholderImageClient
+from services.timeout_tuner import TimeoutTuner
+
+
+class HangingImageClient:
+    """Answers in 10ms, except requests marked "hang"."""
+
+    async def generate(self, request):
+        await asyncio.sleep(5.0 if request.get("hang") else 0.01)
+        return GeneratedImage(url="http://cdn.test/a.png", caption="c", metadata={})
+
+
+class BlockedTransportImageClient:
+    """A blocking call that does not notice the abort for 0.3s."""
+
+    def __init__(self):
+        self.transport = ServiceTransport("image", threads=1)
+
+    async def generate(self, request):
+        return await self.transport.run(self._sync_generate)
+
+    def _sync_generate(self):
+        time.sleep(0.3)  # e.g. DNS or connect, before any socket to shut down
+        return GeneratedImage(url="http://cdn.test/a.png", caption="c", metadata={})
+
+
+def _trained_model(api_type, seconds, samples=200):
+    model = LatencyModel()
+    for _ in range(samples):
+        model.observe(api_type, {}, seconds)
+    return model
+
+
+def test_disabled_or_untrained_keeps_fixed_timeouts():
+    """No adaptive timeout when disabled or before min_samples calls."""
+    assert TimeoutTuner(_trained_model("text", 1.0)).timeout_for("text") is None
+
+    tuner = TimeoutTuner(_trained_model("text", 1.0, samples=50), enabled=True)
+    assert tuner.timeout_for("text") is None
+
+
+def test_timeout_from_quantile_within_bounds():
+    """Timeout = p99.9 × (1 + margin), clamped to [min, fixed timeout]."""
+    tuner = TimeoutTuner(_trained_model("text", 4.0), enabled=True)
+    assert abs(tuner.timeout_for("text") - 6.0) / 6.0 <= 0.03
+
+    assert TimeoutTuner(_trained_model("text", 0.1), enabled=True).timeout_for("text") == 2.0
+    assert TimeoutTuner(_trained_model("image", 100.0), enabled=True).timeout_for("image") == 20.0
+
+
+def test_recomputed_after_update_interval():
+    """New latencies move the timeout only once update_seconds have passed."""
+    model = _trained_model("chart", 4.0)
+    tuner = TimeoutTuner(model, enabled=True, update_seconds=10)
+    first = tuner.timeout_for("chart", now=0.0)
+
+    for _ in range(2000):
+        model.observe("chart", {}, 8.0)
+
+    assert tuner.timeout_for("chart", now=5.0) == first
+    assert tuner.timeout_for("chart", now=10.0) > first
+    assert tuner.get_stats()["changes"] == 2
+
+
+def test_hung_call_falls_back_and_frees_slot():
+    """A hanging call is cut at ~0.15s and served by the local tier."""
+    model = _trained_model("image", 0.1)
+    scheduler = FairScheduler("image", capacity=1)
+    dispatcher = APIDispatcher(
+        None, None, HangingImageClient(), None,
+        local_clients={"image": PlaceholderImageClient()},
+        fair_schedulers={"image": scheduler},
+        micro_batchers={},
+        latency_model=model,
+        timeouts=TimeoutTuner(model, min_timeout=0.05, enabled=True)
+    )
+
+    async def run():
+        started = time.monotonic()
+        hung, normal = await asyncio.gather(
+            dispatcher.call_client("image", {"slide_id": "s0", "hang": True}),
+            dispatcher.call_client("image", {"slide_id": "s1"})
+        )
+        return hung, normal, time.monotonic() - started
+
+    hung, normal, elapsed = asyncio.run(run())
+
+    assert elapsed < 1.0
+    assert hung.metadata.get("timeout_fallback") is True
+    assert normal.url == "http://cdn.test/a.png"
+    assert scheduler.in_use == 0
+
+    stats = dispatcher.get_metrics()["adaptive_timeouts"]
+    assert stats["timeouts_fired"] == {"image": 1}
+    assert stats["timeouts"]["image"] is not None
+
+    # The timeout reaches the sketch, not the average
+    assert model.get_stats()["image"]["all"]["samples"] == 201
+    assert model._sketches[("image", None)].count == 202
+
+
+def test_timeout_frees_slot_before_bulkhead_thread():
+    """The slot is free at once; the thread only when the call returns."""
+    model = _trained_model("image", 0.05)
+    scheduler = FairScheduler("image", capacity=1)
+    client = BlockedTransportImageClient()
+    dispatcher = APIDispatcher(
+        None, None, client, None,
+        local_clients={"image": PlaceholderImageClient()},
+        fair_schedulers={"image": scheduler},
+        micro_batchers={},
+        latency_model=model,
+        timeouts=TimeoutTuner(model, min_timeout=0.05, enabled=True)
+    )
+
+    async def run():
+        result = await dispatcher.call_client("image", {"slide_id": "s0"})
+        cut_off = (scheduler.in_use, client.transport.executor.active)
+        await asyncio.sleep(0.4)
+        return result, cut_off
+
+    result, cut_off = asyncio.run(run())
+
+    assert result.metadata.get("timeout_fallback") is True
+    assert cut_off == (0, 1)
+    assert client.transport.executor.active == 0
+    assert client.transport.stats["aborted_calls"] == 1
+
+
+if __name__ == "__main__":
+    test_disabled_or_untrained_keeps_fixed_timeouts()
+    test_timeout_from_quantile_within_bounds()
+    test_recomputed_after_update_interval()
+    test_hung_call_falls_back_and_frees_slot()
+    test_timeout_frees_slot_before_bulkhead_thread()
+    print("✅ ALL ADAPTIVE TIMEOUT TESTS PASSED")
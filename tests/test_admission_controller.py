@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+Admission Controller Test
+==========================
+
+Tests load shedding: requests over the in-flight, queue-depth or
+queue-delay limits are rejected with a Retry-After estimate, small decks
+are always admitted, /api/v2/enrich answers 503 with the header, a
+streamed batch releases its ticket even if the body is never read, and
+draft upgrades hold a ticket (deferred or failed while shed). Uses a
+stub load signal.
+
+Run with: python tests/test_admission_controller.py
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.testclient import TestClient
+
+from core.orchestrator import ContentOrchestratorV2
+from clients.mock_text_client import MockTextClient
+from clients.mock_chart_client import MockChartClient
+from clients.mock_image_client import MockImageClient
+from clients.mock_diagram_client import MockDiagramClient
+from services.admission_controller import AdmissionController
+from test_v2 import create_test_presentation
+
+
+def _controller(load=None, **limits):
+    load = load if load is not None else {"queue_depth": 0, "queue_delay_seconds": 0.0}
+    return AdmissionController(load_fn=lambda: load, **limits), load
+
+
+def _make_orchestrator(delay_ms=10):
+    return ContentOrchestratorV2(
+        text_client=MockTextClient(delay_ms),
+        chart_client=MockChartClient(delay_ms),
+        image_client=MockImageClient(delay_ms),
+        diagram_client=MockDiagramClient(delay_ms)
+    )
+
+
+class StubRequest:
+    headers = {}
+
+
+def test_in_flight_limit_sheds_and_release_readmits():
+    """The third 10-slide deck over max_in_flight=2 is shed until one finishes."""
+    controller, _ = _controller(max_in_flight=2)
+    controller.avg_duration_seconds = 8.0
+
+    first = controller.try_admit(slides=10)
+    second = controller.try_admit(slides=10)
+    third = controller.try_admit(slides=10)
+
+    assert first.admitted and second.admitted
+    assert not third.admitted
+    assert third.reason == "in_flight"
+    assert third.retry_after == 4  # one of 2 running 8s enrichments
+
+    controller.release(first.ticket)
+    assert controller.try_admit(slides=10).admitted
+    assert controller.get_stats()["shed_in_flight"] == 1
+
+
+def test_queue_delay_limit():
+    """Retry-After is the expected delay above the limit."""
+    controller, load = _controller(max_queue_delay=20.0)
+    load["queue_delay_seconds"] = 32.5
+
+    decision = controller.try_admit(slides=10)
+
+    assert not decision.admitted
+    assert decision.reason == "queue_delay"
+    assert decision.retry_after == 13
+
+
+def test_queue_depth_limit():
+    """Retry-After is the drain time of the excess backlog."""
+    controller, load = _controller(max_queue_depth=100)
+    load.update({"queue_depth": 400, "queue_delay_seconds": 40.0})
+
+    decision = controller.try_admit(slides=10)
+
+    assert decision.reason == "queue_depth"
+    assert decision.retry_after == 30
+
+
+def test_small_decks_always_admitted():
+    """Decks up to small_deck_slides bypass every limit."""
+    controller, load = _controller(max_in_flight=1, small_deck_slides=3)
+    load["queue_delay_seconds"] = 500.0
+
+    decisions = [controller.try_admit(slides=3) for _ in range(5)]
+
+    assert all(d.admitted for d in decisions)
+    assert not controller.try_admit(slides=4).admitted
+    assert controller.get_stats()["admitted_small"] == 5
+
+
+def test_enrich_endpoint_returns_503_with_retry_after():
+    """Shed requests get 503 + Retry-After; /health is unaffected."""
+    import main
+
+    controller, load = _controller(max_queue_delay=20.0)
+    load["queue_delay_seconds"] = 45.0
+    main.orchestrator, main.admission = object(), controller
+    try:
+        client = TestClient(main.app)
+        body = {"strawman": create_test_presentation(6).model_dump(mode="json")}
+        response = client.post("/api/v2/enrich", json=body)
+        health = client.get("/health")
+    finally:
+        main.orchestrator, main.admission = None, None
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "25"
+    assert response.json()["reason"] == "queue_delay"
+    assert health.status_code == 200
+
+
+def test_streamed_batch_releases_unread_ticket():
+    """The ticket of a streamed batch is released even if the body is never read."""
+    import main
+
+    controller, _ = _controller()
+    main.orchestrator, main.admission = _make_orchestrator(), controller
+    try:
+        request = main.BatchEnrichRequest(
+            decks=[main.BatchDeck(strawman=create_test_presentation(4)) for _ in range(2)],
+            stream=True
+        )
+
+        async def run():
+            response = await main.enrich_batch(request, StubRequest())
+            held = controller.in_flight
+            await response.background()
+            return held
+
+        held = asyncio.run(run())
+
+        # Read to the end: generator and background task both release
+        body = {"decks": [{"strawman": create_test_presentation(4).model_dump(mode="json")}], "stream": True}
+        lines = TestClient(main.app).post("/api/v2/enrich/batch", json=body).text.splitlines()
+    finally:
+        main.orchestrator, main.admission = None, None
+
+    assert held == 2
+    assert len(lines) == 1
+    assert controller.in_flight == 0
+
+
+def test_draft_upgrade_holds_ticket():
+    """The background upgrade runs under its own ticket."""
+    controller, _ = _controller()
+    orchestrator = _make_orchestrator(delay_ms=50)
+    orchestrator.admission = controller
+
+    async def run():
+        await orchestrator.enrich_presentation(create_test_presentation(6), mode="draft")
+        await asyncio.sleep(0.01)
+        during = controller.in_flight
+        await asyncio.gather(*orchestrator._background_tasks)
+        return during
+
+    assert asyncio.run(run()) == 1
+    assert controller.in_flight == 0
+    assert controller.stats["admitted"] == 1
+
+
+def test_shed_upgrade_deferred_then_failed():
+    """A shed upgrade waits Retry-After; past upgrade_max_defer it fails."""
+    controller, _ = _controller(max_in_flight=1)
+    controller.avg_duration_seconds = 0.5
+    orchestrator = _make_orchestrator()
+    orchestrator.admission = controller
+    blocker = controller.try_admit(slides=10)
+
+    async def run():
+        draft = await orchestrator.enrich_presentation(create_test_presentation(6), mode="draft")
+        await asyncio.sleep(0.1)
+        controller.release(blocker.ticket)
+        started = time.monotonic()
+        await asyncio.gather(*orchestrator._background_tasks)
+        return draft.generation_metadata["enrichment_id"], time.monotonic() - started
+
+    enrichment_id, waited = asyncio.run(run())
+    entry = orchestrator.enrichment_store.get(enrichment_id)
+    assert entry["status"] == "complete" and entry["version"] == 2
+    assert 0.5 < waited < 2.0  # retried after the 1s Retry-After
+
+    orchestrator.upgrade_max_defer = 0
+    blocker = controller.try_admit(slides=10)
+
+    async def run_shed():
+        draft = await orchestrator.enrich_presentation(create_test_presentation(6), mode="draft")
+        await asyncio.gather(*orchestrator._background_tasks)
+        return draft.generation_metadata["enrichment_id"]
+
+    entry = orchestrator.enrichment_store.get(asyncio.run(run_shed()))
+    assert entry["status"] == "failed" and entry["version"] == 1
+    assert "in_flight" in entry["error"]
+    assert controller.in_flight == 1  # only the blocker
+
+
+if __name__ == "__main__":
+    test_in_flight_limit_sheds_and_release_readmits()
+    test_queue_delay_limit()
+    test_queue_depth_limit()
+    test_small_decks_always_admitted()
+    test_enrich_endpoint_returns_503_with_retry_after()
+    test_streamed_batch_releases_unread_ticket()
+    test_draft_upgrade_holds_ticket()
+    test_shed_upgrade_deferred_then_failed()
+    print("✅ ALL ADMISSION CONTROLLER TESTS PASSED")
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+Asset Store Test
+=================
+
+Tests the content-addressed asset store and GET /api/v2/assets/{digest}:
+full (200) and byte-range (206) responses, ETag revalidation (304),
+unsatisfiable ranges (416), blob reads off the event loop, and the
+localizer downloading each unique URL once and rewriting slide URLs.
+
+Run with: python tests/test_asset_store.py
+"""
+
+import asyncio
+import sys
+import os
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import httpx
+from fastapi.testclient import TestClient
+
+from services.asset_store import AssetBlobStore, AssetLocalizer
+
+DATA = bytes(range(256)) * 4  # 1024 bytes
+
+
+class StubSlide:
+    def __init__(self, generated_content):
+        self.generated_content = generated_content
+
+
+def _get(store, digest, **headers):
+    import main
+
+    main.asset_store = store
+    try:
+        return TestClient(main.app).get(f"/api/v2/assets/{digest}", headers=headers)
+    finally:
+        main.asset_store = None
+
+
+def test_full_and_range_responses():
+    """200 serves the blob; ranges, open and suffix, answer 206."""
+    store = AssetBlobStore(tempfile.mkdtemp())
+    digest = store.put(DATA, "image/png", "http://cdn.test/a.png")
+
+    full = _get(store, digest)
+    assert full.status_code == 200
+    assert full.content == DATA
+    assert full.headers["content-type"] == "image/png"
+    assert full.headers["etag"] == f'"{digest}"'
+    assert full.headers["accept-ranges"] == "bytes"
+
+    part = _get(store, digest, range="bytes=10-19")
+    assert part.status_code == 206
+    assert part.content == DATA[10:20]
+    assert part.headers["content-range"] == "bytes 10-19/1024"
+
+    assert _get(store, digest, range="bytes=1000-").content == DATA[1000:]
+    assert _get(store, digest, range="bytes=-24").content == DATA[-24:]
+    assert _get(store, digest, range="bytes=1000-5000").headers["content-range"] == "bytes 1000-1023/1024"
+
+    # A stale If-Range gets the whole blob
+    stale = _get(store, digest, range="bytes=0-9", **{"if-range": '"other"'})
+    assert stale.status_code == 200 and stale.content == DATA
+
+
+def test_etag_revalidation():
+    """A matching If-None-Match (or *) answers 304 without a body."""
+    store = AssetBlobStore(tempfile.mkdtemp())
+    digest = store.put(DATA, "image/png")
+
+    for tag in (f'"{digest}"', f'"other", "{digest}"', "*"):
+        response = _get(store, digest, **{"if-none-match": tag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    assert _get(store, digest, **{"if-none-match": '"other"'}).status_code == 200
+
+
+def test_unsatisfiable_ranges_and_unknown_digest():
+    """Ranges past the end or malformed give 416; unknown digests 404."""
+    store = AssetBlobStore(tempfile.mkdtemp())
+    digest = store.put(DATA, "image/png")
+
+    for range_header in ("bytes=1024-", "bytes=20-10", "bytes=-", "items=0-5"):
+        response = _get(store, digest, range=range_header)
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */1024"
+
+    assert _get(store, "0" * 64).status_code == 404
+    assert _get(store, "not-a-digest").status_code == 404
+
+
+def test_blob_reads_off_event_loop():
+    """Blob lookups and reads run in the executor, not the loop thread."""
+    store = AssetBlobStore(tempfile.mkdtemp())
+    digest = store.put(DATA, "image/png")
+    on_loop = []
+
+    read_range = store.read_range
+
+    def recording_read_range(*args):
+        try:
+            asyncio.get_running_loop()
+            on_loop.append(True)
+        except RuntimeError:
+            on_loop.append(False)
+        return read_range(*args)
+
+    store.read_range = recording_read_range
+    assert _get(store, digest, range="bytes=0-9").content == DATA[:10]
+
+    assert on_loop == [False]
+
+
+def test_localize_downloads_once_and_rewrites():
+    """Each unique URL is fetched once; failed downloads keep their URL."""
+    fetched = []
+
+    def handler(request):
+        fetched.append(str(request.url))
+        if request.url.path == "/missing.png":
+            return httpx.Response(404)
+        return httpx.Response(200, content=DATA, headers={"content-type": "image/png"})
+
+    store = AssetBlobStore(tempfile.mkdtemp())
+    localizer = AssetLocalizer(store, public_base_url="https://orch.test/", transport=httpx.MockTransport(handler))
+    slides = [
+        StubSlide({"image_url": "http://cdn.test/a.png", "title": "x"}),
+        StubSlide({"chart_url": "http://cdn.test/a.png", "diagram_url": "http://cdn.test/missing.png"}),
+        StubSlide({"image_url": "/api/v2/assets/already-local"})
+    ]
+
+    stats = asyncio.run(localizer.localize(slides))
+    digest = store.put(DATA, "image/png")
+
+    assert sorted(fetched) == ["http://cdn.test/a.png", "http://cdn.test/missing.png"]
+    assert stats == {"unique_assets": 2, "downloaded": 1, "reused": 0, "failed": 1, "rewritten_urls": 2}
+    assert slides[0].generated_content["image_url"] == f"https://orch.test/api/v2/assets/{digest}"
+    assert slides[1].generated_content["chart_url"] == slides[0].generated_content["image_url"]
+    assert slides[1].generated_content["diagram_url"] == "http://cdn.test/missing.png"
+    assert slides[2].generated_content["image_url"] == "/api/v2/assets/already-local"
+    assert store.get_info(digest)["content_type"] == "image/png"
+
+    # The URL → digest memo skips the second download
+    again = asyncio.run(localizer.localize([StubSlide({"image_url": "http://cdn.test/a.png"})]))
+    assert again["reused"] == 1 and again["downloaded"] == 0
+    assert len(fetched) == 2
+
+
+if __name__ == "__main__":
+    test_full_and_range_responses()
+    test_etag_revalidation()
+    test_unsatisfiable_ranges_and_unknown_digest()
+    test_blob_reads_off_event_loop()
+    test_localize_downloads_once_and_rewrites()
+    print("✅ ALL ASSET STORE TESTS PASSED")
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Batch Enrichment Test
+======================
+
+Tests enrich_many(): identical component requests across decks are
+generated once, results come back per deck in input order, and one
+failing deck does not fail the batch. Uses mock clients.
+
+Run with: python tests/test_batch_enrichment.py
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.orchestrator import ContentOrchestratorV2
+from clients.mock_text_client import MockTextClient
+from clients.mock_chart_client import MockChartClient
+from clients.mock_image_client import MockImageClient
+from clients.mock_diagram_client import MockDiagramClient
+from test_v2 import create_test_presentation
+
+
+def _make_orchestrator():
+    """Create an orchestrator whose image client counts calls."""
+    orchestrator = ContentOrchestratorV2(
+        text_client=MockTextClient(10),
+        chart_client=MockChartClient(10),
+        image_client=MockImageClient(10),
+        diagram_client=MockDiagramClient(10)
+    )
+    calls = {"image": 0}
+    generate = orchestrator.api_dispatcher.image_client.generate
+
+    async def counting_generate(request):
+        calls["image"] += 1
+        return await generate(request)
+
+    orchestrator.api_dispatcher.image_client.generate = counting_generate
+    return orchestrator, calls
+
+
+def test_identical_requests_generated_once_across_decks():
+    """Five copies of a deck share one image generation."""
+    orchestrator, calls = _make_orchestrator()
+    decks = [{"strawman": create_test_presentation(4)} for _ in range(5)]
+
+    results = asyncio.run(orchestrator.enrich_many(decks))
+
+    assert calls["image"] == 1
+    assert all(len(result.enriched_slides) == 4 for result in results)
+    assert sum(r.generation_metadata["deduplicated_requests"] for r in results) > 0
+
+    images = [s.generated_content["image_url"] for r in results for s in r.enriched_slides if s.layout_id == "L10"]
+    assert len(set(images)) == 1
+
+
+def test_failed_deck_is_isolated():
+    """A deck with mismatched layouts fails alone, in its own slot."""
+    orchestrator, _ = _make_orchestrator()
+    strawman = create_test_presentation(3)
+    bad_layouts = orchestrator._create_default_layout_assignments(create_test_presentation(2))
+    decks = [
+        {"strawman": strawman},
+        {"strawman": strawman, "layout_assignments": bad_layouts},
+        {"strawman": strawman}
+    ]
+
+    results = asyncio.run(orchestrator.enrich_many(decks))
+
+    assert isinstance(results[1], ValueError)
+    assert results[0].validation_report.total_slides == 3
+    assert results[2].validation_report.total_slides == 3
+
+
+def test_iter_yields_every_deck():
+    """enrich_many_iter yields each deck index exactly once."""
+    orchestrator, _ = _make_orchestrator()
+    decks = [{"strawman": create_test_presentation(n)} for n in (6, 1, 3)]
+
+    async def collect():
+        return [(index, result) async for index, result in orchestrator.enrich_many_iter(decks, 2)]
+
+    yielded = asyncio.run(collect())
+
+    assert sorted(index for index, _ in yielded) == [0, 1, 2]
+    assert {index: len(result.enriched_slides) for index, result in yielded} == {0: 6, 1: 1, 2: 3}
+
+
+if __name__ == "__main__":
+    test_identical_requests_generated_once_across_decks()
+    test_failed_deck_is_isolated()
+    test_iter_yields_every_deck()
+    print("✅ ALL BATCH ENRICHMENT TESTS PASSED")
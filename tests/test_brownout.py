@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Brownout Test
+==============
+
+Tests BrownoutController: levels step up only after the queue delay
+stays over a threshold, step down only after it stays well below
+(hysteresis), degradations are applied cumulatively, and enrichments
+report them in generation_metadata. Uses a stub signal and mock clients.
+
+Run with: python tests/test_brownout.py
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.orchestrator import ContentOrchestratorV2
+from clients.mock_text_client import MockTextClient
+from clients.mock_chart_client import MockChartClient
+from clients.mock_image_client import MockImageClient
+from clients.mock_diagram_client import MockDiagramClient
+from services.brownout import BrownoutController
+from test_v2 import create_test_presentation
+
+
+def _controller(signal, **kwargs):
+    return BrownoutController(signal_fn=lambda: signal["delay"], **kwargs)
+
+
+def test_enter_requires_sustained_delay():
+    """A short spike does not degrade; a sustained one does, one level at a time."""
+    signal = {"delay": 50.0}
+    brownout = _controller(signal, thresholds=(4, 8, 12), enter_seconds=5)
+
+    assert brownout.update(now=0) == 0
+    signal["delay"] = 1.0
+    assert brownout.update(now=3) == 0          # spike over - timer reset
+    signal["delay"] = 50.0
+    assert brownout.update(now=4) == 0
+    assert brownout.update(now=9) == 1
+    assert brownout.update(now=10) == 1         # next level needs its own 5s
+    assert brownout.update(now=15) == 2
+
+
+def test_exit_hysteresis():
+    """Level 1 holds until the delay stays under half its threshold."""
+    signal = {"delay": 5.0}
+    brownout = _controller(signal, thresholds=(4, 8, 12), enter_seconds=0, exit_seconds=30)
+    assert brownout.update(now=0) == 1
+
+    signal["delay"] = 3.0                        # under 4 but not under 2
+    assert brownout.update(now=100) == 1
+    signal["delay"] = 1.5
+    assert brownout.update(now=101) == 1
+    assert brownout.update(now=120) == 1
+    assert brownout.update(now=131) == 0
+    assert brownout.get_stats()["level_changes"] == 2
+
+
+def test_apply_degradations_cumulative():
+    """Level 3 skips optional images, routes L01/L05 text locally, slows polling."""
+    signal = {"delay": 100.0}
+    brownout = _controller(signal, enter_seconds=0)
+    for _ in range(3):
+        brownout.update()
+
+    all_requests = {
+        "text": [{"layout_id": "L01"}, {"layout_id": "L05"}, {"layout_id": "L10"}],
+        "image": [{"layout_id": "L10"}, {"layout_id": "L22"}],
+        "chart": [{"layout_id": "L17"}],
+        "diagram": []
+    }
+    applied = brownout.apply(all_requests)
+
+    assert [d["degradation"] for d in applied] == ["skip_optional_images", "local_text", "slow_polling"]
+    assert [d["requests"] for d in applied] == [1, 2, 1]
+    assert all_requests["image"] == [{"layout_id": "L10"}]
+    assert [r.get("route") for r in all_requests["text"]] == ["local", "local", None]
+    assert all_requests["chart"][0]["poll_interval_multiplier"] == 2.0
+
+
+def test_enrichment_reports_degradations():
+    """generation_metadata lists the degradations applied to the deck."""
+    signal = {"delay": 0.0}
+    orchestrator = ContentOrchestratorV2(
+        text_client=MockTextClient(10),
+        chart_client=MockChartClient(10),
+        image_client=MockImageClient(10),
+        diagram_client=MockDiagramClient(10),
+        brownout=_controller(signal, enter_seconds=0)
+    )
+    strawman = create_test_presentation(4)
+
+    normal = asyncio.run(orchestrator.enrich_presentation(strawman))
+    signal["delay"] = 9.0
+    orchestrator.brownout.update()
+    degraded = asyncio.run(orchestrator.enrich_presentation(strawman))
+
+    assert normal.generation_metadata["degradations"] == []
+    assert [d["degradation"] for d in degraded.generation_metadata["degradations"]] == [
+        "skip_optional_images", "local_text"
+    ]
+    assert len(degraded.enriched_slides) == 4
+
+
+if __name__ == "__main__":
+    test_enter_requires_sustained_delay()
+    test_exit_hysteresis()
+    test_apply_degradations_cumulative()
+    test_enrichment_reports_degradations()
+    print("✅ ALL BROWNOUT TESTS PASSED")
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Bulkhead Executor Test
+=======================
+
+Tests per-service executors: a service whose threads are all blocked
+does not delay calls to another service, and saturation, queue wait and
+active-thread metrics are reported. Uses plain blocking functions.
+
+Run with: python tests/test_bulkhead_executors.py
+"""
+
+import asyncio
+import sys
+import os
+import threading
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from clients.http_transport import ServiceTransport
+
+
+def test_hung_service_does_not_starve_others():
+    """Text calls finish while every image thread is blocked."""
+    image = ServiceTransport("image", threads=2)
+    text = ServiceTransport("text", threads=2)
+    release = threading.Event()
+
+    async def run():
+        hung = [asyncio.create_task(image.run(release.wait, 5)) for _ in range(4)]
+        await asyncio.sleep(0.05)
+
+        started = time.monotonic()
+        results = await asyncio.gather(*[text.run(lambda: "ok") for _ in range(10)])
+        text_seconds = time.monotonic() - started
+
+        image_stats = image.get_stats()["executor"]
+        release.set()
+        await asyncio.gather(*hung)
+        return results, text_seconds, image_stats
+
+    results, text_seconds, image_stats = asyncio.run(run())
+
+    assert results == ["ok"] * 10
+    assert text_seconds < 0.5
+    assert image_stats["active_threads"] == 2
+    assert image_stats["queued"] == 2
+    assert image_stats["saturation"] == 1.0
+    assert image_stats["saturated_submissions"] == 2
+
+
+def test_queue_wait_reported():
+    """Calls queued behind a busy thread report their wait."""
+    transport = ServiceTransport("chart", threads=1)
+
+    async def run():
+        await asyncio.gather(*[transport.run(time.sleep, 0.05) for _ in range(3)])
+
+    asyncio.run(run())
+
+    stats = transport.get_stats()["executor"]
+    assert stats["completed"] == 3
+    assert stats["active_threads"] == 0 and stats["queued"] == 0
+    assert stats["max_queue_wait_ms"] >= 90
+    assert stats["avg_queue_wait_ms"] > 0
+
+
+def test_cancelled_queued_call_is_not_counted_as_queued():
+    """A call cancelled before getting a thread leaves the queue."""
+    transport = ServiceTransport("diagram", threads=1)
+    release = threading.Event()
+
+    async def run():
+        busy = asyncio.create_task(transport.run(release.wait, 5))
+        await asyncio.sleep(0.02)
+        waiting = asyncio.create_task(transport.run(lambda: None))
+        await asyncio.sleep(0.02)
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        release.set()
+        await busy
+
+    asyncio.run(run())
+
+    stats = transport.get_stats()["executor"]
+    assert stats["queued"] == 0
+    assert stats["cancelled_queued"] == 1
+
+
+if __name__ == "__main__":
+    test_hung_service_does_not_starve_others()
+    test_queue_wait_reported()
+    test_cancelled_queued_call_is_not_counted_as_queued()
+    print("✅ ALL BULKHEAD EXECUTOR TESTS PASSED")
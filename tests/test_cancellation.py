@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+Cancellation Test
+==================
+
+Tests end-to-end cancellation of abandoned requests: a client disconnect
+cancels the enrichment, cancelled dispatches report their wasted work,
+and an in-flight pooled HTTP call is aborted instead of running to
+completion. Uses mock clients and a local slow HTTP server.
+
+Run with: python tests/test_cancellation.py
+"""
+
+import asyncio
+import sys
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import requests
+
+from core.orchestrator import ContentOrchestratorV2
+from clients.http_transport import ServiceTransport
+from clients.mock_text_client import MockTextClient
+from clients.mock_chart_client import MockChartClient
+from clients.mock_image_client import MockImageClient
+from clients.mock_diagram_client import MockDiagramClient
+from test_v2 import create_test_presentation
+
+
+def _make_orchestrator(chart_delay_ms=500):
+    return ContentOrchestratorV2(
+        text_client=MockTextClient(10),
+        chart_client=MockChartClient(chart_delay_ms),
+        image_client=MockImageClient(10),
+        diagram_client=MockDiagramClient(10)
+    )
+
+
+def test_cancelled_enrichment_reports_wasted_work():
+    """Cancelling mid-dispatch counts completed and cancelled calls."""
+    orchestrator = _make_orchestrator()
+
+    async def run():
+        task = asyncio.create_task(orchestrator.enrich_presentation(create_test_presentation(6)))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        else:
+            raise AssertionError("task was not cancelled")
+        # No call keeps running after the enrichment is cancelled
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    asyncio.run(run())
+
+    abandoned = orchestrator.get_metrics()["dispatcher"]["abandoned"]
+    assert abandoned["abandoned_dispatches"] == 1
+    assert abandoned["completed_calls"] > 0   # text/image/diagram finished
+    assert abandoned["cancelled_calls"] > 0   # slow charts did not
+    assert abandoned["call_seconds"] > 0
+
+
+def test_disconnect_cancels_enrichment():
+    """_run_until_disconnect cancels the orchestrator call on disconnect."""
+    import main
+
+    class DisconnectingRequest:
+        def __init__(self):
+            self.checks = 0
+
+        async def is_disconnected(self):
+            self.checks += 1
+            return self.checks >= 2
+
+    orchestrator = _make_orchestrator(chart_delay_ms=5000)
+    os.environ["DISCONNECT_POLL_INTERVAL"] = "0.02"
+
+    async def run():
+        started = time.time()
+        try:
+            await main._run_until_disconnect(
+                DisconnectingRequest(),
+                orchestrator.enrich_presentation(create_test_presentation(3))
+            )
+        except main.ClientDisconnected:
+            return time.time() - started
+        raise AssertionError("disconnect not detected")
+
+    try:
+        elapsed = asyncio.run(run())
+    finally:
+        del os.environ["DISCONNECT_POLL_INTERVAL"]
+
+    assert elapsed < 1.0
+    assert orchestrator.get_metrics()["dispatcher"]["abandoned"]["abandoned_dispatches"] == 1
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        time.sleep(3)
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+def test_in_flight_http_call_is_aborted():
+    """Cancelling transport.run() unblocks the executor thread at once."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/generate"
+
+    transport = ServiceTransport("text", pool_size=2)
+    outcome = {}
+
+    def blocking_call():
+        started = time.time()
+        try:
+            transport.post(url, json={}, timeout=10)
+            outcome["error"] = None
+        except requests.RequestException as e:
+            outcome["error"] = e
+        outcome["seconds"] = time.time() - started
+
+    async def run():
+        task = asyncio.create_task(transport.run(blocking_call))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        else:
+            raise AssertionError("task was not cancelled")
+        while "seconds" not in outcome:
+            await asyncio.sleep(0.01)
+
+    try:
+        asyncio.run(run())
+    finally:
+        server.shutdown()
+        server.server_close()
+        transport.session.close()
+
+    assert isinstance(outcome["error"], requests.ConnectionError)
+    assert outcome["seconds"] < 1.0
+    assert transport.stats["aborted_calls"] == 1
+
+
+if __name__ == "__main__":
+    test_cancelled_enrichment_reports_wasted_work()
+    test_disconnect_cancels_enrichment()
+    test_in_flight_http_call_is_aborted()
+    print("✅ ALL CANCELLATION TESTS PASSED")
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+DAG Scheduler Test
+===================
+
+Tests dependency-aware scheduling: flat parallelism without rules,
+chart → text and previous-slide text chaining (chart data reaching the
+text service's payload), critical-path start order, and failed
+dependencies releasing their dependents.
+
+Run with: python tests/test_dag_scheduler.py
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from clients.real_text_client import RealTextClient
+from models.director_models import GeneratedChart, GeneratedText
+from services.dag_scheduler import DAGScheduler, TextAfterChart, TextAfterPreviousText
+
+
+def _requests(num_slides, charts=()):
+    """Text for every slide, charts for the given slide numbers."""
+    return {
+        "text": [
+            {"slide_id": f"s{i}", "slide_number": i, "topics": [f"t{i}"], "context": {}}
+            for i in range(num_slides)
+        ],
+        "chart": [
+            {"slide_id": f"s{i}", "slide_number": i, "goal": "g", "context": {}}
+            for i in charts
+        ]
+    }
+
+
+def _run(scheduler, all_requests, fail=()):
+    """Run the scheduler with instant fake clients; return event log."""
+    events = []
+
+    async def execute(api_type, request):
+        key = f"{api_type}:{request['slide_id']}"
+        events.append(("start", key, request))
+        await asyncio.sleep(0.01)
+        events.append(("end", key, request))
+        if key in fail:
+            return {"success": False, "result": None, "error": "boom"}
+        if api_type == "chart":
+            result = GeneratedChart(type="bar", data={"labels": ["Q1"], "values": [1]})
+        else:
+            result = GeneratedText(content=f"text for {request['slide_id']}")
+        return {"success": True, "result": result, "error": None}
+
+    stats = asyncio.run(scheduler.run(all_requests, execute))
+    return events, stats
+
+
+def test_no_rules_starts_everything_at_once():
+    """Without rules the schedule is a flat gather."""
+    events, stats = _run(DAGScheduler(), _requests(4, charts=(0, 2)))
+
+    kinds = [kind for kind, _, _ in events]
+    assert kinds[:6] == ["start"] * 6
+    assert stats["edges"] == 0
+
+
+def test_text_waits_for_chart_and_gets_its_data():
+    """text:s0 starts after chart:s0 ends and sees the chart data."""
+    events, stats = _run(DAGScheduler(rules=[TextAfterChart()]), _requests(2, charts=(0,)))
+
+    order = [(kind, key) for kind, key, _ in events]
+    assert order.index(("end", "chart:s0")) < order.index(("start", "text:s0"))
+    assert order.index(("start", "text:s1")) < order.index(("end", "chart:s0"))
+
+    text_request = next(r for kind, key, r in events if (kind, key) == ("start", "text:s0"))
+    assert text_request["context"]["chart_data"]["data"]["labels"] == ["Q1"]
+    assert stats["edges"] == 1
+
+
+class RecordingTransport:
+    """Stands in for ServiceTransport; records request bodies."""
+
+    def __init__(self):
+        self.bodies = []
+
+    async def run(self, fn, *args):
+        return fn(*args)
+
+    def post(self, url, json=None, timeout=None):
+        self.bodies.append(json)
+        return RecordingResponse()
+
+
+class RecordingResponse:
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"content": "Text", "metadata": {"word_count": 1, "generation_time_ms": 1, "model_used": "m"}}
+
+
+def test_chart_data_reaches_text_service():
+    """The bound chart data is part of the text service request body."""
+    events, _ = _run(DAGScheduler(rules=[TextAfterChart()]), _requests(1, charts=(0,)))
+    text_request = next(r for kind, key, r in events if (kind, key) == ("start", "text:s0"))
+
+    transport = RecordingTransport()
+    client = RealTextClient(base_url="http://text.test", transport=transport)
+    asyncio.run(client.generate(text_request))
+
+    chart_data = transport.bodies[0]["context"]["chart_data"]
+    assert chart_data == {"type": "bar", "data": {"labels": ["Q1"], "values": [1]}}
+
+
+def test_previous_slides_chain():
+    """Each slide's text carries the previous slides' text."""
+    events, _ = _run(DAGScheduler(rules=[TextAfterPreviousText()]), _requests(3))
+
+    starts = {key: r for kind, key, r in events if kind == "start"}
+    assert "previous_slides" not in starts["text:s0"]["context"]
+    assert [p["slide_id"] for p in starts["text:s2"]["context"]["previous_slides"]] == ["s0", "s1"]
+    assert starts["text:s2"]["fingerprint"]
+
+
+def test_critical_path_starts_first():
+    """The chart feeding a text chain starts before an independent chart."""
+    # chart:s0 → text:s0 is a 1 + 5 = 6s chain; the image alone takes 2s
+    scheduler = DAGScheduler(rules=[TextAfterChart()], costs={"chart": 1.0, "text": 5.0, "image": 2.0})
+    all_requests = {**_requests(1, charts=(0,)), "image": [{"slide_id": "s9", "slide_number": 9}]}
+    events, stats = _run(scheduler, all_requests)
+
+    first_starts = [key for kind, key, _ in events if kind == "start"][:2]
+    assert first_starts == ["chart:s0", "image:s9"]
+    assert stats["critical_path_seconds"] == 6.0
+
+
+def test_failed_dependency_releases_dependent():
+    """A failed chart still lets the text run, without chart data."""
+    events, _ = _run(DAGScheduler(rules=[TextAfterChart()]), _requests(1, charts=(0,)), fail={"chart:s0"})
+
+    text_request = next(r for kind, key, r in events if (kind, key) == ("start", "text:s0"))
+    assert "chart_data" not in text_request["context"]
+
+
+if __name__ == "__main__":
+    test_no_rules_starts_everything_at_once()
+    test_text_waits_for_chart_and_gets_its_data()
+    test_chart_data_reaches_text_service()
+    test_previous_slides_chain()
+    test_critical_path_starts_first()
+    test_failed_dependency_releases_dependent()
+    print("✅ ALL DAG SCHEDULER TESTS PASSED")
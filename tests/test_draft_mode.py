@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+Draft Mode Test
+================
+
+Tests draft-then-upgrade enrichment: the versioned store (publish,
+long-poll wake-up and timeout, TTL and size eviction), a local draft
+upgraded in the background and pushed to the upgrade callback, the
+long-poll GET /api/v2/enrich/{id} endpoint, callback_url hosts
+restricted to UPGRADE_CALLBACK_HOSTS, and invalid modes or a
+callback_url outside draft mode rejected as client errors.
+
+Run with: python tests/test_draft_mode.py
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from core.orchestrator import ContentOrchestratorV2
+from clients.mock_text_client import MockTextClient
+from clients.mock_chart_client import MockChartClient
+from clients.mock_image_client import MockImageClient
+from clients.mock_diagram_client import MockDiagramClient
+from services.admission_controller import AdmissionController
+from services.enrichment_store import EnrichmentVersionStore
+from test_v2 import create_test_presentation
+
+
+class InvalidOptionOrchestrator:
+    """Rejects every request the way ContentOrchestratorV2 rejects bad options."""
+
+    async def enrich_presentation(self, **kwargs):
+        raise ValueError("Unknown option")
+
+
+def _make_orchestrator(delay_ms=10):
+    return ContentOrchestratorV2(
+        text_client=MockTextClient(delay_ms),
+        chart_client=MockChartClient(delay_ms),
+        image_client=MockImageClient(delay_ms),
+        diagram_client=MockDiagramClient(delay_ms)
+    )
+
+
+def test_store_versions_and_status():
+    """Each publish is a new version; finishing clears the ETA."""
+    store = EnrichmentVersionStore()
+    enrichment_id = store.create()
+
+    assert store.get(enrichment_id)["version"] == 0
+    assert store.publish(enrichment_id, "draft", status="upgrading") == 1
+    store.set_eta(enrichment_id, object())
+    assert store.publish(enrichment_id, "full", status="complete") == 2
+
+    entry = store.get(enrichment_id)
+    assert (entry["result"], entry["status"], entry["eta"]) == ("full", "complete", None)
+    assert store.get("enr_unknown") is None
+
+
+def test_store_long_poll_wakes_on_publish():
+    """wait_for_update returns as soon as a newer version is published."""
+    store = EnrichmentVersionStore()
+    enrichment_id = store.create()
+    store.publish(enrichment_id, "draft", status="upgrading")
+
+    async def run():
+        async def publish_later():
+            await asyncio.sleep(0.05)
+            store.publish(enrichment_id, "full", status="complete")
+
+        started = time.monotonic()
+        publisher = asyncio.create_task(publish_later())
+        entry = await store.wait_for_update(enrichment_id, since_version=1, timeout=5.0)
+        await publisher
+        return entry, time.monotonic() - started
+
+    entry, elapsed = asyncio.run(run())
+
+    assert entry["version"] == 2
+    assert elapsed < 1.0
+
+
+def test_store_long_poll_times_out_unchanged():
+    """Without a newer version the long poll returns the current entry."""
+    store = EnrichmentVersionStore()
+    enrichment_id = store.create()
+    store.publish(enrichment_id, "draft", status="upgrading")
+
+    entry = asyncio.run(store.wait_for_update(enrichment_id, since_version=1, timeout=0.05))
+
+    assert entry["version"] == 1
+    assert asyncio.run(store.wait_for_update("enr_unknown", 0, 0.05)) is None
+
+
+def test_store_evicts_expired_and_oldest():
+    """Finished entries expire after the TTL; the oldest go beyond max_entries."""
+    store = EnrichmentVersionStore(ttl_seconds=0, max_entries=2)
+    finished = store.create()
+    store.set_status(finished, "complete")
+    time.sleep(0.01)
+    assert store.get(finished) is None
+
+    first, second = store.create(), store.create()
+    third = store.create()
+    assert store.get(first) is None
+    assert store.get(second) is not None and store.get(third) is not None
+
+
+def test_draft_upgraded_in_background_and_pushed():
+    """The draft is v1 from the local tier; v2 is published and pushed."""
+    orchestrator = _make_orchestrator()
+    pushed = []
+
+    async def on_upgrade(enrichment_id, version, result):
+        pushed.append((enrichment_id, version, result.generation_metadata["mode"]))
+
+    async def run():
+        draft = await orchestrator.enrich_presentation(
+            create_test_presentation(4), mode="draft", upgrade_callback=on_upgrade
+        )
+        await asyncio.gather(*orchestrator._background_tasks)
+        return draft
+
+    draft = asyncio.run(run())
+    enrichment_id = draft.generation_metadata["enrichment_id"]
+    entry = orchestrator.enrichment_store.get(enrichment_id)
+
+    assert draft.generation_metadata["mode"] == "draft"
+    assert draft.generation_metadata["version"] == 1
+    assert draft.generation_metadata["upgrade_pending"] is True
+    assert entry["status"] == "complete" and entry["version"] == 2
+    assert entry["result"].generation_metadata["upgrade_pending"] is False
+    assert pushed == [(enrichment_id, 2, "full")]
+
+
+def test_get_enrichment_endpoint():
+    """GET returns the newest version, null when nothing newer, 404 if unknown."""
+    import main
+
+    orchestrator = _make_orchestrator()
+    draft = asyncio.run(orchestrator.enrich_presentation(create_test_presentation(2), mode="draft"))
+    enrichment_id = draft.generation_metadata["enrichment_id"]
+
+    main.orchestrator = orchestrator
+    try:
+        client = TestClient(main.app)
+        latest = client.get(f"/api/v2/enrich/{enrichment_id}").json()
+        started = time.monotonic()
+        unchanged = client.get(f"/api/v2/enrich/{enrichment_id}?since_version=1&wait=0.2").json()
+        waited = time.monotonic() - started
+        missing = client.get("/api/v2/enrich/enr_unknown")
+    finally:
+        main.orchestrator = None
+
+    assert latest["version"] == 1
+    assert latest["status"] == "upgrading"
+    assert len(latest["result"]["enriched_slides"]) == 2
+    assert unchanged["result"] is None
+    assert waited >= 0.2
+    assert missing.status_code == 404
+
+
+def test_callback_url_must_be_allowlisted():
+    """callback_url hosts outside UPGRADE_CALLBACK_HOSTS get 422."""
+    import main
+
+    previous = os.environ.get("UPGRADE_CALLBACK_HOSTS")
+    os.environ["UPGRADE_CALLBACK_HOSTS"] = "hooks.example.com, director.internal:8443"
+    controller = AdmissionController(lambda: {"queue_depth": 0, "queue_delay_seconds": 0.0})
+    main.orchestrator, main.admission = object(), controller
+    try:
+        main._check_callback_url("https://hooks.example.com/upgrades")
+        main._check_callback_url("http://director.internal:8443/cb")
+
+        for url in (
+            "http://169.254.169.254/latest/meta-data",
+            "http://director.internal/cb",
+            "file:///etc/passwd",
+            "https://hooks.example.com.evil.test/x"
+        ):
+            try:
+                main._check_callback_url(url)
+            except HTTPException as e:
+                assert e.status_code == 422
+            else:
+                raise AssertionError(f"{url} was accepted")
+
+        body = {
+            "strawman": create_test_presentation(2).model_dump(mode="json"),
+            "mode": "draft",
+            "callback_url": "http://localhost:6379/"
+        }
+        response = TestClient(main.app).post("/api/v2/enrich", json=body)
+    finally:
+        main.orchestrator, main.admission = None, None
+        if previous is None:
+            os.environ.pop("UPGRADE_CALLBACK_HOSTS", None)
+        else:
+            os.environ["UPGRADE_CALLBACK_HOSTS"] = previous
+
+    assert response.status_code == 422
+    # Rejected before admission
+    assert controller.stats["admitted"] == 0
+
+
+def test_invalid_requests_are_client_errors():
+    """Bad mode 422, callback_url without draft 422, orchestrator ValueError 400."""
+    import main
+
+    controller = AdmissionController(lambda: {"queue_depth": 0, "queue_delay_seconds": 0.0})
+    strawman = create_test_presentation(2).model_dump(mode="json")
+    main.orchestrator, main.admission = InvalidOptionOrchestrator(), controller
+    try:
+        client = TestClient(main.app)
+        bad_mode = client.post("/api/v2/enrich", json={"strawman": strawman, "mode": "drafty"})
+        callback_full = client.post(
+            "/api/v2/enrich",
+            json={"strawman": strawman, "callback_url": "https://hooks.example.com/cb"}
+        )
+        admitted_before = controller.stats["admitted"]
+        rejected = client.post("/api/v2/enrich", json={"strawman": strawman})
+    finally:
+        main.orchestrator, main.admission = None, None
+
+    assert bad_mode.status_code == 422
+    assert callback_full.status_code == 422
+    assert "draft" in callback_full.json()["detail"]
+    assert admitted_before == 0
+    assert rejected.status_code == 400
+    assert rejected.json()["detail"] == "Unknown option"
+    assert controller.in_flight == 0
+
+
+if __name__ == "__main__":
+    test_store_versions_and_status()
+    test_store_long_poll_wakes_on_publish()
+    test_store_long_poll_times_out_unchanged()
+    test_store_evicts_expired_and_oldest()
+    test_draft_upgraded_in_background_and_pushed()
+    test_get_enrichment_endpoint()
+    test_callback_url_must_be_allowlisted()
+    test_invalid_requests_are_client_errors()
+    print("✅ ALL DRAFT MODE TESTS PASSED")
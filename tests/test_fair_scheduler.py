@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Fair Scheduler Test
+====================
+
+Tests deficit round-robin slot scheduling: a small flow queued behind a
+large backlog is served within the next rounds, weights set the share,
+cancelled waiters do not leak slots, and a cancelled waiter stops
+counting toward the backlog at once.
+
+Run with: python tests/test_fair_scheduler.py
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from services.fair_scheduler import FairScheduler, parse_weights
+
+
+async def _run_calls(scheduler, calls, order):
+    """Run (flow_id, weight) calls through one slot each, recording grant order."""
+    async def call(flow_id, weight):
+        async with scheduler.slot(flow_id, weight):
+            order.append(flow_id)
+            await asyncio.sleep(0.001)
+
+    await asyncio.gather(*[call(flow_id, weight) for flow_id, weight in calls])
+
+
+def test_small_flow_not_stuck_behind_backlog():
+    """3 calls of a small deck queued after 20 of a large deck go out early."""
+    scheduler = FairScheduler("chart", capacity=1)
+    order = []
+    calls = [("big", 1.0)] * 20 + [("small", 1.0)] * 3
+
+    asyncio.run(_run_calls(scheduler, calls, order))
+
+    small_positions = [i for i, flow_id in enumerate(order) if flow_id == "small"]
+    assert len(order) == 23
+    assert max(small_positions) < 8
+    assert scheduler.in_use == 0
+
+
+def test_weight_sets_share():
+    """A weight-2 flow gets about twice the slots of a weight-1 flow."""
+    scheduler = FairScheduler("text", capacity=1)
+    order = []
+    calls = [("heavy", 2.0)] * 30 + [("light", 1.0)] * 30
+
+    asyncio.run(_run_calls(scheduler, calls, order))
+
+    first = order[1:31]  # skip the fast-path grant
+    assert 18 <= first.count("heavy") <= 22
+
+
+def test_cancelled_waiters_do_not_leak_slots():
+    """Cancelling queued calls leaves every slot free afterwards."""
+    scheduler = FairScheduler("image", capacity=2)
+
+    async def run():
+        async def hold(seconds):
+            async with scheduler.slot("a"):
+                await asyncio.sleep(seconds)
+
+        holders = [asyncio.create_task(hold(0.02)) for _ in range(2)]
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(hold(0.01)) for _ in range(5)]
+        await asyncio.sleep(0)
+        for task in waiters[:3]:
+            task.cancel()
+        await asyncio.gather(*holders, *waiters, return_exceptions=True)
+
+    asyncio.run(run())
+
+    stats = scheduler.get_stats()
+    assert stats["in_use"] == 0
+    assert stats["waiting"] == 0
+    assert stats["active_flows"] == 0
+
+
+def test_cancelled_waiters_leave_backlog_at_once():
+    """waiting, max_queue_depth and the wait estimate drop on cancellation."""
+    scheduler = FairScheduler("chart", capacity=1)
+    scheduler.avg_hold_seconds = 2.0
+
+    async def run():
+        await scheduler.acquire("a")
+        waiters = [asyncio.create_task(scheduler.acquire("b")) for _ in range(4)]
+        await asyncio.sleep(0)
+        queued = scheduler.waiting
+        for task in waiters[:3]:
+            task.cancel()
+        await asyncio.gather(*waiters[:3], return_exceptions=True)
+        after_cancel = (scheduler.waiting, scheduler.estimated_wait_seconds())
+
+        # Re-queueing does not count the cancelled waiters again
+        extra = asyncio.create_task(scheduler.acquire("c"))
+        await asyncio.sleep(0)
+        depth = scheduler.stats["max_queue_depth"]
+        scheduler.release()
+        await waiters[3]
+        scheduler.release()
+        await extra
+        scheduler.release()
+        return queued, after_cancel, depth
+
+    queued, after_cancel, depth = asyncio.run(run())
+
+    assert queued == 4
+    assert after_cancel == (1, 2.0)
+    assert depth == 4
+    assert scheduler.waiting == 0 and scheduler.in_use == 0
+
+
+def test_parse_weights():
+    """Invalid entries are skipped."""
+    assert parse_weights("acme:2, nightly:0.5,bad,x:y") == {"acme": 2.0, "nightly": 0.5}
+
+
+if __name__ == "__main__":
+    test_small_flow_not_stuck_behind_backlog()
+    test_weight_sets_share()
+    test_cancelled_waiters_do_not_leak_slots()
+    test_cancelled_waiters_leave_backlog_at_once()
+    test_parse_weights()
+    print("✅ ALL FAIR SCHEDULER TESTS PASSED")
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+Fallback Chain Test
+====================
+
+Tests the per-item fallback chain: tiers recorded with the chain off and
+failures raised as before, a hung remote call handed to the local tier
+when its budget slice runs out, the placeholder tier as last resort, a
+failed call retried on another replica, a running speculative
+generation awaited as the remote call instead of duplicated, and tier
+counts in the generation metadata.
+
+Run with: python tests/test_fallback_chain.py
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import requests
+
+from core.orchestrator import ContentOrchestratorV2
+from clients.http_transport import ServiceTransport
+from clients.mock_text_client import MockTextClient
+from clients.mock_chart_client import MockChartClient
+from clients.mock_image_client import MockImageClient
+from clients.mock_diagram_client import MockDiagramClient
+from clients.replica_pool import ReplicaPool
+from models.director_models import GeneratedImage
+from services.api_dispatcher import APIDispatcher
+from services.fair_scheduler import FairScheduler
+from services.fallback_chain import FallbackChain
+from services.local_generators import PlaceholderImageClient
+from services.speculative_cache import SpeculativeCache
+from test_v2 import create_test_presentation
+
+
+class StubImageClient:
+    """Answers in 10ms, hangs, or fails."""
+
+    def __init__(self, mode="ok"):
+        self.mode = mode
+
+    async def generate(self, request):
+        if self.mode == "hang":
+            await asyncio.sleep(5.0)
+        elif self.mode == "fail":
+            raise RuntimeError("image service down")
+        await asyncio.sleep(0.01)
+        return GeneratedImage(url="http://cdn.test/a.png", caption="c", metadata={})
+
+
+class CountingImageClient(StubImageClient):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    async def generate(self, request):
+        self.calls += 1
+        return await super().generate(request)
+
+
+class FailingLocalClient:
+    async def generate(self, request):
+        raise ValueError("bad dimensions")
+
+
+class ReplicatedImageClient:
+    """Two replicas; the first call fails on whichever replica it gets."""
+
+    def __init__(self):
+        self.transport = ServiceTransport("image", threads=2)
+        self.replicas = ReplicaPool("image", ["http://a", "http://b"], health_interval=0)
+        self.used = []
+
+    async def generate(self, request):
+        return await self.transport.run(self._sync_generate)
+
+    def _sync_generate(self):
+        with self.replicas.call() as base_url:
+            self.used.append(base_url)
+            if len(self.used) == 1:
+                raise requests.ConnectionError("connection refused")
+            return GeneratedImage(url=f"{base_url}/a.png", caption="c", metadata={})
+
+
+def _dispatcher(client, chain, local_client=None, **kwargs):
+    return APIDispatcher(
+        None, None, client, None,
+        local_clients={"image": local_client or PlaceholderImageClient()},
+        coalesce=False,
+        micro_batchers={},
+        fallback_chain=chain,
+        **kwargs
+    )
+
+
+def _request():
+    return {"slide_id": "s0", "slide_number": 0, "dimensions": {"width": 800, "height": 600}}
+
+
+def test_disabled_records_tier_and_raises():
+    """Chain off: results carry their tier, failures surface as errors."""
+    ok = asyncio.run(_dispatcher(StubImageClient(), FallbackChain())._dispatch_single("image", _request()))
+    assert ok["result"].metadata["tier"] == "remote"
+
+    failed = asyncio.run(_dispatcher(StubImageClient("fail"), FallbackChain())._dispatch_single("image", _request()))
+    assert failed["success"] is False
+    assert "image service down" in failed["error"]
+
+
+def test_hung_remote_falls_back_within_budget():
+    """A hung call is cut at its slice and the local tier serves the item."""
+    scheduler = FairScheduler("image", capacity=1)
+    dispatcher = _dispatcher(
+        StubImageClient("hang"),
+        FallbackChain(budgets={"image": 0.3}, enabled=True),
+        fair_schedulers={"image": scheduler}
+    )
+
+    started = time.monotonic()
+    outcome = asyncio.run(dispatcher._dispatch_single("image", _request()))
+    elapsed = time.monotonic() - started
+
+    image = outcome["result"]
+    assert outcome["success"] is True
+    assert 0.25 <= elapsed < 1.0
+    assert image.metadata["tier"] == "local"
+    assert image.metadata["fallbacks"][0]["tier"] == "remote"
+    assert "budget slice" in image.metadata["fallbacks"][0]["error"]
+    assert scheduler.in_use == 0
+    assert dispatcher.get_metrics()["fallback_chain"]["served"] == {"image": {"local": 1}}
+
+
+def test_placeholder_is_last_resort():
+    """Remote and local both failing still yields a placeholder item."""
+    dispatcher = _dispatcher(StubImageClient("fail"), FallbackChain(enabled=True), local_client=FailingLocalClient())
+
+    image = asyncio.run(dispatcher._dispatch_single("image", _request()))["result"]
+
+    assert image.metadata["tier"] == "placeholder"
+    assert image.url == "https://via.placeholder.com/800x600"
+    assert [f["tier"] for f in image.metadata["fallbacks"]] == ["remote", "local"]
+
+
+def test_secondary_tier_uses_other_replica():
+    """A call failing on one replica is retried on the other one."""
+    client = ReplicatedImageClient()
+    dispatcher = _dispatcher(client, FallbackChain(enabled=True))
+
+    image = asyncio.run(dispatcher._dispatch_single("image", _request()))["result"]
+
+    assert image.metadata["tier"] == "secondary"
+    assert len(client.used) == 2 and client.used[0] != client.used[1]
+    assert image.url == f"{client.used[1]}/a.png"
+
+
+def test_running_speculation_is_not_duplicated():
+    """A speculative call still running past the cache slice is not called again."""
+    client = CountingImageClient()
+    cache = SpeculativeCache()
+    dispatcher = _dispatcher(
+        client,
+        FallbackChain(budgets={"image": 0.9}, enabled=True),
+        speculative_cache=cache
+    )
+
+    async def speculative_generate():
+        await asyncio.sleep(0.4)  # longer than a cache slice of the budget
+        return GeneratedImage(url="http://cdn.test/spec.png", caption="c", metadata={})
+
+    async def run():
+        cache.start("image", _request(), speculative_generate)
+        return await dispatcher._dispatch_single("image", _request())
+
+    image = asyncio.run(run())["result"]
+
+    assert client.calls == 0
+    assert image.url == "http://cdn.test/spec.png"
+    assert image.metadata["speculative"] is True
+    assert image.metadata["tier"] == "remote"
+    assert "fallbacks" not in image.metadata
+
+
+def test_generation_metadata_counts_tiers():
+    """Every generated item is counted under the tier that produced it."""
+    orchestrator = ContentOrchestratorV2(
+        text_client=MockTextClient(10),
+        chart_client=MockChartClient(10),
+        image_client=MockImageClient(10),
+        diagram_client=MockDiagramClient(10)
+    )
+
+    result = asyncio.run(orchestrator.enrich_presentation(create_test_presentation(6)))
+    metadata = result.generation_metadata
+
+    assert set(metadata["tiers"]) <= {"remote", "local"}
+    assert sum(metadata["tiers"].values()) == metadata["successful_items"]
+
+
+if __name__ == "__main__":
+    test_disabled_records_tier_and_raises()
+    test_hung_remote_falls_back_within_budget()
+    test_placeholder_is_last_resort()
+    test_secondary_tier_uses_other_replica()
+    test_running_speculation_is_not_duplicated()
+    test_generation_metadata_counts_tiers()
+    print("✅ ALL FALLBACK CHAIN TESTS PASSED")
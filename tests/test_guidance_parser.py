@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Guidance Parser Test
+=====================
+
+Tests the single-pass guidance tokenizer (commas, newlines, extra keys).
+
+Run with: python tests/test_guidance_parser.py
+"""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.guidance_parser import (
+    parse_guidance,
+    extract_goal,
+    extract_style,
+    has_valid_guidance
+)
+
+
+def test_standard_format():
+    """Classic Goal/Content/Style string."""
+    parsed = parse_guidance(
+        "Goal: Show revenue trend over time, Content: Q1-Q4 2024 revenue data, Style: Line chart"
+    )
+
+    assert parsed == {
+        "goal": "Show revenue trend over time",
+        "content": "Q1-Q4 2024 revenue data",
+        "style": "Line chart"
+    }
+
+
+def test_values_with_commas_and_newlines():
+    """Values keep their commas; newlines and semicolons separate keys."""
+    parsed = parse_guidance("Goal: Compare Q1, Q2 and Q3\nContent: revenue, costs; Style: bar, stacked")
+
+    assert parsed["goal"] == "Compare Q1, Q2 and Q3"
+    assert parsed["content"] == "revenue, costs"
+    assert parsed["style"] == "bar, stacked"
+
+
+def test_extra_keys_and_colons_in_values():
+    """Unknown keys are kept; colons inside values are not keys."""
+    parsed = parse_guidance("Goal: Ratio 16:9 hero, Data source: https://crm.example.com/x, style: photo")
+
+    assert parsed["goal"] == "Ratio 16:9 hero"
+    assert parsed["data_source"] == "https://crm.example.com/x"
+    assert parsed["style"] == "photo"
+
+
+def test_helpers_and_empty_input():
+    """Helpers agree with parse_guidance; empty input is handled."""
+    text = "Goal: Team photo, Style: Professional"
+
+    assert extract_goal(text) == "Team photo"
+    assert extract_style(text) == "Professional"
+    assert has_valid_guidance(text)
+    assert not has_valid_guidance("Just a sentence without keys")
+    assert parse_guidance(None) == {"goal": "", "content": "", "style": ""}
+
+
+def test_results_are_independent_copies():
+    """Mutating a result must not leak into the memo cache."""
+    text = "Goal: A, Content: B, Style: C"
+    parse_guidance(text)["goal"] = "mutated"
+
+    assert parse_guidance(text)["goal"] == "A"
+
+
+if __name__ == "__main__":
+    test_standard_format()
+    test_values_with_commas_and_newlines()
+    test_extra_keys_and_colons_in_values()
+    test_helpers_and_empty_input()
+    test_results_are_independent_copies()
+    print("✅ ALL GUIDANCE PARSER TESTS PASSED")
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Image Variant Reuse Test
+=========================
+
+Tests that RealImageClient derives new aspect ratios from a stored
+original instead of generating a new image when a crop endpoint is
+configured, and generates them without one - in parallel, not after
+the in-flight generation of another ratio. No network access needed -
+the service calls are replaced with stubs.
+
+Run with: python tests/test_image_variant_store.py
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from clients.real_image_client import RealImageClient
+from clients.image_variant_store import ImageVariantStore
+
+
+def _make_client(generate_seconds=0.0):
+    """Create a client whose HTTP calls are counted stubs."""
+    client = RealImageClient(base_url="http://image.test", variant_store=ImageVariantStore())
+    client.crop_path = "/crop"
+    calls = {"generate": 0, "crop": 0}
+
+    def fake_generate(request):
+        calls["generate"] += 1
+        time.sleep(generate_seconds)
+        return {
+            "success": True,
+            "image_id": "img_1",
+            "urls": {
+                "original": "http://cdn.test/original.png",
+                "cropped": f"http://cdn.test/{request['aspect_ratio']}.png",
+                "transparent": None
+            },
+            "metadata": {"model": "imagen-3", "target_aspect_ratio": request["aspect_ratio"]}
+        }
+
+    def fake_crop(entry, request):
+        calls["crop"] += 1
+        return {"urls": {"cropped": f"http://cdn.test/crop-{request['aspect_ratio']}.png"}}
+
+    client._sync_generate_image = fake_generate
+    client._sync_derive_variant = fake_crop
+    return client, calls
+
+
+def _request(aspect_ratio):
+    return {
+        "goal": "Modern office skyline",
+        "style": "photo",
+        "dimensions": {"aspect_ratio": aspect_ratio}
+    }
+
+
+def test_variant_reuse():
+    """Same prompt at a new aspect ratio is cropped, not regenerated."""
+    client, calls = _make_client()
+
+    async def run():
+        first = await client.generate(_request("16:9"))
+        again = await client.generate(_request("16:9"))
+        square = await client.generate(_request("1:1"))
+        return first, again, square
+
+    first, again, square = asyncio.run(run())
+
+    assert calls == {"generate": 1, "crop": 1}
+    assert again.url == first.url
+    assert again.metadata["variant_source"] == "stored"
+    assert square.url == "http://cdn.test/crop-1:1.png"
+    assert square.metadata["variant_source"] == "derived"
+
+
+def test_concurrent_same_prompt_waits_for_original():
+    """Concurrent requests for the same prompt share one generation."""
+    client, calls = _make_client()
+
+    async def run():
+        return await asyncio.gather(
+            client.generate(_request("16:9")),
+            client.generate(_request("2:7"))
+        )
+
+    wide, tall = asyncio.run(run())
+
+    assert calls == {"generate": 1, "crop": 1}
+    assert wide.metadata["all_urls"]["original"] == tall.metadata["all_urls"]["original"]
+
+
+def test_no_crop_path_generates_new_aspect_ratio():
+    """Without IMAGE_SERVICE_CROP_PATH a new aspect ratio is generated."""
+    client, calls = _make_client()
+    client.crop_path = ""
+
+    async def run():
+        first = await client.generate(_request("16:9"))
+        again = await client.generate(_request("16:9"))
+        square = await client.generate(_request("1:1"))
+        return first, again, square
+
+    first, again, square = asyncio.run(run())
+
+    assert calls == {"generate": 2, "crop": 0}
+    assert again.metadata["variant_source"] == "stored"
+    assert square.url == "http://cdn.test/1:1.png"
+
+
+def test_no_crop_path_generates_ratios_in_parallel():
+    """Without a crop endpoint another ratio does not wait for the first."""
+    client, calls = _make_client(generate_seconds=0.2)
+    client.crop_path = ""
+
+    async def run():
+        started = time.monotonic()
+        results = await asyncio.gather(
+            client.generate(_request("16:9")),
+            client.generate(_request("2:7")),
+            client.generate(_request("16:9"))
+        )
+        return results, time.monotonic() - started
+
+    (wide, tall, wide_again), elapsed = asyncio.run(run())
+
+    assert calls == {"generate": 2, "crop": 0}
+    assert elapsed < 0.35  # one generation time, not two
+    assert tall.url == "http://cdn.test/2:7.png"
+    assert wide_again.url == wide.url
+
+
+if __name__ == "__main__":
+    test_variant_reuse()
+    test_concurrent_same_prompt_waits_for_original()
+    test_no_crop_path_generates_new_aspect_ratio()
+    test_no_crop_path_generates_ratios_in_parallel()
+    print("✅ ALL IMAGE VARIANT TESTS PASSED")
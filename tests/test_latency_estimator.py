@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Latency Estimator Test
+=======================
+
+Tests the online latency model and ETAs: sketch quantiles within their
+relative accuracy, windows following latency drift, quantile fallback,
+per-call and deck ETAs, ETAs in progress events, and the live ETA of a
+draft upgrade in the enrichment store.
+
+Run with: python tests/test_latency_estimator.py
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.orchestrator import ContentOrchestratorV2
+from clients.mock_text_client import MockTextClient
+from clients.mock_chart_client import MockChartClient
+from clients.mock_image_client import MockImageClient
+from clients.mock_diagram_client import MockDiagramClient
+from services.deck_eta import DeckETA
+from services.latency_model import LatencyModel, QuantileSketch
+from test_v2 import create_test_presentation
+
+
+def test_sketch_quantiles_within_accuracy():
+    """p50/p99 of 1..1000 seconds are within 2% of the exact values."""
+    sketch = QuantileSketch(window=10000)
+    for seconds in range(1, 1001):
+        sketch.add(float(seconds))
+
+    assert abs(sketch.quantile(0.5) - 500) / 500 <= 0.021
+    assert abs(sketch.quantile(0.99) - 990) / 990 <= 0.021
+    assert sketch.count == 1000
+
+
+def test_sketch_window_follows_drift():
+    """Once a full window of faster calls arrives, older ones drop out."""
+    sketch = QuantileSketch(window=100)
+    for _ in range(200):
+        sketch.add(10.0)
+    for _ in range(100):
+        sketch.add(1.0)
+
+    assert abs(sketch.quantile(0.99) - 1.0) <= 0.021
+
+
+def test_quantile_needs_samples_and_falls_back():
+    """Quantiles come from the subtype, then the service, else None."""
+    model = LatencyModel()
+    request = {"chart_type": "line"}
+    assert model.quantile("chart", request, 0.99) is None
+
+    for i in range(30):
+        model.observe("chart", {"chart_type": "bar"}, 1.0 + i / 10)
+
+    assert model.quantile("chart", {"chart_type": "bar"}, 0.5) == model.quantile("chart", request, 0.5)
+    assert model.quantile("chart", request, 0.99, min_samples=50) is None
+    assert model.get_stats()["chart"]["bar"]["p99"] >= model.get_stats()["chart"]["bar"]["p50"]
+
+
+def test_deck_eta_per_call_and_deck():
+    """The deck ETA is the latest call's wait + latency + downstream chain."""
+    eta = DeckETA(LatencyModel())
+    now = eta.started_at
+
+    text = eta.start("text", {"slide_id": "s0", "expected_seconds": 4.0, "critical_path_seconds": 9.0})
+    chart = eta.start("chart", {"slide_id": "s1", "expected_seconds": 6.0}, queue_wait=2.0)
+    eta.start("image", {"slide_id": "s2", "route": "local"})
+
+    assert abs(eta.eta_seconds(now) - 9.0) < 0.1
+    assert [c["slide_id"] for c in eta.predictions(now)] == ["s2", "s0", "s1"]
+
+    eta.finish(text)
+    assert abs(eta.eta_seconds(now) - 8.0) < 0.1
+    # Past its prediction a call still counts a fraction of its latency
+    assert abs(eta.eta_seconds(now + 60) - 0.6) < 0.01
+
+    eta.finish(chart)
+    assert eta.calls_done == 2
+    assert eta.snapshot()["calls_in_flight"] == 1
+
+
+def test_progress_events_include_eta():
+    """Each finished call emits a progress event with the deck ETA."""
+    orchestrator = ContentOrchestratorV2(
+        text_client=MockTextClient(10),
+        chart_client=MockChartClient(10),
+        image_client=MockImageClient(10),
+        diagram_client=MockDiagramClient(10)
+    )
+    events = []
+
+    asyncio.run(orchestrator.enrich_presentation(
+        create_test_presentation(4),
+        progress_callback=lambda message, current, total: events.append((message, current, total))
+    ))
+
+    eta_events = [e for e in events if "ETA" in e[0]]
+    assert eta_events
+    assert eta_events[-1][1] == eta_events[-1][2]
+
+
+def test_draft_upgrade_exposes_live_eta():
+    """While a draft upgrades, its store entry carries a live ETA."""
+    orchestrator = ContentOrchestratorV2(
+        text_client=MockTextClient(300),
+        chart_client=MockChartClient(300),
+        image_client=MockImageClient(300),
+        diagram_client=MockDiagramClient(300)
+    )
+
+    async def run():
+        draft = await orchestrator.enrich_presentation(create_test_presentation(3), mode="draft")
+        enrichment_id = draft.generation_metadata["enrichment_id"]
+        await asyncio.sleep(0.05)
+
+        live = orchestrator.enrichment_store.get(enrichment_id)["eta"].snapshot()
+        await asyncio.gather(*orchestrator._background_tasks)
+        return live, orchestrator.enrichment_store.get(enrichment_id)
+
+    live, entry = asyncio.run(run())
+
+    assert live["calls_in_flight"] > 0
+    assert 0 < live["eta_seconds"] <= 60
+    assert entry["status"] == "complete"
+    assert entry["eta"] is None
+
+
+if __name__ == "__main__":
+    test_sketch_quantiles_within_accuracy()
+    test_sketch_window_follows_drift()
+    test_quantile_needs_samples_and_falls_back()
+    test_deck_eta_per_call_and_deck()
+    test_progress_events_include_eta()
+    test_draft_upgrade_exposes_live_eta()
+    print("✅ ALL LATENCY ESTIMATOR TESTS PASSED")
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+Local Generators Test
+======================
+
+Tests the deterministic local text tier, chart data taken from the
+guidance (years are not data points), and the per-layout policy.
+
+Run with: python tests/test_local_generators.py
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from services.local_generators import LocalChartClient, LocalTextClient, GenerationPolicy, trim_to_limit
+
+
+def test_trim_on_word_boundary():
+    """Trimming respects the limit and does not cut words."""
+    trimmed = trim_to_limit("Revenue grew strongly across every region", 20)
+
+    assert len(trimmed) <= 20
+    assert trimmed == "Revenue grew..."
+    assert trim_to_limit("short", 20) == "short"
+
+
+def test_subtitle_and_bullets():
+    """L01 gets a subtitle, L05 gets constraint-limited bullets."""
+    client = LocalTextClient()
+
+    subtitle = asyncio.run(client.generate({
+        "layout_id": "L01",
+        "narrative": "quarterly results for the board. ",
+        "topics": ["ignored"],
+        "constraints": {"max_characters": 120}
+    }))
+    bullets = asyncio.run(client.generate({
+        "layout_id": "L05",
+        "topics": ["first point", "second point is rather long", "third"],
+        "constraints": {"max_items": 2, "max_item_characters": 15}
+    }))
+
+    assert subtitle.content == "Quarterly results for the board"
+    assert subtitle.metadata["source"] == "local_text_generator"
+    assert bullets.content.split(". ") == ["First point", "Second point..."]
+
+
+def test_chart_data_points_need_a_separator_or_unit():
+    """Years after a plain space are labels; "=", ":", currency or units mark values."""
+    extract = LocalChartClient.extract_data_points
+
+    assert extract("Revenue for 2024: Q1=$25k, Q2: 3M; North $40, West 12%") == (
+        ["Q1", "Q2", "North", "West"], [25000, 3000000, 40, 12]
+    )
+    assert extract("Launch in 2025: 40%") == (["Launch in 2025"], [40])
+    assert extract("Revenue 2024, Launch in 2025") == (["Revenue 2024", "Launch in 2025"], [])
+
+    chart = asyncio.run(LocalChartClient().generate({"content": "Revenue 2024, Revenue 2025"}))
+    assert chart.data["datasets"][0]["data"] == []
+    assert chart.data["labels"] == ["Revenue 2024", "Revenue 2025"]
+
+
+def test_policy_routes_configured_layouts():
+    """Only configured layouts are routed to the local tier."""
+    policy = GenerationPolicy(local_text_layouts=["L01"])
+    all_requests = {
+        "text": [{"layout_id": "L01"}, {"layout_id": "L10"}],
+        "image": [{"layout_id": "L01"}]
+    }
+
+    assert policy.apply(all_requests) == 1
+    assert all_requests["text"][0]["route"] == "local"
+    assert "route" not in all_requests["text"][1]
+    assert "route" not in all_requests["image"][0]
+
+
+if __name__ == "__main__":
+    test_trim_on_word_boundary()
+    test_subtitle_and_bullets()
+    test_chart_data_points_need_a_separator_or_unit()
+    test_policy_routes_configured_layouts()
+    print("✅ ALL LOCAL GENERATOR TESTS PASSED")
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Micro Batcher Test
+===================
+
+Tests MicroBatcher: flush on size and on linger, per-item errors, and
+that text calls from concurrent decks share batch requests. Uses a stub
+batch call and mock clients.
+
+Run with: python tests/test_micro_batcher.py
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.orchestrator import ContentOrchestratorV2
+from clients.mock_text_client import MockTextClient
+from clients.mock_chart_client import MockChartClient
+from clients.mock_image_client import MockImageClient
+from clients.mock_diagram_client import MockDiagramClient
+from services.micro_batcher import MicroBatcher
+from test_v2 import create_test_presentation
+
+
+class StubBatchEndpoint:
+    """Records batch sizes; fails items whose request has "fail"."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def __call__(self, requests):
+        self.batches.append(len(requests))
+        await asyncio.sleep(0.001)
+        return [
+            ValueError(f"bad item {r['n']}") if r.get("fail") else r["n"] * 10
+            for r in requests
+        ]
+
+
+def test_flush_on_size_and_linger():
+    """10 requests with max 4 → batches of 4, 4, and 2 after the linger."""
+    endpoint = StubBatchEndpoint()
+    batcher = MicroBatcher("text", endpoint, max_batch_size=4, linger_ms=5)
+
+    async def run():
+        return await asyncio.gather(*[batcher.submit({"n": n}) for n in range(10)])
+
+    results = asyncio.run(run())
+
+    assert results == [n * 10 for n in range(10)]
+    assert endpoint.batches == [4, 4, 2]
+    stats = batcher.get_stats()
+    assert stats["size_flushes"] == 2 and stats["linger_flushes"] == 1
+
+
+def test_item_errors_stay_with_their_caller():
+    """A failed item fails only its own caller."""
+    endpoint = StubBatchEndpoint()
+    batcher = MicroBatcher("text", endpoint, max_batch_size=8, linger_ms=1)
+
+    async def run():
+        return await asyncio.gather(
+            *[batcher.submit({"n": n, "fail": n == 1}) for n in range(3)],
+            return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+
+    assert results[0] == 0 and results[2] == 20
+    assert isinstance(results[1], ValueError)
+    assert endpoint.batches == [3]
+
+
+def test_cancelled_caller_does_not_cancel_batch():
+    """Cancelling one caller leaves the rest of its batch intact."""
+    endpoint = StubBatchEndpoint()
+    batcher = MicroBatcher("text", endpoint, max_batch_size=8, linger_ms=5)
+
+    async def run():
+        tasks = [asyncio.create_task(batcher.submit({"n": n})) for n in range(3)]
+        await asyncio.sleep(0)
+        tasks[0].cancel()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert results[1:] == [10, 20]
+    assert endpoint.batches == [2]
+
+
+def test_concurrent_decks_share_batches():
+    """Text calls of three decks go out in fewer batch calls than texts."""
+    text_client = MockTextClient(10)
+    orchestrator = ContentOrchestratorV2(
+        text_client=text_client,
+        chart_client=MockChartClient(10),
+        image_client=MockImageClient(10),
+        diagram_client=MockDiagramClient(10)
+    )
+    decks = []
+    for deck in range(3):
+        strawman = create_test_presentation(5)
+        for slide in strawman.slides:
+            slide.narrative = f"Deck {deck}: {slide.narrative}"  # no cross-deck dedup
+        decks.append({"strawman": strawman})
+
+    results = asyncio.run(orchestrator.enrich_many(decks))
+
+    stats = orchestrator.get_metrics()["dispatcher"]["micro_batching"]["text"]
+    assert all(r.validation_report.total_slides == 5 for r in results)
+    assert stats["items"] == 15
+    assert stats["batches"] < stats["items"]
+
+
+if __name__ == "__main__":
+    test_flush_on_size_and_linger()
+    test_item_errors_stay_with_their_caller()
+    test_cancelled_caller_does_not_cancel_batch()
+    test_concurrent_decks_share_batches()
+    print("✅ ALL MICRO BATCHER TESTS PASSED")
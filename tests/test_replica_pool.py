@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Replica Pool Test
+==================
+
+Tests load balancing across service replicas: power of two choices
+favouring the fast, idle replica, outlier ejection after consecutive
+failures within the ejection budget, 4xx errors not counting against a
+replica, health probes reinstating replicas, and single-URL pass-through.
+
+Run with: python tests/test_replica_pool.py
+"""
+
+import random
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import requests
+
+from clients.replica_pool import ReplicaPool, replica_urls
+
+
+class StubResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class StubTransport:
+    """Health probes answer with the status configured per URL."""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+
+    def get(self, url, timeout=None):
+        status = self.statuses.get(url.rsplit("/health", 1)[0], 200)
+        if status is None:
+            raise requests.ConnectionError("refused")
+        return StubResponse(status)
+
+
+def _http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(response=response)
+
+
+def _fail(pool, error, url=None):
+    try:
+        with pool.call(url):
+            raise error
+    except type(error):
+        pass
+
+
+def test_single_url_passes_through():
+    """One configured URL: every call gets it, no probing."""
+    pool = ReplicaPool("text", ["http://a"], transport=StubTransport({}))
+    for _ in range(5):
+        with pool.call() as url:
+            assert url == "http://a"
+    assert pool._prober is None
+    assert replica_urls("text", "http://a/, http://b", "http://d") == ["http://a", "http://b"]
+
+
+def test_p2c_prefers_fast_idle_replica():
+    """The slow replica rarely wins; a loaded one loses to an idle one."""
+    pool = ReplicaPool("image", ["http://a", "http://b", "http://c"], rng=random.Random(7))
+    pool.replicas[0].latency = 0.1
+    pool.replicas[1].latency = 0.1
+    pool.replicas[2].latency = 5.0
+
+    chosen = [pool.choose(now=0.0).url for _ in range(300)]
+    assert chosen.count("http://c") == 0
+
+    pool.replicas[0].in_flight = 100
+    chosen = [pool.choose(now=0.0).url for _ in range(300)]
+    assert chosen.count("http://b") > chosen.count("http://a")
+
+
+def test_consecutive_failures_eject_within_budget():
+    """5 consecutive failures eject a replica; at most half are ejected."""
+    pool = ReplicaPool("chart", ["http://a", "http://b"], eject_failures=5, rng=random.Random(1))
+
+    for _ in range(4):
+        _fail(pool, requests.ConnectionError(), "http://a")
+    assert pool.get_stats()["replicas"][0]["ejected"] is False
+
+    _fail(pool, _http_error(503), "http://a")
+    assert pool.get_stats()["replicas"][0]["ejected"] is True
+    assert all(pool.choose().url == "http://b" for _ in range(20))
+
+    for _ in range(5):
+        _fail(pool, requests.Timeout(), "http://b")
+    stats = pool.get_stats()["replicas"]
+    assert stats[1]["ejected"] is False
+    assert stats[1]["failures"] == 5
+
+
+def test_client_errors_do_not_count():
+    """A 4xx is the request's fault and resets the failure streak."""
+    pool = ReplicaPool("diagram", ["http://a", "http://b"], eject_failures=2)
+
+    _fail(pool, requests.ConnectionError(), "http://a")
+    _fail(pool, _http_error(422), "http://a")
+    _fail(pool, requests.ConnectionError(), "http://a")
+
+    assert pool.get_stats()["replicas"][0]["ejected"] is False
+
+
+def test_health_probe_reinstates_and_excludes():
+    """A passing probe ends an ejection; a failing one excludes a replica."""
+    transport = StubTransport({"http://b": None})
+    pool = ReplicaPool(
+        "text", ["http://a", "http://b", "http://c"], transport=transport,
+        eject_failures=1, health_interval=0
+    )
+    _fail(pool, requests.ConnectionError(), "http://a")
+    assert pool.get_stats()["replicas"][0]["ejected"] is True
+
+    pool.probe_once()
+    stats = pool.get_stats()["replicas"]
+    assert stats[0]["ejected"] is False
+    assert stats[1]["healthy"] is False
+    assert all(pool.choose().url != "http://b" for _ in range(30))
+
+
+def test_pinned_calls_record_no_latency():
+    """Status polls pinned to a replica count as calls, not latency."""
+    pool = ReplicaPool("chart", ["http://a", "http://b"])
+    with pool.call("http://b") as url:
+        assert url == "http://b"
+
+    replica = pool.get_stats()["replicas"][1]
+    assert replica["calls"] == 1
+    assert replica["latency_ms"] is None
+    assert replica["in_flight"] == 0
+
+
+if __name__ == "__main__":
+    test_single_url_passes_through()
+    test_p2c_prefers_fast_idle_replica()
+    test_consecutive_failures_eject_within_budget()
+    test_client_errors_do_not_count()
+    test_health_probe_reinstates_and_excludes()
+    test_pinned_calls_record_no_latency()
+    print("✅ ALL REPLICA POOL TESTS PASSED")
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Request Coalescing Test
+========================
+
+Tests singleflight coalescing in APIDispatcher: concurrent identical
+requests share one client call and get private copies; sequential
+requests are not coalesced (it is not a cache); leader failures reach
+the waiters; a waiter retrying after a cancelled leader is counted once.
+Uses stub clients.
+
+Run with: python tests/test_request_coalescing.py
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.director_models import GeneratedImage
+from services.api_dispatcher import APIDispatcher
+
+
+class StubImageClient:
+    """Counts calls; optionally fails."""
+
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+
+    async def generate(self, request):
+        self.calls += 1
+        await asyncio.sleep(0.02)
+        if self.fail:
+            raise RuntimeError("image service down")
+        return GeneratedImage(url="http://cdn.test/a.png", caption="c", metadata={"n": self.calls})
+
+
+def _request(slide_id):
+    return {"slide_id": slide_id, "slide_number": 0, "fingerprint": "fp-image-1", "goal": "g"}
+
+
+def test_concurrent_duplicates_share_one_call():
+    """Three concurrent identical requests → one client call, three copies."""
+    client = StubImageClient()
+    dispatcher = APIDispatcher(None, None, client, None, coalesce=True)
+
+    async def run():
+        return await asyncio.gather(*[
+            dispatcher._dispatch_single("image", _request(f"s{i}")) for i in range(3)
+        ])
+
+    results = asyncio.run(run())
+    images = [r["result"] for r in results]
+
+    assert client.calls == 1
+    assert all(r["success"] for r in results)
+    assert len({id(image) for image in images}) == 3
+    assert sum(1 for image in images if image.metadata.get("coalesced")) == 2
+
+    metrics = dispatcher.get_metrics()["coalescing"]
+    assert metrics["leaders"] == 1 and metrics["coalesced"] == 2 and metrics["in_flight"] == 0
+
+
+def test_sequential_requests_are_not_coalesced():
+    """Coalescing only covers calls that overlap in time."""
+    client = StubImageClient()
+    dispatcher = APIDispatcher(None, None, client, None, coalesce=True)
+
+    async def run():
+        await dispatcher._dispatch_single("image", _request("s0"))
+        await dispatcher._dispatch_single("image", _request("s1"))
+
+    asyncio.run(run())
+    assert client.calls == 2
+
+
+def test_leader_failure_reaches_waiters():
+    """Waiters of a failed leader fail with the same error."""
+    client = StubImageClient(fail=True)
+    dispatcher = APIDispatcher(None, None, client, None, coalesce=True)
+
+    async def run():
+        return await asyncio.gather(*[
+            dispatcher._dispatch_single("image", _request(f"s{i}")) for i in range(2)
+        ])
+
+    results = asyncio.run(run())
+
+    assert client.calls == 1
+    assert [r["success"] for r in results] == [False, False]
+    assert all("image service down" in r["error"] for r in results)
+
+
+def test_cancelled_leader_counts_each_waiter_once():
+    """After the leader is cancelled one waiter leads, the other is coalesced once."""
+    client = StubImageClient()
+    dispatcher = APIDispatcher(None, None, client, None, coalesce=True)
+
+    async def run():
+        tasks = [
+            asyncio.create_task(dispatcher._call_coalesced("image", _request(f"s{i}")))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0.005)
+        tasks[0].cancel()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    cancelled, first, second = asyncio.run(run())
+
+    assert isinstance(cancelled, asyncio.CancelledError)
+    assert first.url == second.url
+    assert client.calls == 2
+    stats = dispatcher.coalesce_stats
+    assert stats["leaders"] == 2
+    assert stats["coalesced"] == 1
+
+
+def test_disabled():
+    """coalesce=False calls the client for every request."""
+    client = StubImageClient()
+    dispatcher = APIDispatcher(None, None, client, None, coalesce=False)
+
+    async def run():
+        return await asyncio.gather(*[
+            dispatcher._dispatch_single("image", _request(f"s{i}")) for i in range(3)
+        ])
+
+    asyncio.run(run())
+    assert client.calls == 3
+
+
+if __name__ == "__main__":
+    test_concurrent_duplicates_share_one_call()
+    test_sequential_requests_are_not_coalesced()
+    test_leader_failure_reaches_waiters()
+    test_cancelled_leader_counts_each_waiter_once()
+    test_disabled()
+    print("✅ ALL REQUEST COALESCING TESTS PASSED")
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Request Compiler Test
+======================
+
+Tests deck-level request compilation: shared contexts, fingerprints and
+layout-aware pruning. No network access needed.
+
+Run with: python tests/test_request_compiler.py
+"""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.orchestrator import ContentOrchestratorV2
+from models.agents import PresentationStrawman, Slide
+from services.request_builder import RequestBuilder
+from services.request_compiler import RequestCompiler
+
+
+def _slide(i, slide_type, **guidance):
+    return Slide(
+        slide_number=i,
+        slide_id=f"slide_{i:03d}",
+        title="Revenue",
+        slide_type=slide_type,
+        narrative="Revenue grew",
+        key_points=["Q3 revenue growth"],
+        **guidance
+    )
+
+
+def _deck():
+    chart = "Goal: Show trend, Content: Revenue, Style: Line chart"
+    image = "Goal: Skyline, Content: City, Style: Photo"
+    slides = [
+        _slide(0, "title_slide", visuals_needed=image),
+        _slide(1, "data_driven", analytics_needed=chart, visuals_needed=image),
+        _slide(2, "data_driven", analytics_needed=chart),
+    ]
+    strawman = PresentationStrawman(
+        main_title="Results",
+        overall_theme="Growth",
+        target_audience="Board",
+        design_suggestions="Modern",
+        presentation_duration=10,
+        slides=slides
+    )
+    layouts = ContentOrchestratorV2(None, None, None, None)._create_default_layout_assignments(strawman)
+    return strawman, layouts
+
+
+def test_pruning_and_fingerprints():
+    """Unused outputs are pruned; identical content shares a fingerprint."""
+    strawman, layouts = _deck()
+    compiler = RequestCompiler(RequestBuilder())
+    pruned = []
+
+    requests = list(compiler.compile(strawman, layouts, pruned=pruned))
+    kinds = [(req["slide_id"], api_type) for api_type, req in requests]
+
+    # L01 title slide reads text only; L17 ignores images
+    assert ("slide_000", "image") not in kinds
+    assert ("slide_001", "image") not in kinds
+    assert {(p["slide"], p["type"]) for p in pruned} == {("slide_000", "image"), ("slide_001", "image")}
+
+    charts = [req for api_type, req in requests if api_type == "chart"]
+    assert len(charts) == 2
+    assert charts[0]["fingerprint"] == charts[1]["fingerprint"]
+
+
+def test_shared_context_objects():
+    """All requests of a slide share one read-only context."""
+    strawman, layouts = _deck()
+    compiler = RequestCompiler(RequestBuilder())
+
+    slide_1 = [req for _, req in compiler.compile(strawman, layouts) if req["slide_id"] == "slide_001"]
+    assert len(slide_1) == 2
+    assert slide_1[0]["context"] is slide_1[1]["context"]
+
+    try:
+        slide_1[0]["context"]["theme"] = "changed"
+        raise AssertionError("context should be read-only")
+    except TypeError:
+        pass
+
+
+if __name__ == "__main__":
+    test_pruning_and_fingerprints()
+    test_shared_context_objects()
+    print("✅ ALL REQUEST COMPILER TESTS PASSED")
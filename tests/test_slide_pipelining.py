@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Per-slide Pipelining Test
+==========================
+
+Tests that slides are post-processed as soon as their last API call
+returns, while slower slides are still in flight. Uses mock clients.
+
+Run with: python tests/test_slide_pipelining.py
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.orchestrator import ContentOrchestratorV2
+from clients.mock_text_client import MockTextClient
+from clients.mock_chart_client import MockChartClient
+from clients.mock_image_client import MockImageClient
+from clients.mock_diagram_client import MockDiagramClient
+from test_v2 import create_test_presentation
+
+
+def _make_orchestrator(slow_slide_id, events):
+    """Orchestrator whose chart for slow_slide_id takes 200ms."""
+    orchestrator = ContentOrchestratorV2(
+        text_client=MockTextClient(10),
+        chart_client=MockChartClient(10),
+        image_client=MockImageClient(10),
+        diagram_client=MockDiagramClient(10)
+    )
+    # Every test slide has the same chart guidance - keep the charts
+    # independent so only slow_slide_id waits
+    orchestrator.api_dispatcher.coalesce = False
+    generate = orchestrator.api_dispatcher.chart_client.generate
+
+    async def slow_generate(request):
+        if request["slide_id"] == slow_slide_id:
+            await asyncio.sleep(0.2)
+            events.append(("slow chart done", request["slide_id"]))
+        return await generate(request)
+
+    orchestrator.api_dispatcher.chart_client.generate = slow_generate
+
+    post_process = orchestrator._post_process_slide
+
+    def recording_post_process(slide, layout_assignment, slide_results):
+        events.append(("post-processed", slide.slide_id))
+        return post_process(slide, layout_assignment, slide_results)
+
+    orchestrator._post_process_slide = recording_post_process
+    return orchestrator
+
+
+def test_fast_slides_post_processed_before_slow_slide_returns():
+    """Slides 1-3 are stitched while slide 0's chart is still running."""
+    events = []
+    orchestrator = _make_orchestrator("slide_000", events)
+
+    result = asyncio.run(orchestrator.enrich_presentation(create_test_presentation(4)))
+
+    slow_done = events.index(("slow chart done", "slide_000"))
+    early = {slide_id for kind, slide_id in events[:slow_done] if kind == "post-processed"}
+
+    assert early == {"slide_001", "slide_002", "slide_003"}
+    assert events[-1] == ("post-processed", "slide_000")
+    assert [s.slide_id for s in result.enriched_slides] == [
+        "slide_000", "slide_001", "slide_002", "slide_003"
+    ]
+    assert result.validation_report.total_slides == 4
+
+
+def test_each_slide_post_processed_once():
+    """No slide is mapped/validated twice."""
+    events = []
+    orchestrator = _make_orchestrator("slide_002", events)
+
+    asyncio.run(orchestrator.enrich_presentation(create_test_presentation(6)))
+
+    processed = [slide_id for kind, slide_id in events if kind == "post-processed"]
+    assert sorted(processed) == [f"slide_{i:03d}" for i in range(6)]
+
+
+if __name__ == "__main__":
+    test_fast_slides_post_processed_before_slow_slide_returns()
+    test_each_slide_post_processed_once()
+    print("✅ ALL SLIDE PIPELINING TESTS PASSED")
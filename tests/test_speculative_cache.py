@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Speculative Pre-generation Test
+================================
+
+Tests that enrichment attaches to chart/image/diagram generations started
+by speculate() before the layout was known. Uses mock clients.
+
+Run with: python tests/test_speculative_cache.py
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from core.orchestrator import ContentOrchestratorV2
+from clients.mock_text_client import MockTextClient
+from clients.mock_chart_client import MockChartClient
+from clients.mock_image_client import MockImageClient
+from clients.mock_diagram_client import MockDiagramClient
+from services.speculative_cache import SpeculativeCache
+from test_v2 import create_test_presentation
+
+
+def _make_orchestrator():
+    """Create an orchestrator whose chart client counts calls."""
+    orchestrator = ContentOrchestratorV2(
+        text_client=MockTextClient(10),
+        chart_client=MockChartClient(10),
+        image_client=MockImageClient(10),
+        diagram_client=MockDiagramClient(10)
+    )
+    calls = {"chart": 0}
+    generate = orchestrator.api_dispatcher.chart_client.generate
+
+    async def counting_generate(request):
+        calls["chart"] += 1
+        return await generate(request)
+
+    orchestrator.api_dispatcher.chart_client.generate = counting_generate
+    return orchestrator, calls
+
+
+def test_enrichment_attaches_to_speculation():
+    """Charts speculated before layout assignment are not generated again."""
+    async def run():
+        orchestrator, calls = _make_orchestrator()
+        strawman = create_test_presentation(6)
+
+        summary = await orchestrator.speculate(strawman)
+        result = await orchestrator.enrich_presentation(strawman)
+        return summary, result, calls
+
+    summary, result, calls = asyncio.run(run())
+
+    assert summary["started"] > 0
+    assert "text" not in summary["by_type"]
+    assert calls["chart"] == 1
+    assert result.generation_metadata["speculative_hits"] > 0
+
+
+def test_dimension_mismatch_is_not_attached():
+    """A speculation for other dimensions is ignored."""
+    async def run():
+        cache = SpeculativeCache()
+
+        async def generate():
+            return "speculated"
+
+        request = {"goal": "g", "content": "c", "style": "s", "dimensions": {"width": 1600, "height": 900}}
+        cache.start("image", request, generate)
+
+        other = dict(request, dimensions={"width": 800, "height": 800})
+        return cache.lookup("image", request), cache.lookup("image", other), cache
+
+    same, other, cache = asyncio.run(run())
+
+    assert same is not None
+    assert other is None
+    assert cache.stats["mismatched"] == 1
+
+
+def test_expired_speculation_is_dropped():
+    """Entries past their TTL are not attached."""
+    async def run():
+        cache = SpeculativeCache(ttl_seconds=0)
+
+        async def generate():
+            return "speculated"
+
+        request = {"goal": "g", "content": "c", "diagram_type": "flowchart", "style": ""}
+        cache.start("diagram", request, generate)
+        await asyncio.sleep(0.01)
+        return cache.lookup("diagram", request), cache
+
+    task, cache = asyncio.run(run())
+
+    assert task is None
+    assert cache.get_stats()["entries"] == 0
+
+
+if __name__ == "__main__":
+    test_enrichment_attaches_to_speculation()
+    test_dimension_mismatch_is_not_attached()
+    test_expired_speculation_is_dropped()
+    print("✅ ALL SPECULATIVE CACHE TESTS PASSED")
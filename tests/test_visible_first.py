@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Visible-First Priority Test
+============================
+
+Tests the visible_first priority mode: with one slot per service, slides
+complete in slide_number order, caller-supplied visible slides complete
+before the rest, every enrichment reports time to the first and Nth
+slide, and an unknown priority is rejected with 422.
+
+Run with: python tests/test_visible_first.py
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.testclient import TestClient
+
+from core.orchestrator import ContentOrchestratorV2
+from clients.mock_text_client import MockTextClient
+from clients.mock_chart_client import MockChartClient
+from clients.mock_image_client import MockImageClient
+from clients.mock_diagram_client import MockDiagramClient
+from services.admission_controller import AdmissionController
+from services.dag_scheduler import visible_first_priorities
+from services.fair_scheduler import FairScheduler
+from test_v2 import create_test_presentation
+
+
+def _orchestrator():
+    """Mock clients behind one slot per service, no coalescing/batching."""
+    orchestrator = ContentOrchestratorV2(
+        text_client=MockTextClient(20),
+        chart_client=MockChartClient(20),
+        image_client=MockImageClient(20),
+        diagram_client=MockDiagramClient(20)
+    )
+    dispatcher = orchestrator.api_dispatcher
+    # The test slides share identical guidance - every call must go out
+    dispatcher.coalesce = False
+    dispatcher.micro_batchers = {}
+    dispatcher.fair_schedulers = {
+        api_type: FairScheduler(api_type, capacity=1)
+        for api_type in ("text", "chart", "image", "diagram")
+    }
+    return orchestrator
+
+
+def _completion_order(result):
+    completed = result.generation_metadata["slide_timing"]["slide_completion_seconds"]
+    return sorted(completed, key=completed.get)
+
+
+def test_priorities_visible_then_deck_order():
+    """Visible slides rank first in the given order; unknown ids are ignored."""
+    priorities = visible_first_priorities(["s0", "s1", "s2", "s3"], ["s2", "x", "s2", "s1"])
+
+    assert sorted(priorities, key=priorities.get, reverse=True) == ["s2", "s1", "s0", "s3"]
+    assert visible_first_priorities(["s0", "s1"]) == {"s0": 2.0, "s1": 1.0}
+
+
+def test_slides_complete_in_slide_order():
+    """visible_first without visible ids completes slides in deck order."""
+    strawman = create_test_presentation(6)
+
+    result = asyncio.run(_orchestrator().enrich_presentation(strawman, priority="visible_first"))
+
+    timing = result.generation_metadata["slide_timing"]
+    assert timing["priority"] == "visible_first"
+    assert _completion_order(result) == [s.slide_id for s in strawman.slides]
+    assert timing["time_to_first_slide_seconds"] == timing["slide_completion_seconds"]["slide_000"]
+    assert timing["time_to_nth_slide_seconds"] == sorted(timing["time_to_nth_slide_seconds"])
+    assert len(timing["time_to_nth_slide_seconds"]) == 6
+
+
+def test_visible_slides_complete_first():
+    """Slides on screen finish before the rest, which follow in deck order."""
+    strawman = create_test_presentation(6)
+
+    result = asyncio.run(_orchestrator().enrich_presentation(
+        strawman, visible_slide_ids=["slide_004", "slide_002"]
+    ))
+
+    timing = result.generation_metadata["slide_timing"]
+    assert timing["priority"] == "visible_first"
+    assert _completion_order(result) == [
+        "slide_004", "slide_002", "slide_000", "slide_001", "slide_003", "slide_005"
+    ]
+    assert timing["time_to_first_slide_seconds"] == timing["slide_completion_seconds"]["slide_004"]
+    assert timing["time_to_visible_seconds"] == timing["slide_completion_seconds"]["slide_002"]
+    assert [s.slide_id for s in result.enriched_slides] == [s.slide_id for s in strawman.slides]
+
+
+def test_makespan_mode_reports_timing():
+    """The default mode reports slide timing too, without visible ids."""
+    result = asyncio.run(_orchestrator().enrich_presentation(create_test_presentation(3)))
+
+    timing = result.generation_metadata["slide_timing"]
+    assert timing["priority"] == "makespan"
+    assert len(timing["slide_completion_seconds"]) == 3
+    assert "time_to_visible_seconds" not in timing
+
+
+def test_unknown_priority_rejected():
+    """An unknown priority is a 422 validation error, not a 500."""
+    import main
+
+    main.orchestrator = _orchestrator()
+    main.admission = AdmissionController(lambda: {"queue_depth": 0, "queue_delay_seconds": 0.0})
+    try:
+        response = TestClient(main.app).post(
+            "/api/v2/enrich",
+            json={"strawman": create_test_presentation(2).model_dump(mode="json"), "priority": "fastest"}
+        )
+    finally:
+        main.orchestrator, main.admission = None, None
+
+    assert response.status_code == 422
+
+
+if __name__ == "__main__":
+    test_priorities_visible_then_deck_order()
+    test_slides_complete_in_slide_order()
+    test_visible_slides_complete_first()
+    test_makespan_mode_reports_timing()
+    test_unknown_priority_rejected()
+    print("✅ ALL VISIBLE-FIRST TESTS PASSED")
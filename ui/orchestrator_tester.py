@@ -13,6 +13,7 @@ from typing import Dict, Any
 
 from core.orchestrator import ContentOrchestratorV2
 from models.agents import PresentationStrawman, Slide
+from utils.guidance_parser import parse_guidance
 from ui.utils import (
     get_clients,
     record_metric,
@@ -205,6 +206,13 @@ def orchestrator_testing_page():
                         if slide.validation_status.violations:
                             st.warning(f"⚠️ {len(slide.validation_status.violations)} violations")
 
+                    # Parsed guidance (what the request builder saw)
+                    for field in ("analytics_needed", "visuals_needed", "diagrams_needed"):
+                        guidance = getattr(slide.original_slide, field, None)
+                        if guidance:
+                            st.markdown(f"**{field}** (parsed):")
+                            st.json(parse_guidance(guidance))
+
                     # Generated content
                     if slide.generated_content:
                         st.markdown("**Generated Content:**")
@@ -5,6 +5,6 @@ Content Orchestrator v2 - Utils Package
 Utility functions for Content Orchestrator v2.
 """
 
-from .guidance_parser import parse_guidance
+from .guidance_parser import parse_guidance, tokenize_guidance
 
-__all__ = ["parse_guidance"]
+__all__ = ["parse_guidance", "tokenize_guidance"]
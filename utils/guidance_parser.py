@@ -13,71 +13,159 @@ Parsed output:
     "content": "Q1-Q4 2024 revenue data",
     "style": "Line chart with growth indicators"
 }
+
+Tokenizer rules:
+- A key is a short word phrase followed by ':' at the start of the string
+  or right after a separator (',', ';' or newline)
+- A value runs until the separator before the next key, so values may
+  contain commas, newlines and colons ("Q1, Q2 and Q3", "ratio 16:9")
+- Keys other than Goal/Content/Style are kept as extra keys
+  ("Data source: CRM" → "data_source")
+
+Tokenization splits the string into segments at the separators (str.split,
+no per-character Python loop) and checks the first colon of each - a key
+can only end there. It is memoized in a bounded LRU cache, so the same
+guidance string is never parsed twice.
 """
 
 import logging
-import re
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Characters trimmed from both ends of a value
+_VALUE_STRIP = " \t\r\n,;"
 
-def parse_guidance(guidance_text: Optional[str]) -> Dict[str, str]:
+# Standard keys; other keys are kept as extras
+_KNOWN_KEYS = frozenset(("goal", "content", "style"))
+
+# Longest key accepted ("Data source" is a key, a sentence is not)
+_MAX_KEY_LENGTH = 32
+_MAX_KEY_WORDS = 3
+
+# Bounded memo cache size (distinct guidance strings)
+GUIDANCE_CACHE_SIZE = 4096
+
+_EMPTY_GUIDANCE = (("goal", ""), ("content", ""), ("style", ""))
+
+
+def _normalize_key(candidate: str) -> Optional[str]:
+    """Return the normalized key for a candidate, or None if not a key."""
+    key = candidate.strip()
+    if not key or len(key) > _MAX_KEY_LENGTH or not key[0].isalpha():
+        return None
+
+    # Letters, spaces, '_' and '-' only
+    if not key.replace(" ", "").replace("_", "").replace("-", "").isalpha():
+        return None
+
+    words = key.lower().split()
+    if words[-1] in _KNOWN_KEYS:
+        # "Chart goal: X" is still the goal
+        return words[-1]
+    if len(words) > _MAX_KEY_WORDS:
+        return None
+
+    return "_".join(words)
+
+
+@lru_cache(maxsize=GUIDANCE_CACHE_SIZE)
+def tokenize_guidance(guidance_text: str) -> Tuple[Tuple[str, str], ...]:
     """
-    Parse Director guidance string in Goal/Content/Style format.
+    Tokenize a guidance string into (key, value) pairs.
+
+    Only the first colon of each segment (text between separators) can
+    end a key. Text before the first key is ignored. A repeated key keeps its last value.
 
     Args:
-        guidance_text: String like "Goal: X, Content: Y, Style: Z"
+        guidance_text: Raw guidance string
 
     Returns:
-        Dictionary with 'goal', 'content', 'style' keys (empty strings if not found)
+        Tuple of (key, value) pairs (cached - treat as immutable)
     """
-    if not guidance_text:
-        return {"goal": "", "content": "", "style": ""}
+    # One separator character keeps every index valid in the original
+    text = guidance_text
+    if ";" in text or "\n" in text:
+        text = text.replace(";", ",").replace("\n", ",")
 
-    result = {
-        "goal": "",
-        "content": "",
-        "style": ""
-    }
+    pairs = []
+    key = None
+    value_start = 0
+    segment_start = 0
 
-    try:
-        # Pattern to match "Key: Value" pairs
-        # Handles cases like "Goal: text, Content: text, Style: text"
-        pattern = r'(Goal|Content|Style):\s*([^,]+?)(?=(?:,\s*(?:Goal|Content|Style):|$))'
+    for segment in text.split(","):
+        colon = segment.find(":")
+        # A colon starting "//" is part of a URL value, not a key
+        if colon != -1 and not segment.startswith("//", colon + 1):
+            candidate = segment[:colon]
+            lowered = candidate.strip().lower()
+            candidate = lowered if lowered in _KNOWN_KEYS else _normalize_key(candidate)
+
+            if candidate is not None:
+                if key is not None:
+                    pairs.append((key, guidance_text[value_start:segment_start].strip(_VALUE_STRIP)))
+                key = candidate
+                value_start = segment_start + colon + 1
 
-        matches = re.findall(pattern, guidance_text, re.IGNORECASE)
+        segment_start += len(segment) + 1
 
-        for key, value in matches:
-            key_lower = key.lower()
-            result[key_lower] = value.strip()
+    if key is not None:
+        pairs.append((key, guidance_text[value_start:].strip(_VALUE_STRIP)))
 
-        logger.debug(f"Parsed guidance: {result}")
+    return tuple(pairs)
 
+
+def parse_guidance(guidance_text: Optional[str]) -> Dict[str, str]:
+    """
+    Parse Director guidance string in Goal/Content/Style format.
+
+    Args:
+        guidance_text: String like "Goal: X, Content: Y, Style: Z"
+
+    Returns:
+        Dictionary with 'goal', 'content', 'style' keys (empty strings if
+        not found) plus any extra keys present in the guidance
+    """
+    result = dict(_EMPTY_GUIDANCE)
+
+    if not guidance_text:
+        return result
+
+    try:
+        result.update(tokenize_guidance(guidance_text))
     except Exception as e:
         logger.warning(f"Failed to parse guidance '{guidance_text}': {e}")
-        # Return empty dict on parse failure
-        return {"goal": "", "content": "", "style": ""}
+        return dict(_EMPTY_GUIDANCE)
 
     return result
 
 
+def _extract(guidance_text: Optional[str], key: str) -> str:
+    """Look up one key without building the full result dict."""
+    if not guidance_text:
+        return ""
+
+    value = ""
+    for token_key, token_value in tokenize_guidance(guidance_text):
+        if token_key == key:
+            value = token_value
+    return value
+
+
 def extract_goal(guidance_text: Optional[str]) -> str:
     """Extract just the Goal portion of guidance."""
-    parsed = parse_guidance(guidance_text)
-    return parsed.get("goal", "")
+    return _extract(guidance_text, "goal")
 
 
 def extract_content(guidance_text: Optional[str]) -> str:
     """Extract just the Content portion of guidance."""
-    parsed = parse_guidance(guidance_text)
-    return parsed.get("content", "")
+    return _extract(guidance_text, "content")
 
 
 def extract_style(guidance_text: Optional[str]) -> str:
     """Extract just the Style portion of guidance."""
-    parsed = parse_guidance(guidance_text)
-    return parsed.get("style", "")
+    return _extract(guidance_text, "style")
 
 
 def has_valid_guidance(guidance_text: Optional[str]) -> bool:
@@ -87,5 +175,4 @@ def has_valid_guidance(guidance_text: Optional[str]) -> bool:
     if not guidance_text:
         return False
 
-    parsed = parse_guidance(guidance_text)
-    return any(v.strip() for v in parsed.values())
+    return any(value.strip() for _, value in tokenize_guidance(guidance_text))